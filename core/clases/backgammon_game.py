@@ -1,20 +1,27 @@
 """Backgammon game logic module."""
 from core.clases.board import Board
+from core.clases.bot import BotExpectiminimax
 from core.clases.dice import Dice
+from core.clases.evaluador import EvaluadorHeuristico
+from core.clases.libro import LibroAperturas
 from core.clases.player import Player
+from core.clases.transposicion import TablaTransposicion, candidatas_ordenadas
 from core.clases.validaciones import MovimientoInvalidoError
 from core.clases.excepciones import (
     JuegoNoInicializadoError,
     TurnoJugadorInvalidoError,
     JuegoYaFinalizadoError,
+    SinMovimientosDisponiblesError,
     ValorDadoInvalidoError
 )
+from core.clases.excepciones import MovimientoInvalidoError as JugadaRechazadaError
 
 
-class BackgammonGame:  # pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
+class BackgammonGame:
     """Main Backgammon game controller class."""
 
-    def __init__(self, jugador1, jugador2, reglas=None):
+    def __init__(self, jugador1, jugador2, reglas=None, semilla=None):
         """
         Inicializa una nueva partida de Backgammon.
 
@@ -22,14 +29,20 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
             jugador1: primer jugador.
             jugador2: segundo jugador.
             reglas: lista opcional de funciones de validación.
+            semilla: semilla o generador para los dados (ver Dice).
         """
         self.__board__ = Board()
-        self.__dice__ = Dice()
+        self.__dice__ = Dice(semilla)
         self.__turno__ = 0
         self.__movimientos_restantes__ = 0
         self.__jugador1__ = Player(nombre=jugador1, ficha='X')
         self.__jugador2__ = Player(nombre=jugador2, ficha='O')
         self.__reglas__ = reglas if reglas else []
+        self.__bots__ = {}
+        self.__evaluador__ = EvaluadorHeuristico()
+        self.__tabla__ = None
+        self.__semilla__ = semilla if isinstance(semilla, int) else None
+        self.__historial__ = []
 
     def calcular_movimientos_totales(self, dado1, dado2):
         """
@@ -125,6 +138,7 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
         """Cambia el turno al otro jugador."""
         if self.__turno__ not in [1, 2]:
             raise JuegoNoInicializadoError()
+        self._turno_registrado()
         self.__turno__ = 2 if self.__turno__ == 1 else 1
         self.__movimientos_restantes__ = 0
         return self.get_jugador_actual()
@@ -133,6 +147,8 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
         """Lanza los dados y actualiza movimientos disponibles."""
         dado1, dado2 = self.__dice__.lanzar_dados()
         self.__movimientos_restantes__ = 4 if dado1 == dado2 else 2
+        if self.__turno__:
+            self._turno_registrado()[1:3] = [dado1, dado2]
         return dado1, dado2, self.__movimientos_restantes__
 
     def mover_ficha(self, movimientos, dado1, dado2):
@@ -175,6 +191,11 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
 
         resultado = self.__board__.mover_ficha(jugador, movimientos, dados_disponibles)
         self.__movimientos_restantes__ -= len(resultado["dados_usados"])
+        turno = self._turno_registrado()
+        turno[1:3] = [dado1, dado2]
+        turno[3].extend(
+            movimiento for movimiento, hecho in zip(movimientos, resultado["resultados"]) if hecho
+        )
         for linea in resultado["log"]:
             print(linea)
         if not any(resultado["resultados"]):
@@ -185,6 +206,187 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
 
         return resultado
 
+    def get_registro(self):
+        """
+        Devuelve la partida jugada hasta ahora para guardarla con
+        EscritorRegistros.
+
+        Returns:
+            dict: "jugadores" (nombres de X y de O), "semilla" (entero o
+            None), "empieza" (ficha del primer turno) y "turnos" (tuplas
+            (dado1, dado2, jugada) en orden, alternando los colores;
+            (0, 0, []) para un turno pasado sin tirar).
+        """
+        if self.__historial__:
+            empieza = self.__historial__[0][0]
+        else:
+            empieza = self.get_jugador_actual().get_ficha() if self.__turno__ else 'X'
+        return {
+            "jugadores": (self.__jugador1__.get_nombre(), self.__jugador2__.get_nombre()),
+            "semilla": self.__semilla__,
+            "empieza": empieza,
+            "turnos": [
+                (dado1, dado2, list(jugada)) for _, dado1, dado2, jugada in self.__historial__
+            ],
+        }
+
+    def _turno_registrado(self):
+        """
+        Devuelve la entrada [ficha, dado1, dado2, jugada] del turno actual en
+        el historial, creándola si el jugador todavía no tiró.
+        """
+        ficha = self.get_jugador_actual().get_ficha()
+        if not self.__historial__ or self.__historial__[-1][0] != ficha:
+            self.__historial__.append([ficha, 0, 0, []])
+        return self.__historial__[-1]
+
+    def set_bot(self, numero_jugador, bot):
+        """
+        Asigna un jugador automático a uno de los lugares de la partida.
+
+        Args:
+            numero_jugador: 1 o 2.
+            bot: objeto con elegir_jugada(board, jugador, dado1, dado2), por
+                ejemplo BotExpectiminimax; None vuelve a dejarlo humano.
+        """
+        if bot is None:
+            self.__bots__.pop(numero_jugador, None)
+        else:
+            self.__bots__[numero_jugador] = bot
+
+    def agregar_computadora(self, numero_jugador, profundidad=2, con_libro=False):
+        """
+        Pone a BotExpectiminimax en uno de los lugares de la partida, con su
+        propia tabla de transposición.
+
+        Args:
+            numero_jugador: 1 o 2.
+            profundidad: jugadas que mira hacia adelante.
+            con_libro: si consulta el libro de aperturas incluido.
+
+        Returns:
+            BotExpectiminimax: el bot asignado.
+        """
+        bot = BotExpectiminimax(
+            profundidad=profundidad, libro=LibroAperturas() if con_libro else None
+        )
+        bot.set_tabla(TablaTransposicion())
+        self.set_bot(numero_jugador, bot)
+        return bot
+
+    def es_turno_bot(self):
+        """
+        Indica si el jugador que tiene el turno es un bot.
+
+        Returns:
+            bool: True si el turno actual corresponde a un bot.
+        """
+        return self.__turno__ in self.__bots__
+
+    def jugar_turno_bot(self, dado1, dado2):
+        """
+        Hace jugar al bot del turno actual con la tirada indicada.
+
+        Si la jugada usa menos dados que los disponibles (o no hay ningún
+        movimiento posible) el turno se pasa igual.
+
+        Args:
+            dado1: valor del primer dado.
+            dado2: valor del segundo dado.
+
+        Returns:
+            list: jugada realizada como tuplas (desde, hasta).
+
+        Raises:
+            TurnoJugadorInvalidoError: si el jugador actual no es un bot.
+            SinMovimientosDisponiblesError: si todavía no se tiraron los
+                dados del turno.
+            MovimientoInvalidoError: (de core.clases.excepciones) si la
+                partida rechazó algún movimiento de la jugada; el turno no
+                se pasa.
+        """
+        jugador = self.get_jugador_actual()
+        if not self.es_turno_bot():
+            raise TurnoJugadorInvalidoError(jugador.get_nombre())
+        if self.__movimientos_restantes__ <= 0:
+            raise SinMovimientosDisponiblesError(jugador.get_nombre())
+        bot = self.__bots__[self.__turno__]
+        jugada = bot.elegir_jugada(self.__board__, jugador, dado1, dado2)
+        if jugada:
+            resultado = self.mover_ficha(jugada, dado1, dado2)
+            if not all(resultado["resultados"]):
+                raise JugadaRechazadaError(f"Jugada rechazada: {jugada}.")
+        if self.get_jugador_actual() is jugador:
+            self.cambiar_turno()
+        return jugada
+
+    def set_evaluador(self, evaluador):
+        """
+        Asigna el evaluador usado por sugerir_jugadas.
+
+        Args:
+            evaluador: objeto con evaluar(posiciones, turno), por ejemplo
+                EvaluadorHeuristico o EvaluadorRed. Si hay una tabla de
+                transposición se vacía, porque sus valores eran del anterior.
+        """
+        self.__evaluador__ = evaluador
+        if self.__tabla__ is not None:
+            self.__tabla__.limpiar()
+
+    def set_tabla(self, tabla):
+        """
+        Asigna una tabla de transposición para sugerir_jugadas.
+
+        Args:
+            tabla: TablaTransposicion, o None para no usarla.
+        """
+        self.__tabla__ = tabla
+
+    def activar_tabla(self, memoria_maxima=64 * 1024 * 1024):
+        """
+        Crea una tabla de transposición propia para sugerir_jugadas.
+
+        Args:
+            memoria_maxima: bytes que pueden ocupar sus entradas.
+        """
+        self.set_tabla(TablaTransposicion(memoria_maxima))
+
+    def sugerir_jugadas(self, dado1, dado2, n=5):
+        """
+        Ordena las jugadas legales del jugador actual para una tirada.
+
+        Cada posición resultante distinta se considera una sola vez y todas
+        se evalúan en un único lote con el evaluador configurado; con una
+        tabla de transposición las tiradas repetidas no se recalculan.
+
+        Args:
+            dado1: valor del primer dado.
+            dado2: valor del segundo dado.
+            n: cantidad máxima de jugadas a devolver.
+
+        Returns:
+            list: diccionarios con "jugada" (tuplas (desde, hasta)),
+            "equidad" para el jugador actual y "diferencia" con la mejor
+            (0 para la primera, negativa para las demás), de mejor a peor.
+            Vacía si no hay ningún movimiento posible.
+
+        Raises:
+            ValorDadoInvalidoError: si algún dado está fuera de rango.
+            JuegoNoInicializadoError: si el turno aún no fue asignado.
+        """
+        self.calcular_movimientos_totales(dado1, dado2)
+        signo = 1 if self.get_jugador_actual().get_ficha() == 'X' else -1
+        candidatas, _ = candidatas_ordenadas(
+            self.__board__, (signo, dado1, dado2), self.__evaluador__, self.__tabla__
+        )
+        if not candidatas[0][1] or n <= 0:
+            return []
+        mejor = candidatas[0][0]
+        return [
+            {"jugada": jugada, "equidad": valor, "diferencia": valor - mejor}
+            for valor, jugada in candidatas[:n]
+        ]
+
     def hay_ganador(self):
         """
         Verifica si algún jugador ha ganado la partida.
@@ -192,7 +394,7 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
         Returns:
             bool: True si hay ganador, False en caso contrario.
         """
-        fuera = self.__board__.get_tablero()["fuera"]
+        fuera = self.__board__.get_vista()["fuera"]
         for jugador in [self.__jugador1__, self.__jugador2__]:
             if fuera['player1' if jugador == self.__jugador1__ else 'player2'] == 15:
                 print(f"{jugador.get_nombre()} ha ganado la partida")
@@ -244,6 +446,18 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
         """
         return player.fichas_sacadas(self.__board__)
 
+    def get_pips(self, player):
+        """
+        Devuelve la cuenta de pips del jugador.
+
+        Args:
+            player: instancia del jugador.
+
+        Returns:
+            int: pips que le faltan al jugador para sacar todas sus fichas.
+        """
+        return player.pips(self.__board__)
+
     def estado_turno(self):
         """
         Muestra por consola el estado actual del turno.
@@ -288,7 +502,7 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
         Muestra el tablero en consola (delegación al board).
 
         Returns:
-            dict: estado del tablero
+            VistaTablero: estado del tablero de solo lectura
         """
         return self.__board__.mostrar_board()
 
@@ -323,13 +537,15 @@ class BackgammonGame:  # pylint: disable=too-many-public-methods
                 "ficha": self.__jugador1__.get_ficha(),
                 "fichas_tablero": self.get_fichas_en_tablero(self.__jugador1__),
                 "fichas_bar": self.get_fichas_en_bar(self.__jugador1__),
-                "fichas_sacadas": self.get_fichas_sacadas(self.__jugador1__)
+                "fichas_sacadas": self.get_fichas_sacadas(self.__jugador1__),
+                "pips": self.get_pips(self.__jugador1__)
             },
             "jugador2": {
                 "nombre": self.__jugador2__.get_nombre(),
                 "ficha": self.__jugador2__.get_ficha(),
                 "fichas_tablero": self.get_fichas_en_tablero(self.__jugador2__),
                 "fichas_bar": self.get_fichas_en_bar(self.__jugador2__),
-                "fichas_sacadas": self.get_fichas_sacadas(self.__jugador2__)
+                "fichas_sacadas": self.get_fichas_sacadas(self.__jugador2__),
+                "pips": self.get_pips(self.__jugador2__)
             }
         }
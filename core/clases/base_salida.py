@@ -0,0 +1,436 @@
+"""
+Módulo que define las bases de datos de salida de fichas (bear-off).
+
+La base de un lado guarda, para cada posición de hasta 15 fichas repartidas
+en los puntos de la casa desde los que se puede sacar, la distribución de
+probabilidad de la cantidad de tiradas que faltan para sacarlas todas jugando
+para minimizar la cantidad esperada de tiradas. La base de dos lados guarda,
+para cada par de posiciones de hasta N fichas, la probabilidad exacta de
+ganar del jugador que tiene el turno.
+
+Con la geometría de Board una ficha sale con un dado igual a su distancia
+(X en el punto p con 23 - p, O con p) y el punto 23 de X (0 de O) no tiene
+salida, así que la casa útil son las distancias 1 a 5. Las posiciones se
+indexan con el rango combinatorio de sus conteos, sin diccionarios, y el
+archivo se abre con numpy.memmap.
+"""
+import struct
+from math import comb
+import numpy as np
+from core.clases.board import Board
+from core.clases.bot import TIRADAS
+from core.clases.player import Player
+from core.clases.excepciones import FormatoArchivoInvalidoError, PuntoInvalidoError
+
+PUNTOS_CASA = 5
+MAXTIRADAS = 128
+_MAGICO = b"BGS1"
+_MAGICO_BILATERAL = b"BGS2"
+_CABECERA = struct.Struct("<4sHHHI2x")
+_ESCALA = 65535
+_JUGADOR_X = Player("player1", "X")
+
+
+def rango(casa):
+    """
+    Devuelve el índice combinatorio de una posición de la casa.
+
+    Las posiciones se ordenan por cantidad total de fichas, así que las de
+    hasta n fichas ocupan los índices 0 a comb(n + 5, 5) - 1 sin importar
+    el máximo de la base.
+
+    Args:
+        casa: conteos de fichas a distancia 1, 2, 3, 4 y 5 de salir.
+
+    Returns:
+        int: índice de la posición.
+    """
+    indice, acumulado = 0, 0
+    for j, cantidad in enumerate(casa):
+        acumulado += cantidad
+        indice += comb(acumulado + j, j + 1)
+    return indice
+
+
+def cantidad_posiciones(max_fichas):
+    """Devuelve cuántas posiciones tiene una base de hasta max_fichas fichas."""
+    return comb(max_fichas + PUNTOS_CASA, PUNTOS_CASA)
+
+
+def casa_de(conteos, signo):
+    """
+    Extrae la posición de la casa de un jugador del arreglo compacto.
+
+    Args:
+        conteos: secuencia de 28 conteos con el formato de Board.get_conteos.
+        signo: 1 para X, -1 para O.
+
+    Returns:
+        tuple: conteos a distancia 1 a 5, o None si el jugador tiene fichas
+        fuera de esos puntos (en el bar, lejos de la casa o en el punto sin
+        salida).
+    """
+    if signo > 0:
+        casa = tuple(max(conteos[23 - d], 0) for d in range(1, PUNTOS_CASA + 1))
+        en_juego = conteos[24] + sum(c for c in conteos[:24] if c > 0)
+    else:
+        casa = tuple(max(-conteos[d], 0) for d in range(1, PUNTOS_CASA + 1))
+        en_juego = conteos[25] + sum(-c for c in conteos[:24] if c < 0)
+    return casa if sum(casa) == en_juego else None
+
+
+def generar_base_unilateral(ruta, max_fichas=15):
+    """
+    Calcula la base completa y la guarda en un archivo binario.
+
+    Las posiciones se resuelven por orden de pips, ya que cada jugada los
+    reduce. Las tiradas sin movimiento posible dejan la posición igual, lo
+    que se resuelve en la recurrencia de la distribución.
+
+    Args:
+        ruta: archivo de salida.
+        max_fichas: máximo de fichas por posición (1 a 15).
+
+    Returns:
+        numpy.ndarray: distribuciones (posiciones, MAXTIRADAS) en float64.
+    """
+    transiciones = _transiciones(max_fichas)
+    total = len(transiciones)
+    distribuciones = np.zeros((total, MAXTIRADAS))
+    esperadas = np.full(total, np.inf)
+    distribuciones[0, 0], esperadas[0] = 1.0, 0.0
+    for casa in sorted(_enumerar_casas(max_fichas), key=_pips)[1:]:
+        indice = rango(casa)
+        quieto, siguiente, esperada = _mejores_sucesores(
+            transiciones[indice], distribuciones, esperadas
+        )
+        fila = distribuciones[indice]
+        for n in range(1, MAXTIRADAS):
+            fila[n] = quieto * fila[n - 1] + siguiente[n]
+        esperadas[indice] = esperada / (1 - quieto)
+
+    with open(ruta, "wb") as archivo:
+        archivo.write(_CABECERA.pack(_MAGICO, 1, max_fichas, MAXTIRADAS, total))
+        np.rint(distribuciones * _ESCALA).astype("<u2").tofile(archivo)
+    return distribuciones
+
+
+class BaseSalidaUnilateral:
+    """Base de salida de un lado abierta con numpy.memmap."""
+
+    def __init__(self, ruta):
+        """
+        Abre la base sin leerla entera: cada consulta lee solo su fila.
+
+        Args:
+            ruta: archivo generado con generar_base_unilateral.
+
+        Raises:
+            FormatoArchivoInvalidoError: si el archivo no tiene el formato
+                esperado.
+        """
+        with open(ruta, "rb") as archivo:
+            cabecera = archivo.read(_CABECERA.size)
+        if len(cabecera) != _CABECERA.size or cabecera[:4] != _MAGICO:
+            raise FormatoArchivoInvalidoError(f"{ruta} no es una base de salida.")
+        _, _, self.__max_fichas__, columnas, total = _CABECERA.unpack(cabecera)
+        self.__datos__ = np.memmap(
+            ruta, dtype="<u2", mode="r", offset=_CABECERA.size,
+            shape=(total, columnas)
+        )
+
+    def get_max_fichas(self):
+        """Devuelve el máximo de fichas por posición de la base."""
+        return self.__max_fichas__
+
+    def cubre(self, conteos, signo):
+        """
+        Indica si la posición del jugador está en la base.
+
+        Args:
+            conteos: secuencia de 28 conteos con el formato de Board.get_conteos.
+            signo: 1 para X, -1 para O.
+
+        Returns:
+            bool: True si todas sus fichas en juego están en la casa útil.
+        """
+        casa = casa_de(conteos, signo)
+        return casa is not None and sum(casa) <= self.__max_fichas__
+
+    def distribucion(self, conteos, signo):
+        """
+        Devuelve la probabilidad de terminar en exactamente n tiradas.
+
+        Args:
+            conteos: secuencia de 28 conteos con el formato de Board.get_conteos.
+            signo: 1 para X, -1 para O.
+
+        Returns:
+            numpy.ndarray: arreglo (MAXTIRADAS,) indexado por n.
+
+        Raises:
+            PuntoInvalidoError: si la posición no está cubierta por la base.
+        """
+        if not self.cubre(conteos, signo):
+            raise PuntoInvalidoError("La posición no está en la base de salida.")
+        return self.__datos__[rango(casa_de(conteos, signo))] / _ESCALA
+
+    def tiradas_esperadas(self, conteos, signo):
+        """
+        Devuelve la cantidad esperada de tiradas para sacar todas las fichas.
+
+        Returns:
+            float: esperanza según la distribución guardada.
+        """
+        distribucion = self.distribucion(conteos, signo)
+        return float(np.arange(len(distribucion)) @ distribucion)
+
+
+def generar_base_bilateral(ruta, max_fichas=6):
+    """
+    Calcula la base de dos lados y la guarda en un archivo binario.
+
+    V[a, b] es la probabilidad de ganar del jugador que tiene el turno con la
+    casa a contra un rival con la casa b, jugando ambos para maximizarla. Se
+    resuelve por orden de pips totales, vectorizado sobre todos los pares de
+    cada nivel: cada jugada reduce los pips, salvo las tiradas sin
+    movimiento, que pasan el turno sin cambiar la posición. Eso acopla V[a, b]
+    con V[b, a] en un sistema de 2x2 que se resuelve en forma cerrada.
+
+    Args:
+        ruta: archivo de salida.
+        max_fichas: máximo de fichas por lado.
+
+    Returns:
+        numpy.ndarray: matriz (M, M) de probabilidades en float64.
+    """
+    sucesores, mueve = _tabla_sucesores(_transiciones(max_fichas))
+    total = len(mueve)
+    pesos = np.array([peso for _, _, peso in TIRADAS]) / 36
+    quieto = (~mueve) @ pesos
+    # Columnas extra: relleno (1 - V = -1, nunca se elige) y ficha sin
+    # salida (1 - V = 0). La columna 0 es un rival que ya terminó.
+    valores = np.zeros((total, total + 2))
+    valores[:, total], valores[:, total + 1] = 2.0, 1.0
+    pips = np.array([_pips(casa) for casa in _casas_por_rango(max_fichas)])
+    suma = pips[:, None] + pips[None, :]
+    suma[0, :] = suma[:, 0] = -1
+    parciales = np.zeros((total, total))
+    for nivel in range(1, 2 * PUNTOS_CASA * max_fichas + 1):
+        _resolver_nivel(
+            np.nonzero(suma == nivel), (valores, parciales),
+            (sucesores, mueve, quieto, pesos)
+        )
+
+    valores = valores[:, :total]
+    with open(ruta, "wb") as archivo:
+        archivo.write(
+            _CABECERA.pack(_MAGICO_BILATERAL, 1, max_fichas, total, total)
+        )
+        np.rint(valores * _ESCALA).astype("<u2").tofile(archivo)
+    return valores
+
+
+class BaseSalidaBilateral:
+    """Base de salida de dos lados abierta con numpy.memmap."""
+
+    def __init__(self, ruta):
+        """
+        Abre la base sin leerla entera.
+
+        Args:
+            ruta: archivo generado con generar_base_bilateral.
+
+        Raises:
+            FormatoArchivoInvalidoError: si el archivo no tiene el formato
+                esperado.
+        """
+        with open(ruta, "rb") as archivo:
+            cabecera = archivo.read(_CABECERA.size)
+        if len(cabecera) != _CABECERA.size or cabecera[:4] != _MAGICO_BILATERAL:
+            raise FormatoArchivoInvalidoError(f"{ruta} no es una base de salida de dos lados.")
+        _, _, self.__max_fichas__, _, total = _CABECERA.unpack(cabecera)
+        self.__datos__ = np.memmap(
+            ruta, dtype="<u2", mode="r", offset=_CABECERA.size,
+            shape=(total, total)
+        )
+
+    def get_max_fichas(self):
+        """Devuelve el máximo de fichas por lado de la base."""
+        return self.__max_fichas__
+
+    def cubre(self, conteos):
+        """
+        Indica si la posición está en la base.
+
+        Args:
+            conteos: secuencia de 28 conteos con el formato de Board.get_conteos.
+
+        Returns:
+            bool: True si los dos jugadores tienen todas sus fichas en juego
+            en la casa útil, como mucho max_fichas, y ya sacaron alguna (así
+            no hay gammons posibles y la probabilidad de ganar es exacta).
+        """
+        for signo in (1, -1):
+            casa = casa_de(conteos, signo)
+            if casa is None or not 0 < sum(casa) <= self.__max_fichas__:
+                return False
+        return conteos[26] > 0 and conteos[27] > 0
+
+    def probabilidad_ganar(self, conteos, signo):
+        """
+        Devuelve la probabilidad de ganar del jugador que tiene el turno.
+
+        Args:
+            conteos: secuencia de 28 conteos con el formato de Board.get_conteos.
+            signo: 1 si el turno es de X, -1 si es de O.
+
+        Returns:
+            float: probabilidad exacta (con la precisión de 16 bits del archivo).
+
+        Raises:
+            PuntoInvalidoError: si la posición no está cubierta por la base.
+        """
+        if not self.cubre(conteos):
+            raise PuntoInvalidoError("La posición no está en la base de salida.")
+        fila = rango(casa_de(conteos, signo))
+        columna = rango(casa_de(conteos, -signo))
+        return float(self.__datos__[fila, columna]) / _ESCALA
+
+
+def _transiciones(max_fichas):
+    """
+    Calcula las jugadas de cada posición de un lado para las 21 tiradas.
+
+    Las jugadas se generan con Board.jugadas_y_posiciones, así que respetan
+    las reglas del tablero.
+
+    Returns:
+        list: por índice de posición, 21 listas con los índices de las
+        posiciones resultantes (None si una ficha quedó sin salida). Una
+        lista vacía significa que con esa tirada no se puede mover.
+    """
+    board = Board()
+    tabla = [None] * cantidad_posiciones(max_fichas)
+    for casa in _enumerar_casas(max_fichas):
+        board.set_conteos(_conteos_de(casa))
+        tabla[rango(casa)] = [
+            [
+                _rango_o_muerta(posicion) for _, posicion in
+                board.jugadas_y_posiciones(_JUGADOR_X, dado1, dado2)
+            ]
+            for dado1, dado2, _ in TIRADAS
+        ]
+    return tabla
+
+
+def _mejores_sucesores(sucesores_por_tirada, distribuciones, esperadas):
+    """
+    Elige para cada tirada la jugada con menos tiradas esperadas.
+
+    Returns:
+        tuple: (probabilidad de no poder mover, distribución desplazada una
+        tirada de los sucesores, 1 + esperanza ponderada de los sucesores).
+    """
+    quieto, siguiente, esperada = 0.0, np.zeros(MAXTIRADAS), 1.0
+    for (_, _, peso), sucesores in zip(TIRADAS, sucesores_por_tirada):
+        if not sucesores:
+            quieto += peso / 36
+            continue
+        mejor = min(
+            sucesores,
+            key=lambda i: (np.inf, 0) if i is None else (esperadas[i], i)
+        )
+        if mejor is None:
+            esperada = np.inf
+        else:
+            siguiente[1:] += peso / 36 * distribuciones[mejor, :-1]
+            esperada += peso / 36 * esperadas[mejor]
+    return quieto, siguiente, esperada
+
+
+def _resolver_nivel(pares, matrices, tablas):
+    """
+    Resuelve todos los pares (propio, rival) con la misma suma de pips.
+
+    Args:
+        pares: arreglos (propio, rival) con los índices de cada par.
+        matrices: (valores, parciales); se completan en el lugar.
+        tablas: (sucesores, mueve, quieto, pesos) de _tabla_sucesores.
+    """
+    propio, rival = pares
+    valores, parciales = matrices
+    sucesores, mueve, quieto, pesos = tablas
+    opciones = 1 - valores[rival[:, None, None], sucesores[propio]]
+    parciales[propio, rival] = np.where(
+        mueve[propio], opciones.max(axis=2), 0.0
+    ) @ pesos
+    # Sin movimiento el turno pasa con la misma posición: V[a, b] depende de
+    # V[b, a] y viceversa, con q la probabilidad de no poder mover.
+    q_propio, q_rival = quieto[propio], quieto[rival]
+    valores[propio, rival] = (
+        parciales[propio, rival]
+        + q_propio * (1 - parciales[rival, propio] - q_rival)
+    ) / (1 - q_propio * q_rival)
+
+
+def _tabla_sucesores(transiciones):
+    """
+    Pasa las transiciones a arreglos rellenos para poder vectorizar.
+
+    Returns:
+        tuple: (sucesores, mueve). sucesores es (M, 21, K) con índices de
+        posiciones, M como relleno y M + 1 para jugadas que dejan una ficha
+        sin salida; mueve es (M, 21) y vale False si la tirada no permite
+        mover.
+    """
+    total = len(transiciones)
+    ancho = max(len(sucesores) for fila in transiciones for sucesores in fila)
+    tabla = np.full((total, len(TIRADAS), max(ancho, 1)), total, dtype=np.intp)
+    for indice, fila in enumerate(transiciones):
+        for tirada, sucesores in enumerate(fila):
+            tabla[indice, tirada, :len(sucesores)] = [
+                total + 1 if sucesor is None else sucesor for sucesor in sucesores
+            ]
+    return tabla, tabla[:, :, 0] != total
+
+
+def _casas_por_rango(max_fichas):
+    """Devuelve las casas de hasta max_fichas fichas ordenadas por índice."""
+    casas = [None] * cantidad_posiciones(max_fichas)
+    for casa in _enumerar_casas(max_fichas):
+        casas[rango(casa)] = casa
+    return casas
+
+
+def _pips(casa):
+    """Devuelve los pips de una posición de la casa."""
+    return sum(distancia * cantidad for distancia, cantidad in enumerate(casa, start=1))
+
+
+def _enumerar_casas(max_fichas, prefijo=()):
+    """Genera todas las casas de hasta max_fichas fichas."""
+    if len(prefijo) == PUNTOS_CASA:
+        yield prefijo
+        return
+    for cantidad in range(max_fichas - sum(prefijo) + 1):
+        yield from _enumerar_casas(max_fichas, prefijo + (cantidad,))
+
+
+def _conteos_de(casa):
+    """Arma el arreglo compacto con las fichas de X en la casa y el resto fuera."""
+    conteos = [0] * 28
+    for distancia, cantidad in enumerate(casa, start=1):
+        conteos[23 - distancia] = cantidad
+    conteos[26] = 15 - sum(casa)
+    return conteos
+
+
+def _rango_o_muerta(posicion):
+    """
+    Devuelve el índice de una posición resultante, o None si dejó una ficha
+    en el punto sin salida.
+    """
+    if posicion[23] > 0:
+        return None
+    return rango(tuple(posicion[23 - d] for d in range(1, PUNTOS_CASA + 1)))
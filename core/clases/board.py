@@ -1,14 +1,118 @@
 """
 Módulo que maneja el tablero de Backgammon.
 Incluye la lógica para mover fichas, validar movimientos y gestionar el estado del juego.
+
+El estado se guarda en un arreglo compacto de 28 casillas con conteos con signo:
+- 0-23: puntos del tablero (positivo = fichas X, negativo = fichas O).
+- 24 y 25: bar de player1 (X) y de player2 (O).
+- 26 y 27: fichas fuera de player1 (X) y de player2 (O).
+
+Como X avanza de 0 a 23 y O de 23 a 0, una posición con O en el turno
+equivale a su reflejo (puntos invertidos, colores y casillas de bar y fuera
+intercambiados) con X en el turno. hash_canonico identifica las dos con la
+misma clave, así que las cachés y el libro guardan cada posición una vez.
 """
+# pylint: disable=too-many-lines
+import random
+from array import array
 from core.clases.checker import Checker
+from core.clases.id_posicion import codificar_id, decodificar_id
+from core.clases.vista_tablero import VistaTablero
 from core.clases.excepciones import (
     MovimientoInvalidoError,
     PuntoInvalidoError,
     MovimientoMalFormadoError,
 )
-# pylint: disable=too-many-return-statements,too-many-branches
+
+CASILLAS = 28
+INDICE_BAR = {'player1': 24, 'player2': 25}
+INDICE_FUERA = {'player1': 26, 'player2': 27}
+POSICION_INICIAL = (
+    2, 0, 0, 0, 0, -5, 0, -3, 0, 0, 0, 5,
+    -5, 0, 0, 0, 3, 0, 5, 0, 0, 0, 0, -2,
+    0, 0, 0, 0,
+)
+_CLAVE_FICHA = {'X': 'player1', 'O': 'player2'}
+_SIGNO_FICHA = {'X': 1, 'O': -1}
+_LADO_FICHA = {'X': 0, 'O': 1}
+_FICHAS = {1: Checker("X"), -1: Checker("O")}
+_INDICES_VISTA = {"bar": INDICE_BAR, "fuera": INDICE_FUERA}
+_CAPACIDAD_DESHACER = 64
+# Tablas por casilla para X (fila 0) y O (fila 1): si la casilla cuenta como
+# fuera de la casa y cuántos pips le faltan a una ficha para salir, medidos
+# como en calcular_distancia (el bar equivale al punto de entrada).
+_FUERA_DE_CASA = (
+    tuple(int(i < 18) for i in range(24)) + (1, 0, 0, 0),
+    tuple(int(i > 5) for i in range(24)) + (0, 1, 0, 0),
+)
+_PIPS = (
+    tuple(23 - i for i in range(24)) + (23, 0, 0, 0),
+    tuple(range(24)) + (0, 23, 0, 0),
+)
+
+
+def _generar_claves_zobrist(semilla):
+    """
+    Genera las claves Zobrist de 64 bits para cada casilla y cada conteo.
+
+    Se usa una semilla fija para que el hash de una posición sea el mismo
+    en todos los procesos. El conteo 0 tiene clave 0, así las casillas
+    vacías no aportan al hash.
+    """
+    generador = random.Random(semilla)
+    claves = [
+        [0] + [generador.getrandbits(64) for _ in range(255)]
+        for _ in range(CASILLAS)
+    ]
+    turno = {'X': generador.getrandbits(64), 'O': generador.getrandbits(64)}
+    dados = {
+        (valor, cantidad): generador.getrandbits(64)
+        for valor in range(1, 7) for cantidad in range(1, 5)
+    }
+    return claves, turno, dados
+
+
+def _claves_reflejadas(claves):
+    """Claves de cada casilla y conteo en el tablero reflejado."""
+    reflejada = list(range(23, -1, -1)) + [25, 24, 27, 26]
+    return [
+        [
+            claves[reflejada[casilla]][(-byte if casilla < 24 else byte) & 255]
+            for byte in range(256)
+        ]
+        for casilla in range(CASILLAS)
+    ]
+
+
+_ZOBRIST, _ZOBRIST_TURNO, _ZOBRIST_DADOS = _generar_claves_zobrist(0x6A09E667)
+_ZOBRIST_REFLEJADO = _claves_reflejadas(_ZOBRIST)
+
+
+def reflejar_conteos(conteos):
+    """
+    Devuelve como tupla el reflejo de 28 conteos con el formato de
+    Board.get_conteos: puntos invertidos, colores cambiados y bar y fuera
+    intercambiados entre los jugadores.
+    """
+    return tuple(-valor for valor in conteos[23::-1]) + (
+        conteos[25], conteos[24], conteos[27], conteos[26]
+    )
+
+
+def reflejar_jugada(jugada):
+    """
+    Devuelve como lista el reflejo de una jugada de tuplas (desde, hasta):
+    el punto p pasa a ser 23 - p; bar y fuera no cambian.
+    """
+    return [
+        (desde if isinstance(desde, str) else 23 - desde,
+         hasta if isinstance(hasta, str) else 23 - hasta)
+        for desde, hasta in jugada
+    ]
+
+
+# pylint: disable=too-many-return-statements,too-many-branches,too-many-public-methods
+# pylint: disable=too-many-instance-attributes
 class Board:
     """
     Representa el tablero de Backgammon con 24 posiciones,
@@ -17,22 +121,58 @@ class Board:
     def __init__(self):
         """
         Inicializa el tablero de backgammon:
-        - 24 posiciones vacías.
+        - 24 posiciones con la disposición inicial.
         - Bar para fichas comidas.
         - Área para fichas fuera del juego.
         """
-        self.__posiciones__ = self.preparar_tablero()
-        self.__bar__ = {'player1': 0, 'player2': 0}
-        self.__fuera__ = {'player1': 0, 'player2': 0}
+        self.__conteos__ = array('b', bytes(CASILLAS))
+        self.__zobrist__ = 0
+        self.__deshacer__ = array('h', bytes(2 * _CAPACIDAD_DESHACER))
+        self.__tope_deshacer__ = 0
+        self.__fuera_de_casa__ = [0, 0]
+        self.__en_tablero__ = [0, 0]
+        self.__pips__ = [0, 0]
+        self.__vista__ = VistaTablero(
+            memoryview(self.__conteos__).toreadonly(), _INDICES_VISTA, _FICHAS
+        )
+        self.preparar_tablero()
 
     def get_tablero(self):
         """Devuelve el estado actual del tablero."""
+        conteos = self.__conteos__
         return {
-            "posiciones": [list(pos) for pos in self.__posiciones__],
-            "bar": dict(self.__bar__),
-            "fuera": dict(self.__fuera__)
+            "posiciones": [
+                [_FICHAS[1]] * n if n > 0 else [_FICHAS[-1]] * -n
+                for n in conteos[:24]
+            ],
+            "bar": {
+                clave: conteos[indice] for clave, indice in INDICE_BAR.items()
+            },
+            "fuera": {
+                clave: conteos[indice] for clave, indice in INDICE_FUERA.items()
+            }
         }
 
+    def get_vista(self, instantanea=False):
+        """
+        Devuelve una vista de solo lectura con la misma forma que get_tablero,
+        sin copiar pilas ni diccionarios.
+
+        Args:
+            instantanea: si es False (por defecto) la vista comparte memoria
+                con el tablero y refleja los movimientos posteriores. Si es
+                True se congela una copia de 28 bytes del estado actual.
+
+        Returns:
+            VistaTablero: mapeo inmutable con "posiciones", "bar" y "fuera".
+        """
+        if instantanea:
+            return VistaTablero(
+                memoryview(self.__conteos__.tobytes()).cast('b'),
+                _INDICES_VISTA, _FICHAS
+            )
+        return self.__vista__
+
     def preparar_tablero(self):
         """
         Configura las posiciones iniciales del tablero.
@@ -40,16 +180,157 @@ class Board:
         Returns:
             list: lista de 24 pilas con fichas iniciales.
         """
-        self.__posiciones__ = [[] for _ in range(24)]
-        self.__posiciones__[0] = [Checker("X") for _ in range(2)]
-        self.__posiciones__[11] = [Checker("X") for _ in range(5)]
-        self.__posiciones__[16] = [Checker("X") for _ in range(3)]
-        self.__posiciones__[18] = [Checker("X") for _ in range(5)]
-        self.__posiciones__[23] = [Checker("O") for _ in range(2)]
-        self.__posiciones__[12] = [Checker("O") for _ in range(5)]
-        self.__posiciones__[7] = [Checker("O") for _ in range(3)]
-        self.__posiciones__[5] = [Checker("O") for _ in range(5)]
-        return self.__posiciones__
+        self.__conteos__[:24] = array('b', POSICION_INICIAL[:24])
+        self._recalcular_derivados()
+        return self.get_tablero()["posiciones"]
+
+    def get_conteos(self):
+        """
+        Devuelve una copia del arreglo compacto del tablero.
+
+        Returns:
+            tuple: 28 enteros con signo (puntos, bar y fuera).
+        """
+        return tuple(self.__conteos__)
+
+    def set_conteos(self, conteos):
+        """
+        Reemplaza el estado completo del tablero a partir de 28 conteos.
+
+        Args:
+            conteos: secuencia de 28 enteros con el formato de get_conteos.
+
+        Raises:
+            PuntoInvalidoError: si la secuencia no tiene 28 casillas.
+        """
+        if len(conteos) != CASILLAS:
+            raise PuntoInvalidoError(
+                f"Se esperaban {CASILLAS} casillas, se recibieron {len(conteos)}."
+            )
+        self.__conteos__[:] = array('b', conteos)
+        self._recalcular_derivados()
+
+    def hash_posicion(self, jugador=None, dados=None):
+        """
+        Devuelve el hash Zobrist de 64 bits de la posición actual.
+
+        El hash se mantiene de forma incremental con cada movimiento, así que
+        consultarlo no recorre el tablero.
+
+        Args:
+            jugador: Player con el turno; si se indica, forma parte de la clave.
+            dados: valores de dados que quedan por usar; si se indican,
+                forman parte de la clave.
+
+        Returns:
+            int: hash de la posición.
+        """
+        clave = self.__zobrist__
+        if jugador is not None:
+            clave ^= _ZOBRIST_TURNO[jugador.get_ficha()]
+        return clave ^ _clave_dados(dados)
+
+    def hash_canonico(self, jugador, dados=None):
+        """
+        Devuelve una clave de 64 bits relativa al jugador que tiene el turno.
+
+        Con X en el turno es el hash de la posición y con O el de su reflejo
+        (reflejar_conteos), calculado sin armar el tablero reflejado.
+
+        Args:
+            jugador: Player con el turno.
+            dados: valores de dados que quedan por usar; si se indican,
+                forman parte de la clave.
+
+        Returns:
+            int: clave canónica de la posición.
+        """
+        if jugador.get_ficha() == 'X':
+            clave = self.__zobrist__
+        else:
+            clave = 0
+            for casilla, valor in enumerate(self.__conteos__):
+                clave ^= _ZOBRIST_REFLEJADO[casilla][valor & 255]
+        return clave ^ _clave_dados(dados)
+
+    def get_conteos_canonicos(self, jugador):
+        """Devuelve get_conteos con X en el turno, o su reflejo con O."""
+        conteos = self.get_conteos()
+        return conteos if jugador.get_ficha() == 'X' else reflejar_conteos(conteos)
+
+    def get_id(self, jugador):
+        """
+        Devuelve el ID de posición de 14 caracteres (ver id_posicion).
+
+        Args:
+            jugador: Player con el turno.
+
+        Returns:
+            str: ID de la posición.
+        """
+        return codificar_id(self.__conteos__, _SIGNO_FICHA[jugador.get_ficha()])
+
+    @classmethod
+    def desde_id(cls, texto, jugador=None):
+        """
+        Crea un tablero a partir de un ID de posición.
+
+        Args:
+            texto: ID de 14 caracteres.
+            jugador: Player con el turno en el ID; por defecto X.
+
+        Returns:
+            Board: tablero con esa posición.
+
+        Raises:
+            IdPosicionInvalidoError: si el texto no es un ID válido.
+        """
+        signo = _SIGNO_FICHA[jugador.get_ficha()] if jugador is not None else 1
+        board = cls()
+        board.set_conteos(decodificar_id(texto, signo))
+        return board
+
+    def _recalcular_derivados(self):
+        """
+        Recalcula desde cero el hash Zobrist y los contadores por jugador
+        a partir del arreglo y vacía la pila de deshacer.
+        """
+        clave = 0
+        for casilla, valor in enumerate(self.__conteos__):
+            clave ^= _ZOBRIST[casilla][valor & 255]
+        self.__zobrist__ = clave
+        self._recalcular_contadores()
+        self.__tope_deshacer__ = 0
+
+    def _recalcular_contadores(self):
+        """
+        Recalcula los contadores por jugador: fichas fuera de la casa
+        (incluido el bar), fichas en el tablero y pips.
+        """
+        conteos = self.__conteos__
+        for lado, signo in ((0, 1), (1, -1)):
+            propias = [
+                (casilla, conteos[casilla] * signo) for casilla in range(24)
+                if conteos[casilla] * signo > 0
+            ]
+            en_bar = conteos[24 + lado]
+            self.__fuera_de_casa__[lado] = en_bar + sum(
+                _FUERA_DE_CASA[lado][casilla] * cantidad
+                for casilla, cantidad in propias
+            )
+            self.__en_tablero__[lado] = sum(cantidad for _, cantidad in propias)
+            self.__pips__[lado] = _PIPS[lado][24 + lado] * en_bar + sum(
+                _PIPS[lado][casilla] * cantidad for casilla, cantidad in propias
+            )
+
+    def _fijar_casilla(self, casilla, valor):
+        """Asigna un conteo a una casilla manteniendo el hash al día."""
+        anterior = self.__conteos__[casilla]
+        self.__conteos__[casilla] = valor
+        self.__tope_deshacer__ = 0
+        self.__zobrist__ ^= _ZOBRIST[casilla][anterior & 255] ^ \
+            _ZOBRIST[casilla][valor & 255]
+        self._recalcular_contadores()
 
     def mostrar_board(self):
         """
@@ -57,13 +338,14 @@ class Board:
         y devuelve el estado actual del tablero.
 
         Returns:
-            dict: Estado completo del tablero con posiciones, bar y fuera
+            VistaTablero: Estado completo del tablero con posiciones, bar y fuera
         """
-        estado = self.get_tablero()
+        estado = self.get_vista(instantanea=True)
+        conteos = self.__conteos__
         print("="*60)
 
-        bar_p1 = self.__bar__['player1']
-        bar_p2 = self.__bar__['player2']
+        bar_p1 = conteos[INDICE_BAR['player1']]
+        bar_p2 = conteos[INDICE_BAR['player2']]
         print(f"BAR P1: {bar_p1} fichas | BAR P2: {bar_p2} fichas")
         print()
 
@@ -73,16 +355,13 @@ class Board:
         header_top = " ".join([f"{i:2d}" for i in range(12, 24)])
         print(header_top)
 
-        max_height_top = max(
-            (len(self.__posiciones__[i]) for i in range(12, 24)),
-            default=0
-        )
+        max_height_top = max(abs(conteos[i]) for i in range(12, 24))
 
         for height in range(max_height_top - 1, -1, -1):
             line = ""
             for i in range(12, 24):
-                if height < len(self.__posiciones__[i]):
-                    simbolo = self.__posiciones__[i][height].get_simbolo()
+                if height < abs(conteos[i]):
+                    simbolo = "X" if conteos[i] > 0 else "O"
                     line += f" {simbolo} "
                 else:
                     line += "   "
@@ -91,16 +370,13 @@ class Board:
         print("-" * 50)
         print()
 
-        max_height_bottom = max(
-            (len(self.__posiciones__[i]) for i in range(12)),
-            default=0
-        )
+        max_height_bottom = max(abs(conteos[i]) for i in range(12))
 
         for height in range(max_height_bottom - 1, -1, -1):
             line = []
             for i in range(11, -1, -1):
-                if height < len(self.__posiciones__[i]):
-                    simbolo = self.__posiciones__[i][height].get_simbolo()
+                if height < abs(conteos[i]):
+                    simbolo = "X" if conteos[i] > 0 else "O"
                     line.append(f" {simbolo} ")
                 else:
                     line.append("   ")
@@ -112,8 +388,8 @@ class Board:
         print("-" * 50)
         print()
 
-        fuera_p1 = self.__fuera__['player1']
-        fuera_p2 = self.__fuera__['player2']
+        fuera_p1 = conteos[INDICE_FUERA['player1']]
+        fuera_p2 = conteos[INDICE_FUERA['player2']]
         print(f"FUERA P1: {fuera_p1} fichas | FUERA P2: {fuera_p2} fichas")
         print("="*60)
         return estado
@@ -127,6 +403,9 @@ class Board:
             movimientos: lista de tuplas (desde, hasta)
             dados_disponibles: lista de valores de dados disponibles
 
+        Vacía la pila de aplicar/deshacer: los movimientos hechos antes ya
+        no se pueden deshacer.
+
         Returns:
             dict: diccionario con resultados, dados usados y log
         """
@@ -141,6 +420,7 @@ class Board:
                     "Cada movimiento debe ser una tupla con dos elementos."
                 )
 
+        self.__tope_deshacer__ = 0
         resultados = []
         dados_usados = []
         log = []
@@ -182,11 +462,13 @@ class Board:
         dados_usados = movimiento_data['dados_usados']
         log = movimiento_data['log']
         distancia = self.calcular_distancia(desde, hasta, jugador)
+        clave = _CLAVE_FICHA[jugador.get_ficha()]
+        en_bar = self.__conteos__[INDICE_BAR[clave]]
 
         # Validar fichas en bar
-        if desde != "bar" and self.__bar__[jugador.get_nombre()] > 0:
+        if desde != "bar" and en_bar > 0:
             log.append(
-                f"Debes primero sacar tus {self.__bar__[jugador.get_nombre()]} "
+                f"Debes primero sacar tus {en_bar} "
                 f"ficha(s) del bar antes de mover otras fichas."
             )
             return False
@@ -234,17 +516,15 @@ class Board:
             return False
 
         # Validar posición bloqueada
-        if isinstance(hasta, int):
-            pila_destino = self.__posiciones__[hasta]
-            if pila_destino and \
-            pila_destino[-1].get_simbolo() != jugador.get_ficha():
-                if len(pila_destino) > 1:
-                    log.append(
-                        f"No se puede mover a {hasta}: posición bloqueada con "
-                        f"{len(pila_destino)} fichas enemigas. "
-                        f"Solo puedes comer una ficha enemiga solitaria."
-                    )
-                    return False
+        if isinstance(hasta, int) and 0 <= hasta < 24:
+            enemigas = -self.__conteos__[hasta] * _SIGNO_FICHA[jugador.get_ficha()]
+            if enemigas > 1:
+                log.append(
+                    f"No se puede mover a {hasta}: posición bloqueada con "
+                    f"{enemigas} fichas enemigas. "
+                    f"Solo puedes comer una ficha enemiga solitaria."
+                )
+                return False
 
         # Validar bearing off
         if hasta == "fuera":
@@ -252,7 +532,7 @@ class Board:
                 log.append(
                     f"No puedes sacar fichas todavía. "
                     f"Primero debes llevar todas tus fichas al cuadrante final "
-                    f"({'18-23' if jugador.get_nombre() == 'player1' else '0-5'})."
+                    f"({'18-23' if clave == 'player1' else '0-5'})."
                 )
                 return False
 
@@ -260,7 +540,7 @@ class Board:
                 log.append(
                     f"No se puede sacar ficha desde {desde}. "
                     f"Solo puedes sacar fichas del cuadrante final "
-                    f"({'18-23' if jugador.get_nombre() == 'player1' else '0-5'})."
+                    f"({'18-23' if clave == 'player1' else '0-5'})."
                 )
                 return False
 
@@ -292,34 +572,26 @@ class Board:
         dados_disponibles = movimiento_data['dados_disponibles']
         dados_usados = movimiento_data['dados_usados']
         log = movimiento_data['log']
-        ficha_comida = False
+        clave = _CLAVE_FICHA[jugador.get_ficha()]
 
         try:
-            if self.puede_comer(hasta, jugador):
-                self.__posiciones__[hasta].pop()
-                oponente = (
-                    "player2" if jugador.get_nombre() == "player1"
-                    else "player1"
-                )
-                self.__bar__[oponente] += 1
-                ficha_comida = True
+            self.puede_comer(hasta, jugador)
         except PuntoInvalidoError as error:
             log.append(str(error))
             return False
 
-        if desde == "bar":
-            self.__bar__[jugador.get_nombre()] -= 1
-        else:
-            self.__posiciones__[desde].pop()
+        ficha_comida = self._desplazar(
+            INDICE_BAR[clave] if desde == "bar" else desde,
+            INDICE_FUERA[clave] if hasta == "fuera" else hasta,
+            _SIGNO_FICHA[jugador.get_ficha()]
+        )
 
         if hasta == "fuera":
-            self.__fuera__[jugador.get_nombre()] += 1
             log.append(
                 f"{jugador.get_ficha()} sacó ficha desde {desde} "
                 f"usando dado {distancia}."
             )
         else:
-            self.__posiciones__[hasta].append(Checker(jugador.get_ficha()))
             mensaje = (
                 f"{jugador.get_ficha()} movió de {desde} a {hasta} "
                 f"usando dado {distancia}."
@@ -364,15 +636,16 @@ class Board:
             raise PuntoInvalidoError(f"Posición 'desde' fuera de rango: {desde}")
 
         if desde == "bar":
-            if self.__bar__[jugador.get_nombre()] == 0:
+            clave = _CLAVE_FICHA[jugador.get_ficha()]
+            if self.__conteos__[INDICE_BAR[clave]] == 0:
                 raise MovimientoInvalidoError(
                     f"No hay fichas en el bar para {jugador.get_nombre()}."
                 )
         elif isinstance(desde, int):
-            if not self.__posiciones__[desde]:
+            propias = self.__conteos__[desde] * _SIGNO_FICHA[jugador.get_ficha()]
+            if propias == 0:
                 return False
-            if self.__posiciones__[desde][-1].get_simbolo() != \
-               jugador.get_ficha():
+            if propias < 0:
                 raise MovimientoInvalidoError(
                     f"La ficha en {desde} no pertenece al jugador."
                 )
@@ -391,53 +664,368 @@ class Board:
             raise PuntoInvalidoError(
                 f"Posición 'hasta' fuera de rango: {hasta}"
             )
-        pila = self.__posiciones__[hasta]
-        return (
-            len(pila) == 1 and
-            pila[-1].get_simbolo() != jugador.get_ficha()
-        )
+        return self.__conteos__[hasta] * _SIGNO_FICHA[jugador.get_ficha()] == -1
 
     def set_posiciones(self, index, fichas):
         """Establece fichas en una posición específica del tablero."""
         if not isinstance(index, int) or not 0 <= index < 24:
             raise PuntoInvalidoError(f"Índice fuera de rango: {index}")
-        self.__posiciones__[index] = fichas
+        simbolos = {ficha.get_simbolo() for ficha in fichas}
+        if len(simbolos) > 1:
+            raise PuntoInvalidoError(
+                f"La posición {index} no puede tener fichas de ambos jugadores."
+            )
+        signo = _SIGNO_FICHA[simbolos.pop()] if simbolos else 0
+        self._fijar_casilla(index, signo * len(fichas))
 
     def get_posiciones(self, index):
         """Devuelve las fichas en una posición específica del tablero."""
         if not isinstance(index, int) or not 0 <= index < 24:
             raise PuntoInvalidoError(f"Índice fuera de rango: {index}")
-        return self.__posiciones__[index]
+        cantidad = self.__conteos__[index]
+        if cantidad < 0:
+            return [_FICHAS[-1]] * -cantidad
+        return [_FICHAS[1]] * cantidad
 
     def set_bar(self, jugador, cantidad):
         """Establece la cantidad de fichas en el bar para un jugador."""
-        self.__bar__[jugador] = cantidad
+        self._fijar_casilla(INDICE_BAR[jugador], cantidad)
 
     def get_bar(self, jugador):
         """Devuelve la cantidad de fichas en el bar para un jugador."""
-        return self.__bar__[jugador]
+        return self.__conteos__[INDICE_BAR[jugador]]
 
     def set_fuera(self, jugador, cantidad):
         """Establece la cantidad de fichas fuera del tablero para un jugador."""
-        self.__fuera__[jugador] = cantidad
+        self._fijar_casilla(INDICE_FUERA[jugador], cantidad)
 
     def get_fuera(self, jugador):
         """Devuelve la cantidad de fichas fuera del tablero para un jugador."""
-        return self.__fuera__[jugador]
+        return self.__conteos__[INDICE_FUERA[jugador]]
 
     def esta_en_cuadrante_final(self, posicion, jugador):
         """Verifica si una posición está en el cuadrante final del jugador."""
         if not isinstance(posicion, int):
             return False
-        if jugador.get_nombre() == "player1":
+        if jugador.get_ficha() == "X":
             return 18 <= posicion <= 23
         return 0 <= posicion <= 5
 
     def puede_sacar(self, jugador):
-        """Verifica si todas las fichas del jugador están en cuadrante final."""
-        for i in range(24):
-            pila = self.__posiciones__[i]
-            if pila and pila[-1].get_simbolo() == jugador.get_ficha():
-                if not self.esta_en_cuadrante_final(i, jugador):
-                    return False
-        return True
+        """
+        Verifica si todas las fichas del jugador están en cuadrante final.
+
+        Usa el contador incremental de fichas fuera de la casa (incluido el
+        bar), por lo que responde en tiempo constante.
+        """
+        return self.__fuera_de_casa__[_LADO_FICHA[jugador.get_ficha()]] == 0
+
+    def get_fuera_de_casa(self, jugador):
+        """
+        Devuelve cuántas fichas del jugador están fuera de su cuadrante final,
+        contando las del bar.
+        """
+        return self.__fuera_de_casa__[0 if jugador == 'player1' else 1]
+
+    def get_fichas_en_tablero(self, jugador):
+        """Devuelve cuántas fichas del jugador hay en los 24 puntos."""
+        return self.__en_tablero__[0 if jugador == 'player1' else 1]
+
+    def get_pips(self, jugador):
+        """
+        Devuelve la cuenta de pips del jugador: la suma de las distancias
+        que le faltan a sus fichas para salir, según calcular_distancia.
+        """
+        return self.__pips__[0 if jugador == 'player1' else 1]
+
+    def aplicar(self, movimiento, jugador):
+        """
+        Aplica un movimiento sin consumir dados y lo guarda para deshacerlo.
+
+        Pensado para búsquedas que prueban una jugada, evalúan y vuelven
+        atrás. Solo verifica que el origen tenga fichas del jugador y que el
+        destino no esté bloqueado; la legalidad respecto de los dados queda a
+        cargo de quien llama (por ejemplo usando jugadas_legales).
+
+        Args:
+            movimiento: tupla (desde, hasta) con el formato de mover_ficha.
+            jugador: objeto Player que mueve.
+
+        Returns:
+            bool: True si el movimiento comió una ficha enemiga.
+
+        Raises:
+            MovimientoMalFormadoError: si el movimiento no es una tupla de dos.
+            PuntoInvalidoError: si alguna posición está fuera de rango.
+            MovimientoInvalidoError: si no hay ficha propia en el origen o
+                el destino está bloqueado.
+        """
+        if not isinstance(movimiento, tuple) or len(movimiento) != 2:
+            raise MovimientoMalFormadoError(
+                "Cada movimiento debe ser una tupla con dos elementos."
+            )
+        desde, hasta = movimiento
+        clave = _CLAVE_FICHA[jugador.get_ficha()]
+        signo = _SIGNO_FICHA[jugador.get_ficha()]
+        for valor, especial in ((desde, "bar"), (hasta, "fuera")):
+            if valor != especial and \
+                    not (isinstance(valor, int) and 0 <= valor < 24):
+                raise PuntoInvalidoError(f"Posición fuera de rango: {valor}")
+        origen = INDICE_BAR[clave] if desde == "bar" else desde
+        destino = INDICE_FUERA[clave] if hasta == "fuera" else hasta
+        propias = self.__conteos__[origen]
+        if desde != "bar":
+            propias *= signo
+        if propias <= 0:
+            raise MovimientoInvalidoError(
+                f"No hay fichas de {clave} en {desde}."
+            )
+        if hasta != "fuera" and self.__conteos__[destino] * signo < -1:
+            raise MovimientoInvalidoError(
+                f"No se puede mover a {hasta}: posición bloqueada."
+            )
+
+        comida = self._desplazar(origen, destino, signo)
+        if self.__tope_deshacer__ == len(self.__deshacer__):
+            self.__deshacer__.extend(self.__deshacer__)
+        self.__deshacer__[self.__tope_deshacer__] = \
+            origen * 56 + destino * 2 + comida
+        self.__tope_deshacer__ += 1
+        return comida
+
+    def deshacer(self):
+        """
+        Revierte el último movimiento hecho con aplicar en tiempo constante.
+
+        Raises:
+            MovimientoInvalidoError: si no hay movimientos para deshacer.
+        """
+        if self.__tope_deshacer__ == 0:
+            raise MovimientoInvalidoError("No hay movimientos para deshacer.")
+        self.__tope_deshacer__ -= 1
+        codigo = self.__deshacer__[self.__tope_deshacer__]
+        origen, resto = divmod(codigo, 56)
+        destino, comida = divmod(resto, 2)
+        if destino < 24:
+            signo = 1 if self.__conteos__[destino] > 0 else -1
+        else:
+            signo = 1 if destino == INDICE_FUERA['player1'] else -1
+        self._restaurar(origen, destino, signo, comida)
+
+    def jugadas_legales(self, jugador, dado1, dado2):
+        """
+        Genera todas las jugadas completas legales para una tirada.
+
+        Considera ambos órdenes de los dados, los dobles (cuatro movimientos),
+        la entrada desde el bar y la salida de fichas. Exige usar la mayor
+        cantidad posible de dados y, si solo entra uno de dos dados distintos,
+        el mayor. Las jugadas que terminan en la misma posición se devuelven
+        una sola vez.
+
+        Args:
+            jugador: objeto Player que tiene el turno.
+            dado1: valor del primer dado.
+            dado2: valor del segundo dado.
+
+        Returns:
+            list: lista de jugadas; cada jugada es una lista de tuplas
+            (desde, hasta) aceptada por mover_ficha. Vacía si no hay
+            ningún movimiento posible.
+        """
+        return [
+            jugada for jugada, _ in
+            self.jugadas_y_posiciones(jugador, dado1, dado2)
+        ]
+
+    def jugadas_y_posiciones(self, jugador, dado1, dado2):
+        """
+        Igual que jugadas_legales, pero acompaña cada jugada con la posición
+        resultante como bytes del arreglo compacto (formato de get_conteos).
+
+        Returns:
+            list: tuplas (jugada, posicion_resultante).
+        """
+        signo = _SIGNO_FICHA[jugador.get_ficha()]
+        if dado1 == dado2:
+            secuencias = [(dado1,) * 4]
+        else:
+            secuencias = [(dado1, dado2), (dado2, dado1)]
+        hojas = {}
+        visitados = set()
+        for dados in secuencias:
+            self._explorar_jugadas(signo, dados, [], hojas, visitados)
+
+        maximo = max((len(camino) for camino in hojas.values()), default=0)
+        if maximo == 0:
+            return []
+        finales = {
+            posicion: camino for posicion, camino in hojas.items()
+            if len(camino) == maximo
+        }
+        if maximo == 1 and dado1 != dado2:
+            mayor = max(dado1, dado2)
+            con_mayor = {
+                posicion: camino for posicion, camino in finales.items()
+                if camino[0][2] == mayor
+            }
+            finales = con_mayor or finales
+        return [
+            ([(_a_publico(o), _a_publico(d)) for o, d, _ in camino], posicion)
+            for posicion, camino in finales.items()
+        ]
+
+    def _explorar_jugadas(self, signo, dados, camino, hojas, visitados):
+        """
+        Recorre en profundidad las secuencias de movimientos simples
+        aplicándolos y revirtiéndolos sobre el propio arreglo.
+
+        Args:
+            signo: 1 para X, -1 para O.
+            dados: tupla con los dados que quedan por usar, en orden.
+            camino: movimientos (origen, destino, dado) ya aplicados.
+            hojas: dict posición -> camino más largo que la alcanza.
+            visitados: estados (dados, posición) ya explorados.
+        """
+        posicion = self.__conteos__.tobytes()
+        estado = (dados, posicion)
+        if estado in visitados:
+            return
+        visitados.add(estado)
+
+        movimientos = self._movimientos_simples(signo, dados[0]) if dados else []
+        if not movimientos:
+            previo = hojas.get(posicion)
+            if previo is None or len(previo) < len(camino):
+                hojas[posicion] = list(camino)
+            return
+
+        for origen, destino in movimientos:
+            comida = self._desplazar(origen, destino, signo)
+            camino.append((origen, destino, dados[0]))
+            self._explorar_jugadas(signo, dados[1:], camino, hojas, visitados)
+            camino.pop()
+            self._restaurar(origen, destino, signo, comida)
+
+    def _movimientos_simples(self, signo, dado):
+        """
+        Lista los movimientos de una sola ficha con un dado, como pares
+        (origen, destino) de índices del arreglo compacto.
+        """
+        conteos = self.__conteos__
+        indice_bar = 24 if signo > 0 else 25
+        if conteos[indice_bar] > 0:
+            destino = dado if signo > 0 else 23 - dado
+            if conteos[destino] * signo >= -1:
+                return [(indice_bar, destino)]
+            return []
+
+        movimientos = []
+        fuera = 26 if signo > 0 else 27
+        casa = range(18, 24) if signo > 0 else range(0, 6)
+        puede_sacar = self.__fuera_de_casa__[0 if signo > 0 else 1] == 0
+        for origen in range(24):
+            if conteos[origen] * signo <= 0:
+                continue
+            destino = origen + signo * dado
+            if 0 <= destino < 24 and conteos[destino] * signo >= -1:
+                movimientos.append((origen, destino))
+            if puede_sacar and origen in casa:
+                restante = 23 - origen if signo > 0 else origen
+                if restante == dado:
+                    movimientos.append((origen, fuera))
+        return movimientos
+
+    def _desplazar(self, origen, destino, signo):
+        """
+        Mueve una ficha entre dos casillas del arreglo compacto sin validar,
+        actualizando el hash Zobrist de forma incremental.
+
+        Returns:
+            bool: True si el movimiento comió una ficha enemiga.
+        """
+        conteos = self.__conteos__
+        zobrist = _ZOBRIST
+        comida = False
+        viejo = conteos[origen]
+        nuevo = viejo - (signo if origen < 24 else 1)
+        conteos[origen] = nuevo
+        cambio = zobrist[origen][viejo & 255] ^ zobrist[origen][nuevo & 255]
+        viejo = conteos[destino]
+        if destino >= 24:
+            nuevo = viejo + 1
+        elif viejo == -signo:
+            bar_rival = 25 if signo > 0 else 24
+            cambio ^= zobrist[bar_rival][conteos[bar_rival] & 255] ^ \
+                zobrist[bar_rival][(conteos[bar_rival] + 1) & 255]
+            conteos[bar_rival] += 1
+            nuevo = signo
+            comida = True
+        else:
+            nuevo = viejo + signo
+        conteos[destino] = nuevo
+        cambio ^= zobrist[destino][viejo & 255] ^ zobrist[destino][nuevo & 255]
+        self.__zobrist__ ^= cambio
+        self._actualizar_contadores(origen, destino, signo, comida)
+        return comida
+
+    def _restaurar(self, origen, destino, signo, comida):
+        """Deshace un _desplazar con los mismos argumentos."""
+        conteos = self.__conteos__
+        zobrist = _ZOBRIST
+        anterior = conteos[destino]
+        if destino < 24:
+            nuevo = -signo if comida else anterior - signo
+            if comida:
+                bar_rival = 25 if signo > 0 else 24
+                cambio = zobrist[bar_rival][conteos[bar_rival] & 255] ^ \
+                    zobrist[bar_rival][(conteos[bar_rival] - 1) & 255]
+                conteos[bar_rival] -= 1
+            else:
+                cambio = 0
+        else:
+            nuevo = anterior - 1
+            cambio = 0
+        conteos[destino] = nuevo
+        cambio ^= zobrist[destino][anterior & 255] ^ zobrist[destino][nuevo & 255]
+        paso = signo if origen < 24 else 1
+        anterior = conteos[origen]
+        conteos[origen] = anterior + paso
+        cambio ^= zobrist[origen][anterior & 255] ^ \
+            zobrist[origen][(anterior + paso) & 255]
+        self.__zobrist__ ^= cambio
+        self._actualizar_contadores(destino, origen, signo, comida, -1)
+
+    def _actualizar_contadores(self, origen, destino, signo, comida, sentido=1):
+        """
+        Ajusta los contadores por jugador cuando una ficha pasa de origen a
+        destino; con sentido -1 descuenta también la ficha comida.
+        """
+        lado = 0 if signo > 0 else 1
+        rival = 1 - lado
+        self.__fuera_de_casa__[lado] += \
+            _FUERA_DE_CASA[lado][destino] - _FUERA_DE_CASA[lado][origen]
+        self.__en_tablero__[lado] += (destino < 24) - (origen < 24)
+        self.__pips__[lado] += _PIPS[lado][destino] - _PIPS[lado][origen]
+        if comida:
+            casilla = destino if sentido > 0 else origen
+            self.__fuera_de_casa__[rival] += \
+                sentido * (1 - _FUERA_DE_CASA[rival][casilla])
+            self.__en_tablero__[rival] -= sentido
+            self.__pips__[rival] += \
+                sentido * (23 - _PIPS[rival][casilla])
+
+
+def _clave_dados(dados):
+    """Combina las claves Zobrist de los dados que quedan por usar."""
+    clave = 0
+    if dados:
+        for valor in set(dados):
+            clave ^= _ZOBRIST_DADOS[(valor, list(dados).count(valor))]
+    return clave
+
+
+def _a_publico(casilla):
+    """Convierte un índice del arreglo compacto al formato de mover_ficha."""
+    if casilla < 24:
+        return casilla
+    return "bar" if casilla < 26 else "fuera"
@@ -0,0 +1,213 @@
+"""
+Módulo que define BoardBatch, un tablero vectorizado con NumPy para avanzar
+muchas partidas a la vez.
+
+Cada fila usa el mismo formato de 28 casillas que Board.get_conteos:
+puntos 0-23 con signo, bar en 24/25 y fichas fuera en 26/27.
+"""
+import numpy as np
+from core.clases.board import Board, CASILLAS, POSICION_INICIAL
+from core.clases.excepciones import MovimientoInvalidoError, PuntoInvalidoError
+
+
+class BoardBatch:
+    """Conjunto de N posiciones guardadas en un arreglo (N, 28) de int8."""
+
+    def __init__(self, cantidad):
+        """
+        Crea N partidas en la posición inicial.
+
+        Args:
+            cantidad: número de partidas del lote.
+        """
+        self.__conteos__ = np.tile(
+            np.array(POSICION_INICIAL, dtype=np.int8), (cantidad, 1)
+        )
+
+    @classmethod
+    def desde_boards(cls, boards):
+        """
+        Construye un lote a partir de tableros individuales.
+
+        Args:
+            boards: secuencia de instancias de Board.
+
+        Returns:
+            BoardBatch: lote con una fila por tablero.
+        """
+        lote = cls(0)
+        lote.set_conteos([board.get_conteos() for board in boards])
+        return lote
+
+    def a_board(self, indice):
+        """
+        Devuelve la partida indicada como un Board independiente.
+
+        Args:
+            indice: fila del lote.
+
+        Returns:
+            Board: tablero con la misma posición.
+        """
+        board = Board()
+        board.set_conteos(self.__conteos__[indice].tolist())
+        return board
+
+    def a_boards(self):
+        """Devuelve todas las partidas del lote como tableros individuales."""
+        return [self.a_board(i) for i in range(len(self))]
+
+    def __len__(self):
+        """Cantidad de partidas del lote."""
+        return self.__conteos__.shape[0]
+
+    def get_conteos(self):
+        """
+        Devuelve el arreglo (N, 28) del lote sin copiarlo.
+
+        Returns:
+            numpy.ndarray: conteos con signo de cada partida.
+        """
+        return self.__conteos__
+
+    def set_conteos(self, conteos):
+        """
+        Reemplaza todas las posiciones del lote.
+
+        Args:
+            conteos: arreglo o secuencia de forma (N, 28).
+
+        Raises:
+            PuntoInvalidoError: si la forma no es (N, 28).
+        """
+        conteos = np.array(conteos, dtype=np.int8)
+        if conteos.size == 0:
+            conteos = conteos.reshape(0, CASILLAS)
+        if conteos.ndim != 2 or conteos.shape[1] != CASILLAS:
+            raise PuntoInvalidoError(
+                f"Se esperaba un arreglo (N, {CASILLAS}), se recibió {conteos.shape}."
+            )
+        self.__conteos__ = conteos
+
+    def aplicar(self, origen, destino, signo, activos=None):
+        """
+        Mueve una ficha en cada partida activa, todas en una sola operación.
+
+        Los movimientos se expresan con índices del arreglo compacto: 24/25
+        para salir del bar y 26/27 para sacar fichas. Como Board.aplicar,
+        solo se verifica que el origen tenga fichas propias y que el destino
+        no esté bloqueado.
+
+        Args:
+            origen: arreglo (N,) con la casilla de origen de cada partida.
+            destino: arreglo (N,) con la casilla de destino de cada partida.
+            signo: 1 (X) o -1 (O), escalar o arreglo (N,).
+            activos: máscara (N,) de partidas que mueven; por defecto todas.
+
+        Returns:
+            numpy.ndarray: máscara (N,) de partidas donde se comió una ficha.
+
+        Raises:
+            MovimientoInvalidoError: si algún movimiento activo no es posible.
+        """
+        forma = (len(self),)
+        filas = np.arange(forma[0]) if activos is None else np.flatnonzero(activos)
+        origen = np.broadcast_to(np.asarray(origen, dtype=np.intp), forma)[filas]
+        destino = np.broadcast_to(np.asarray(destino, dtype=np.intp), forma)[filas]
+        signo = np.broadcast_to(np.asarray(signo, dtype=np.int8), forma)[filas]
+        conteos = self.__conteos__
+
+        # En los puntos el conteo lleva signo; en bar y fuera siempre suma.
+        paso_origen = np.where(origen < 24, signo, 1).astype(np.int8)
+        paso_destino = np.where(destino < 24, signo, 1).astype(np.int8)
+        rivales = np.where(
+            destino < 24, -conteos[filas, np.minimum(destino, 23)] * signo, 0
+        )
+        invalidos = (conteos[filas, origen] * paso_origen <= 0) | (rivales > 1)
+        if invalidos.any():
+            partida = int(filas[np.argmax(invalidos)])
+            raise MovimientoInvalidoError(
+                f"Movimiento inválido en la partida {partida}."
+            )
+
+        comidas = rivales == 1
+        conteos[filas, origen] -= paso_origen
+        conteos[filas[comidas], destino[comidas]] = 0
+        conteos[filas[comidas], np.where(signo[comidas] > 0, 25, 24)] += 1
+        conteos[filas, destino] += paso_destino
+
+        resultado = np.zeros(forma, dtype=bool)
+        resultado[filas] = comidas
+        return resultado
+
+    def movimientos_legales(self, dados, signo):
+        """
+        Calcula las máscaras de movimientos simples legales de todo el lote.
+
+        Ver movimientos_legales a nivel de módulo.
+        """
+        return movimientos_legales(self.__conteos__, dados, signo)
+
+    def ganadores(self):
+        """
+        Indica qué partidas terminaron y quién las ganó.
+
+        Returns:
+            numpy.ndarray: arreglo (N,) con 1 si ganó X, -1 si ganó O y 0 si
+            la partida sigue en curso.
+        """
+        conteos = self.__conteos__
+        return (conteos[:, 26] == 15).astype(np.int8) - \
+            (conteos[:, 27] == 15).astype(np.int8)
+
+
+def movimientos_legales(conteos, dados, signo):
+    """
+    Devuelve, para cada partida, qué movimientos de una sola ficha son legales
+    con cada dado, aplicando las mismas reglas que
+    Board._procesar_movimiento_individual: primero el bar, puntos con dos o
+    más fichas rivales bloqueados y salida solo con todas las fichas en casa
+    y la distancia exacta.
+
+    Las partidas de O se reflejan (punto p -> 23 - p) para evaluar todas con
+    la geometría de X en una sola pasada y luego se vuelven a reflejar.
+
+    Args:
+        conteos: arreglo (N, 28) con el formato de Board.get_conteos.
+        dados: arreglo (N, 2) con los dados de cada partida; 0 = sin dado.
+        signo: 1 (X) o -1 (O), escalar o arreglo (N,).
+
+    Returns:
+        numpy.ndarray: máscara bool (N, 25, 2); el eje 1 es el origen
+        (puntos 0-23 y 24 para el bar propio) y el eje 2 el dado.
+    """
+    conteos = np.asarray(conteos, dtype=np.int8)
+    dados = np.asarray(dados, dtype=np.intp).reshape(-1, 2)
+    cantidad = conteos.shape[0]
+    es_o = np.broadcast_to(np.asarray(signo), (cantidad,)) < 0
+
+    relativos = conteos[:, :24].astype(np.int16)
+    relativos[es_o] = -relativos[es_o][:, ::-1]
+    en_bar = np.where(es_o, conteos[:, 25], conteos[:, 24])
+    propias = relativos > 0
+    puede_sacar = (en_bar == 0) & ~propias[:, :18].any(axis=1)
+
+    # Destinos con la geometría de X: punto p + dado; el bar entra en "dado".
+    # Las columnas de relleno (-2) hacen que pasarse del punto 23 no sea válido.
+    relleno = np.concatenate(
+        [relativos, np.full((cantidad, 7), -2, dtype=np.int16)], axis=1
+    )
+    puntos = np.arange(24)[None, :, None]
+    abierto = relleno[
+        np.arange(cantidad)[:, None, None], puntos + dados[:, None, :]
+    ] >= -1
+    saca = (puntos >= 18) & (23 - puntos == dados[:, None, :]) & \
+        puede_sacar[:, None, None]
+
+    mascara = np.zeros((cantidad, 25, 2), dtype=bool)
+    mascara[:, :24] = propias[:, :, None] & (abierto | saca) & \
+        (dados[:, None, :] > 0) & (en_bar == 0)[:, None, None]
+    mascara[:, 24] = (en_bar > 0)[:, None] & \
+        (relleno[np.arange(cantidad)[:, None], dados] >= -1) & (dados > 0)
+    mascara[es_o, :24] = mascara[es_o, 23::-1]
+    return mascara
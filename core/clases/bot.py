@@ -0,0 +1,230 @@
+"""
+Módulo que define un jugador automático de Backgammon.
+
+El bot busca con expectiminimax a profundidad fija: los nodos de decisión
+eligen la mejor jugada de Board.jugadas_y_posiciones y los nodos de azar
+promedian las 21 tiradas distintas (1/36 los dobles, 2/36 las demás). En los
+nodos de azar se podan ramas con las cotas del evaluador (Star1) y, desde la
+profundidad 3, con un sondeo previo de la mejor jugada de cada tirada (Star2).
+Si tiene un libro de aperturas, lo consulta antes de buscar, y con una tabla
+de transposición no repite la generación ni la evaluación de las posiciones
+que ya vio.
+"""
+import numpy as np
+from core.clases.board import Board
+from core.clases.player import Player
+from core.clases.evaluador import EvaluadorHeuristico
+from core.clases.transposicion import candidatas_ordenadas
+
+# Tiradas distintas con su peso en treinta y seisavos.
+TIRADAS = tuple(
+    (dado1, dado2, 1 if dado1 == dado2 else 2)
+    for dado1 in range(1, 7) for dado2 in range(dado1, 7)
+)
+_JUGADORES = {1: Player("player1", "X"), -1: Player("player2", "O")}
+_SIGNO_FICHA = {'X': 1, 'O': -1}
+
+
+class BotExpectiminimax:
+    """Jugador automático que elige jugadas con expectiminimax."""
+
+    def __init__(self, evaluador=None, profundidad=2, libro=None):
+        """
+        Args:
+            evaluador: objeto con evaluar(posiciones, turno) y get_cotas();
+                por defecto EvaluadorHeuristico. Las jugadas de cada tirada
+                se evalúan en una sola llamada.
+            profundidad: jugadas que se miran hacia adelante. 1 elige con la
+                evaluación estática; 2 además promedia la mejor respuesta del
+                rival para cada tirada.
+            libro: LibroAperturas a consultar antes de buscar, o None.
+        """
+        self.__evaluador__ = evaluador if evaluador is not None else EvaluadorHeuristico()
+        self.__profundidad__ = profundidad
+        self.__libro__ = libro
+        self.__tabla__ = None
+        self.__tablero__ = Board()
+        self.__nodos__ = 0
+
+    def elegir_jugada(self, board, jugador, dado1, dado2):
+        """
+        Elige la jugada para una tirada sin modificar el tablero recibido.
+
+        Las posiciones que están en el libro se responden sin buscar.
+
+        Args:
+            board: tablero con la posición actual.
+            jugador: objeto Player que tiene el turno.
+            dado1: valor del primer dado.
+            dado2: valor del segundo dado.
+
+        Returns:
+            list: tuplas (desde, hasta) aceptadas por mover_ficha; vacía si
+            no hay ningún movimiento posible.
+        """
+        self.__nodos__ = 0
+        if self.__libro__ is not None:
+            jugada = self.__libro__.buscar(board, jugador, dado1, dado2)
+            if jugada is not None:
+                return jugada
+        self.__tablero__.set_conteos(board.get_conteos())
+        jugada, _ = self._decidir(
+            (_SIGNO_FICHA[jugador.get_ficha()], dado1, dado2),
+            self.__profundidad__, (-np.inf, np.inf)
+        )
+        return jugada
+
+    def set_tabla(self, tabla):
+        """
+        Asigna una tabla de transposición para las jugadas y evaluaciones.
+
+        Args:
+            tabla: TablaTransposicion, o None para no usarla. Puede
+                compartirse con otros bots o con las sugerencias; los valores
+                de cada evaluador se guardan aparte.
+        """
+        self.__tabla__ = tabla
+
+    def get_nodos(self):
+        """
+        Devuelve cuántas posiciones evaluó la última búsqueda.
+
+        Returns:
+            int: posiciones pasadas al evaluador.
+        """
+        return self.__nodos__
+
+    def _candidatas(self, signo, dado1, dado2):
+        """
+        Genera las jugadas de la tirada ordenadas de mejor a peor según la
+        evaluación estática (ver candidatas_ordenadas).
+
+        Returns:
+            list: tuplas (valor, jugada) con el valor para el jugador signo.
+        """
+        candidatas, evaluadas = candidatas_ordenadas(
+            self.__tablero__, (signo, dado1, dado2), self.__evaluador__, self.__tabla__
+        )
+        self.__nodos__ += evaluadas
+        return candidatas
+
+    def _decidir(self, nodo, profundidad, ventana, sondeo=None):
+        """
+        Nodo de decisión: el jugador ya tiró los dados y elige su jugada.
+
+        Args:
+            nodo: tupla (signo, dado1, dado2).
+            profundidad: jugadas que quedan por mirar, incluida esta.
+            ventana: tupla (alfa, beta) para podar.
+            sondeo: tupla (valor, candidatas) si el nodo de azar ya buscó
+                la primera candidata.
+
+        Returns:
+            tuple: (jugada, valor) con el valor para el jugador que mueve.
+        """
+        signo, dado1, dado2 = nodo
+        if sondeo is None:
+            candidatas = self._candidatas(signo, dado1, dado2)
+            mejor_jugada, mejor = candidatas[0][1], -np.inf
+        else:
+            mejor, candidatas = sondeo
+            mejor_jugada = candidatas[0][1]
+            candidatas = candidatas[1:]
+        if profundidad <= 1:
+            return mejor_jugada, candidatas[0][0]
+
+        alfa, beta = ventana
+        for _, jugada in candidatas:
+            if mejor >= beta:
+                break
+            valor = -self._azar_tras(
+                jugada, signo, profundidad - 1, (-beta, -max(alfa, mejor))
+            )
+            if valor > mejor:
+                mejor, mejor_jugada = valor, jugada
+        return mejor_jugada, mejor
+
+    def _azar_tras(self, jugada, signo, profundidad, ventana):
+        """
+        Aplica la jugada, evalúa el nodo de azar del rival y la deshace.
+
+        Returns:
+            float: valor para el rival, que es quien tira a continuación.
+        """
+        tablero = self.__tablero__
+        jugador = _JUGADORES[signo]
+        for movimiento in jugada:
+            tablero.aplicar(movimiento, jugador)
+        valor = self._azar(-signo, profundidad, ventana)
+        for _ in jugada:
+            tablero.deshacer()
+        return valor
+
+    def _azar(self, signo, profundidad, ventana):  # pylint: disable=too-many-locals
+        """
+        Nodo de azar: promedia las 21 tiradas del jugador signo.
+
+        Star1 corta en cuanto las cotas del evaluador garantizan que el
+        promedio queda fuera de la ventana; Star2 primero busca solo la mejor
+        candidata de cada tirada, lo que da una cota inferior del nodo.
+
+        Returns:
+            float: valor (o cota, si hubo poda) para el jugador signo.
+        """
+        tablero = self.__tablero__
+        if 15 in (tablero.get_fuera('player1'), tablero.get_fuera('player2')):
+            self.__nodos__ += 1
+            return signo * float(self.__evaluador__.evaluar(
+                np.array([tablero.get_conteos()], dtype=np.int8), signo
+            )[0])
+
+        inferior, superior = self.__evaluador__.get_cotas()
+        alfa, beta = max(ventana[0], inferior), min(ventana[1], superior)
+        sondeos = [None] * len(TIRADAS)
+        if profundidad >= 2:
+            sondeos, cota = self._sondear(signo, profundidad, beta)
+            if cota >= beta:
+                return cota
+
+        acumulado, restante = 0.0, 36
+        for (dado1, dado2, peso), sondeo in zip(TIRADAS, sondeos):
+            restante -= peso
+            ventana_hija = (
+                (36 * alfa - acumulado - restante * superior) / peso,
+                (36 * beta - acumulado - restante * inferior) / peso,
+            )
+            _, valor = self._decidir(
+                (signo, dado1, dado2), profundidad, ventana_hija, sondeo
+            )
+            acumulado += peso * valor
+            if acumulado + restante * superior <= 36 * alfa:
+                return (acumulado + restante * superior) / 36
+            if acumulado + restante * inferior >= 36 * beta:
+                return (acumulado + restante * inferior) / 36
+        return acumulado / 36
+
+    def _sondear(self, signo, profundidad, beta):
+        """
+        Busca solo la primera candidata de cada tirada (sondeo de Star2).
+
+        Cada sondeo es una cota inferior del valor de su tirada, así que su
+        promedio acota el nodo de azar por abajo. Los sondeos se reutilizan
+        luego en la búsqueda completa.
+
+        Returns:
+            tuple: (sondeos, cota); la cota es exacta solo si no cortó antes.
+        """
+        inferior, superior = self.__evaluador__.get_cotas()
+        sondeos = [None] * len(TIRADAS)
+        cota, restante = 0.0, 36
+        for i, (dado1, dado2, peso) in enumerate(TIRADAS):
+            candidatas = self._candidatas(signo, dado1, dado2)
+            valor = -self._azar_tras(
+                candidatas[0][1], signo, profundidad - 1, (-superior, -inferior)
+            )
+            sondeos[i] = (valor, candidatas)
+            cota += peso * valor
+            restante -= peso
+            if (cota + restante * inferior) / 36 >= beta:
+                break
+        return sondeos, (cota + restante * inferior) / 36
@@ -21,6 +21,26 @@ class Checker:
         """
         return self.__simbolo__
 
+    def __eq__(self, otra):
+        """
+        Compara dos fichas por su símbolo.
+
+        Returns:
+            bool: True si ambas fichas pertenecen al mismo jugador.
+        """
+        if not isinstance(otra, Checker):
+            return NotImplemented
+        return self.__simbolo__ == otra.get_simbolo()
+
+    def __hash__(self):
+        """
+        Calcula el hash de la ficha a partir de su símbolo.
+
+        Returns:
+            int: hash del símbolo.
+        """
+        return hash(self.__simbolo__)
+
     def __str__(self):
         """
         Representación informal del objeto, usada por print().
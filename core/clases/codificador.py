@@ -0,0 +1,89 @@
+"""
+Módulo que define la codificación estándar de posiciones para evaluadores
+aprendidos.
+
+Cada posición se convierte en las 198 entradas clásicas de TD-Gammon:
+- 0-95: los 24 puntos de X, cuatro unidades por punto (al menos 1, 2 y 3
+  fichas y (n - 3) / 2 para las restantes).
+- 96-191: lo mismo para O.
+- 192 y 193: fichas de X y de O en el bar, divididas por 2.
+- 194 y 195: fichas de X y de O fuera, divididas por 15.
+- 196 y 197: turno de X o de O.
+
+Las unidades de los puntos salen de una tabla indexada por el conteo con
+signo, así que un lote entero se codifica con unas pocas operaciones de
+NumPy y sin recorrer diccionarios.
+"""
+import numpy as np
+
+ENTRADAS = 198
+
+
+def _tabla_unaria(signo):
+    """Tabla 256 x 4 con las unidades de un punto para cada byte de conteo."""
+    tabla = np.zeros((256, 4), dtype=np.float32)
+    for valor in range(-128, 128):
+        fichas = max(signo * valor, 0)
+        tabla[valor & 255] = (
+            fichas >= 1, fichas >= 2, fichas >= 3, max(fichas - 3, 0) / 2
+        )
+    return tabla
+
+
+_UNARIA_X = _tabla_unaria(1)
+_UNARIA_O = _tabla_unaria(-1)
+
+
+def codificar(posiciones, turno=1, out=None):
+    """
+    Codifica una o varias posiciones en las 198 entradas.
+
+    Args:
+        posiciones: un Board, una secuencia de Board, un BoardBatch o un
+            arreglo (N, 28) / secuencia de conteos con el formato de
+            Board.get_conteos.
+        turno: 1 si mueve X a continuación y -1 si mueve O; escalar o
+            arreglo (N,).
+        out: arreglo float32 (N, 198) C-contiguo donde escribir el
+            resultado; si es None se crea uno nuevo.
+
+    Returns:
+        numpy.ndarray: el arreglo (N, 198) con las entradas.
+
+    Raises:
+        ValueError: si out no tiene la forma o el tipo esperados.
+    """
+    conteos = _como_arreglo(posiciones)
+    cantidad = conteos.shape[0]
+    if out is None:
+        out = np.empty((cantidad, ENTRADAS), dtype=np.float32)
+    elif out.shape != (cantidad, ENTRADAS) or out.dtype != np.float32 \
+            or not out.flags.c_contiguous:
+        raise ValueError(
+            f"out debe ser float32 C-contiguo de forma ({cantidad}, {ENTRADAS})."
+        )
+
+    indices = conteos[:, :24].view(np.uint8)
+    out[:, :96].reshape(cantidad, 24, 4)[...] = _UNARIA_X[indices]
+    out[:, 96:192].reshape(cantidad, 24, 4)[...] = _UNARIA_O[indices]
+    np.multiply(conteos[:, 24:26], 0.5, out=out[:, 192:194], casting="unsafe")
+    np.divide(conteos[:, 26:28], 15, out=out[:, 194:196], casting="unsafe")
+    turno = np.broadcast_to(np.asarray(turno), (cantidad,))
+    np.greater(turno, 0, out=out[:, 196], casting="unsafe")
+    np.less(turno, 0, out=out[:, 197], casting="unsafe")
+    return out
+
+
+def _como_arreglo(posiciones):
+    """Convierte cualquiera de las entradas aceptadas en un arreglo (N, 28) int8."""
+    if hasattr(posiciones, "get_conteos"):
+        conteos = posiciones.get_conteos()
+        if isinstance(conteos, tuple):
+            return np.array([conteos], dtype=np.int8)
+        return np.asarray(conteos, dtype=np.int8)
+    if isinstance(posiciones, (list, tuple)) and posiciones \
+            and hasattr(posiciones[0], "get_conteos"):
+        return np.array(
+            [board.get_conteos() for board in posiciones], dtype=np.int8
+        )
+    return np.ascontiguousarray(posiciones, dtype=np.int8).reshape(-1, 28)
@@ -1,15 +1,76 @@
 """Módulo que define la clase Dice para simular lanzamientos de dados en Backgammon."""
 
 import random
+import numpy as np
 
 
 class Dice:
     """Representa un par de dados de seis caras para el juego de Backgammon."""
 
-    def __init__(self):
-        """Inicializa los valores de los dados en cero."""
+    def __init__(self, semilla=None, tam_buffer=0):
+        """
+        Inicializa los valores de los dados en cero.
+
+        Args:
+            semilla: origen de los números aleatorios. Puede ser None (usa el
+                generador global del módulo random), un entero, una
+                numpy.random.SeedSequence o una instancia de random.Random.
+                Con un entero o una SeedSequence cada dado tiene su propio
+                flujo reproducible.
+            tam_buffer: si es mayor que cero, las tiradas se generan en
+                bloques de ese tamaño con numpy y se entregan de a una. Con la
+                misma semilla la secuencia es siempre la misma.
+        """
         self.__dado1__ = 0
         self.__dado2__ = 0
+        if semilla is None or isinstance(semilla, random.Random):
+            self.__semilla__ = None
+            self.__generador__ = semilla if semilla is not None else random
+        else:
+            if not isinstance(semilla, np.random.SeedSequence):
+                semilla = np.random.SeedSequence(semilla)
+            self.__semilla__ = semilla
+            self.__generador__ = random.Random(
+                int.from_bytes(semilla.generate_state(4).tobytes(), "little")
+            )
+        self.__tam_buffer__ = tam_buffer
+        self.__buffer__ = []
+        self.__posicion__ = 0
+        if tam_buffer > 0:
+            # El bloque se llena con numpy a partir de la misma semilla; un
+            # generador externo aporta la semilla del bloque.
+            if self.__semilla__ is None:
+                semilla = np.random.SeedSequence(self.__generador__.getrandbits(128))
+            self.__generador__ = np.random.default_rng(semilla)
+
+    @classmethod
+    def generar_flujos(cls, semilla, cantidad):
+        """
+        Crea varios dados con flujos aleatorios independientes entre sí.
+
+        Usa SeedSequence.spawn, así que cada partida o proceso puede recibir
+        su propio dado sin compartir estado ni quedar correlacionado tras un
+        fork.
+
+        Args:
+            semilla: entero o SeedSequence raíz.
+            cantidad: número de dados a crear.
+
+        Returns:
+            list: instancias de Dice, una por flujo.
+        """
+        if not isinstance(semilla, np.random.SeedSequence):
+            semilla = np.random.SeedSequence(semilla)
+        return [cls(hija) for hija in semilla.spawn(cantidad)]
+
+    def get_semilla(self):
+        """
+        Devuelve la SeedSequence del dado.
+
+        Returns:
+            SeedSequence: semilla del flujo, o None si usa un generador externo.
+        """
+        return self.__semilla__
 
     def lanzar_dados(self):
         """
@@ -18,9 +79,25 @@ class Dice:
         Returns:
             tuple: una tupla con dos enteros entre 1 y 6, representando los valores de los dados.
         """
-        self.__dado1__ = random.randint(1, 6)
-        self.__dado2__ = random.randint(1, 6)
+        if self.__tam_buffer__ > 0:
+            posicion = self.__posicion__
+            if posicion == len(self.__buffer__):
+                self._rellenar_buffer()
+                posicion = 0
+            self.__dado1__ = self.__buffer__[posicion]
+            self.__dado2__ = self.__buffer__[posicion + 1]
+            self.__posicion__ = posicion + 2
+        else:
+            self.__dado1__ = self.__generador__.randint(1, 6)
+            self.__dado2__ = self.__generador__.randint(1, 6)
         return self.__dado1__, self.__dado2__
+
+    def _rellenar_buffer(self):
+        """Genera el siguiente bloque de tiradas de una sola vez."""
+        self.__buffer__ = self.__generador__.integers(
+            1, 7, size=2 * self.__tam_buffer__
+        ).tolist()
+        self.__posicion__ = 0
     def get_valores(self):
         """
         Devuelve los valores actuales de los dados sin lanzar nuevos.
@@ -0,0 +1,327 @@
+"""
+Módulo que define el entrenamiento por autojuego con TD(lambda).
+
+La red juega contra sí misma con las reglas de Board. Muchas partidas
+avanzan a la vez: en cada paso se juntan las jugadas candidatas de todas en
+un único lote para la red, y las trazas de elegibilidad de cada partida se
+actualizan también en lote.
+"""
+import time
+import numpy as np
+from core.clases.board import Board
+from core.clases.codificador import codificar
+from core.clases.dice import Dice
+from core.clases.player import Player
+
+_JUGADORES = {1: Player("player1", "X"), -1: Player("player2", "O")}
+_TABLAS = ()
+CONFIGURACION_POR_DEFECTO = {
+    "alfa": 0.1,
+    "lambda": 0.7,
+    "simultaneas": 32,
+    "max_turnos": 400,
+}
+
+
+class EntrenadorTD:
+    """Entrenador TD(lambda) por autojuego para EvaluadorRed."""
+
+    def __init__(self, red, configuracion=None, semilla=None):
+        """
+        Args:
+            red: EvaluadorRed a entrenar; sus pesos se modifican en el lugar.
+            configuracion: dict que reemplaza valores de
+                CONFIGURACION_POR_DEFECTO ("alfa", "lambda", "simultaneas" y
+                "max_turnos", el tope de turnos por partida; las que lo
+                alcanzan se descartan sin actualizar hacia un resultado).
+            semilla: semilla de los dados de todas las partidas.
+        """
+        self.__red__ = red
+        self.__configuracion__ = dict(CONFIGURACION_POR_DEFECTO, **(configuracion or {}))
+        cantidad = self.__configuracion__["simultaneas"]
+        self.__dados__ = [
+            Dice(hija, tam_buffer=256)
+            for hija in np.random.SeedSequence(semilla).spawn(cantidad)
+        ]
+        self.__partidas__ = [_Partida() for _ in range(cantidad)]
+        self.__estadisticas__ = {
+            "partidas": 0, "descartadas": 0, "pasos": 0, "segundos": 0.0,
+        }
+        self.__trazas__ = None
+        for indice in range(cantidad):
+            self._reiniciar(indice)
+
+    @classmethod
+    def reanudar(cls, ruta, red, semilla=None):
+        """
+        Continúa un entrenamiento desde un punto de control.
+
+        Las partidas en curso no se guardan: se empiezan de nuevo.
+
+        Args:
+            ruta: archivo .npz guardado con guardar_punto.
+            red: EvaluadorRed con la misma arquitectura; recibe los pesos.
+            semilla: semilla de los dados de las partidas nuevas.
+
+        Returns:
+            EntrenadorTD: entrenador con los pesos y contadores guardados.
+        """
+        with np.load(ruta) as datos:
+            for i, (pesos, sesgos) in enumerate(red.get_capas()):
+                pesos[...] = datos[f"pesos_{i}"]
+                sesgos[...] = datos[f"sesgos_{i}"]
+            configuracion = {
+                clave: datos[f"config_{clave}"].tolist()
+                for clave in CONFIGURACION_POR_DEFECTO
+            }
+            contadores = {
+                clave: int(datos[f"contador_{clave}"])
+                for clave in ("partidas", "descartadas", "pasos")
+            }
+            contadores["segundos"] = float(datos["contador_segundos"])
+        entrenador = cls(red, configuracion, semilla)
+        entrenador.__estadisticas__.update(contadores)
+        return entrenador
+
+    def guardar_punto(self, ruta):
+        """
+        Guarda los pesos, la configuración y los contadores en un .npz.
+
+        Args:
+            ruta: archivo de destino.
+        """
+        arreglos = {}
+        for i, (pesos, sesgos) in enumerate(self.__red__.get_capas()):
+            arreglos[f"pesos_{i}"] = pesos
+            arreglos[f"sesgos_{i}"] = sesgos
+        for clave, valor in self.__configuracion__.items():
+            arreglos[f"config_{clave}"] = np.array(valor)
+        for clave, valor in self.__estadisticas__.items():
+            arreglos[f"contador_{clave}"] = np.array(valor)
+        np.savez_compressed(ruta, **arreglos)
+
+    def entrenar(self, partidas, ruta_punto=None, cada=1000):
+        """
+        Juega hasta terminar la cantidad de partidas indicada.
+
+        Args:
+            partidas: partidas a completar en esta llamada, contando las
+                descartadas para que la llamada siempre termine.
+            ruta_punto: archivo de punto de control; None para no guardar.
+            cada: cada cuántas partidas completadas guardar el punto.
+
+        Returns:
+            dict: estadísticas acumuladas (ver get_estadisticas).
+        """
+        objetivo = self._completadas() + partidas
+        proximo_punto = self._completadas() + cada
+        inicio = time.perf_counter()
+        while self._completadas() < objetivo:
+            self.paso()
+            if ruta_punto is not None and self._completadas() >= proximo_punto:
+                self.__estadisticas__["segundos"] += time.perf_counter() - inicio
+                inicio = time.perf_counter()
+                self.guardar_punto(ruta_punto)
+                proximo_punto += cada
+        self.__estadisticas__["segundos"] += time.perf_counter() - inicio
+        if ruta_punto is not None:
+            self.guardar_punto(ruta_punto)
+        return self.get_estadisticas()
+
+    def get_estadisticas(self):
+        """
+        Devuelve los contadores del entrenamiento.
+
+        Returns:
+            dict: "partidas" terminadas, "descartadas" (por el tope de turnos
+            o porque ningún jugador puede ganar),
+            "pasos" (jugadas de todas las partidas), "segundos" y
+            "partidas_por_segundo".
+        """
+        estadisticas = dict(self.__estadisticas__)
+        segundos = estadisticas["segundos"]
+        estadisticas["partidas_por_segundo"] = (
+            estadisticas["partidas"] / segundos if segundos > 0 else 0.0
+        )
+        return estadisticas
+
+    def paso(self):
+        """
+        Hace una jugada en todas las partidas y actualiza los pesos.
+
+        Las jugadas candidatas de todas las partidas se evalúan en un solo
+        lote. Después se calcula el error TD de cada partida entre la
+        predicción anterior y la nueva (o el resultado, si terminó) y se
+        aplica alfa * error * traza sumando sobre las partidas.
+        """
+        partidas = self.__partidas__
+        candidatas, duenos = [], []
+        for indice, partida in enumerate(partidas):
+            dado1, dado2 = self.__dados__[indice].lanzar_dados()
+            pares = partida.board.jugadas_y_posiciones(
+                _JUGADORES[partida.signo], dado1, dado2
+            )
+            candidatas.extend(posicion for _, posicion in pares)
+            duenos.extend([indice] * len(pares))
+
+        if candidatas:
+            lote = np.frombuffer(b"".join(candidatas), dtype=np.int8).reshape(-1, 28)
+            signos = np.array([partidas[i].signo for i in duenos])
+            valores = signos * self.__red__.evaluar(lote, -signos)
+            duenos = np.array(duenos)
+            for indice in np.unique(duenos):
+                filas = np.flatnonzero(duenos == indice)
+                partidas[indice].board.set_conteos(
+                    candidatas[filas[np.argmax(valores[filas])]]
+                )
+        for partida in partidas:
+            partida.signo = -partida.signo
+            partida.turnos += 1
+        self.__estadisticas__["pasos"] += len(partidas)
+        self._actualizar()
+
+    def _completadas(self):
+        """Devuelve las partidas terminadas más las descartadas."""
+        return self.__estadisticas__["partidas"] + self.__estadisticas__["descartadas"]
+
+    def _actualizar(self):
+        """Aplica la actualización TD y renueva las trazas de cada partida."""
+        partidas = self.__partidas__
+        conteos = np.array([p.board.get_conteos() for p in partidas], dtype=np.int8)
+        turnos = np.array([p.signo for p in partidas])
+        salidas, gradientes = self._gradientes(conteos, turnos)
+
+        objetivos, terminadas, descartadas = self._objetivos(conteos, salidas)
+        self._aplicar(objetivos - np.array([p.prediccion for p in partidas]), gradientes)
+        for indice, partida in enumerate(partidas):
+            partida.prediccion = salidas[indice]
+
+        for indice in terminadas:
+            self.__estadisticas__["partidas"] += 1
+            self._reiniciar(indice)
+        for indice in descartadas:
+            self.__estadisticas__["descartadas"] += 1
+            self._reiniciar(indice)
+
+    def _aplicar(self, errores, gradientes):
+        """
+        Suma alfa * error * traza a los pesos y decae las trazas agregando
+        los gradientes nuevos.
+
+        Args:
+            errores: arreglo (G, 3) con el error TD de cada salida.
+            gradientes: gradientes por capa, como los devuelve _gradientes.
+        """
+        alfa = self.__configuracion__["alfa"]
+        for (pesos, sesgos), (traza_pesos, traza_sesgos) in zip(
+                self.__red__.get_capas(), self.__trazas__):
+            pesos += alfa * np.einsum("gk,gkij->ij", errores, traza_pesos)
+            sesgos += alfa * np.einsum("gk,gki->i", errores, traza_sesgos)
+
+        lam = self.__configuracion__["lambda"]
+        for traza, gradiente in zip(self.__trazas__, gradientes):
+            for parte, nueva in zip(traza, gradiente):
+                parte *= lam
+                parte += nueva
+
+    def _objetivos(self, conteos, salidas):
+        """
+        Calcula hacia dónde mover la predicción de cada partida.
+
+        Returns:
+            tuple: (objetivos (G, 3): el resultado en las terminadas y la
+            nueva predicción en las demás, índices de las terminadas,
+            índices de las descartadas).
+        """
+        objetivos = salidas.astype(np.float64)
+        terminadas, descartadas = [], []
+        for indice, partida in enumerate(self.__partidas__):
+            resultado = _resultado(conteos[indice])
+            if resultado == _TABLAS or partida.turnos >= self.__configuracion__["max_turnos"]:
+                descartadas.append(indice)
+            elif resultado is not None:
+                objetivos[indice] = resultado
+                terminadas.append(indice)
+        return objetivos, terminadas, descartadas
+
+    def _gradientes(self, conteos, turnos):
+        """
+        Pasa el lote por la red guardando las activaciones y calcula el
+        gradiente de cada una de las tres salidas respecto de cada peso,
+        por separado para cada posición.
+
+        Returns:
+            tuple: (salidas (G, 3), lista por capa de (dW (G, 3, ent, sal),
+            db (G, 3, sal))).
+        """
+        activaciones = [codificar(conteos, turnos)]
+        for pesos, sesgos in self.__red__.get_capas():
+            activaciones.append(1.0 / (1.0 + np.exp(-(activaciones[-1] @ pesos + sesgos))))
+        salida = activaciones[-1]
+        # delta[g, k, j]: derivada de la salida k respecto de la entrada
+        # neta de la unidad j de la capa actual.
+        delta = salida[:, :, None] * (1 - salida)[:, :, None] * np.eye(salida.shape[1])
+        gradientes = []
+        capas = self.__red__.get_capas()
+        for nivel in range(len(capas) - 1, -1, -1):
+            previa = activaciones[nivel]
+            gradientes.append((np.einsum("gkj,gi->gkij", delta, previa), delta.copy()))
+            if nivel:
+                delta = (delta @ capas[nivel][0].T) * (previa * (1 - previa))[:, None, :]
+        return salida, gradientes[::-1]
+
+    def _reiniciar(self, indice):
+        """Empieza una partida nueva en el lugar indicado y borra su traza."""
+        partida = self.__partidas__[indice]
+        partida.board.set_conteos(Board().get_conteos())
+        partida.signo = 1 if self.__estadisticas__["partidas"] % 2 == 0 else -1
+        partida.turnos = 0
+        conteos = np.array([partida.board.get_conteos()], dtype=np.int8)
+        salidas, gradientes = self._gradientes(conteos, np.array([partida.signo]))
+        partida.prediccion = salidas[0]
+        if self.__trazas__ is None:
+            cantidad = len(self.__partidas__)
+            self.__trazas__ = [
+                (np.zeros((cantidad,) + pesos.shape[1:], dtype=np.float32),
+                 np.zeros((cantidad,) + sesgos.shape[1:], dtype=np.float32))
+                for pesos, sesgos in gradientes
+            ]
+        for traza, gradiente in zip(self.__trazas__, gradientes):
+            for parte, nueva in zip(traza, gradiente):
+                parte[indice] = nueva[0]
+
+
+class _Partida:  # pylint: disable=too-few-public-methods
+    """Estado de una de las partidas que se juegan en paralelo."""
+
+    def __init__(self):
+        """Crea la partida vacía; el entrenador la reinicia antes de usarla."""
+        self.board = Board()
+        self.signo = 1
+        self.turnos = 0
+        self.prediccion = None
+
+
+def _resultado(conteos):
+    """
+    Devuelve las salidas ideales de una partida terminada o None si sigue.
+
+    Con la geometría del tablero una ficha de X en el punto 23 (o de O en
+    el 0) no puede salir nunca, así que ese jugador ya no puede ganar: la
+    partida se da por ganada para el rival, y por descartada si les pasa a
+    los dos. El gammon se decide con las fichas fuera del perdedor en ese
+    momento.
+
+    Returns:
+        tuple: (gana X, gammon de X, gammon de O); _TABLAS si nadie puede
+        ganar; None si la partida sigue.
+    """
+    x_perdida = conteos[23] > 0
+    o_perdida = conteos[0] < 0
+    if conteos[26] == 15 or (o_perdida and not x_perdida):
+        return 1.0, float(conteos[27] == 0), 0.0
+    if conteos[27] == 15 or (x_perdida and not o_perdida):
+        return 0.0, 0.0, float(conteos[26] == 0)
+    if x_perdida and o_perdida:
+        return _TABLAS
+    return None
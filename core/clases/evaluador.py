@@ -0,0 +1,199 @@
+"""
+Módulo que define los evaluadores de posiciones usados por los bots.
+
+Un evaluador recibe un lote de posiciones con el formato de
+Board.get_conteos (arreglo (N, 28)) y, opcionalmente, quién tiene el turno
+en cada una, y devuelve un arreglo (N,) con la equidad de cada una desde el
+punto de vista de X, acotada por get_cotas.
+"""
+import numpy as np
+from core.clases.codificador import ENTRADAS, codificar
+
+# Pips que le faltan a cada casilla para salir, como en calcular_distancia.
+# Con esta geometría una ficha X en el punto 23 (u O en el 0) no puede salir
+# nunca, así que se la cuenta como si estuviera más lejos que el bar.
+_DISTANCIA_X = np.array([23 - i for i in range(23)] + [30], dtype=np.int32)
+_DISTANCIA_O = _DISTANCIA_X[::-1].copy()
+
+
+class EvaluadorHeuristico:
+    """
+    Evaluador rápido basado en la carrera de pips, los puntos hechos, las
+    fichas sueltas y las fichas fuera, todo vectorizado sobre el lote.
+
+    Es simétrico entre los colores: una posición y su reflejo con el otro
+    color en el turno valen lo mismo para quien mueve.
+    """
+
+    SIMETRICO = True
+
+    def __init__(self, escala=30.0):
+        """
+        Args:
+            escala: pips de ventaja que equivalen aproximadamente a una
+                equidad de 0.76 (tanh(1)).
+        """
+        self.__escala__ = escala
+
+    def get_cotas(self):
+        """
+        Devuelve los valores mínimo y máximo que puede tomar evaluar.
+
+        Returns:
+            tuple: (cota_inferior, cota_superior).
+        """
+        return -1.0, 1.0
+
+    def evaluar(self, posiciones, turno=None):  # pylint: disable=unused-argument
+        """
+        Evalúa un lote de posiciones.
+
+        Args:
+            posiciones: arreglo (N, 28) o secuencia de conteos con signo.
+            turno: no se usa; está por compatibilidad con otros evaluadores.
+
+        Returns:
+            numpy.ndarray: equidad (N,) para X en [-1, 1]; 1 o -1 exactos
+            cuando un jugador ya sacó sus 15 fichas.
+        """
+        conteos = np.asarray(posiciones, dtype=np.int8).reshape(-1, 28)
+        puntos = conteos[:, :24].astype(np.int32)
+        fichas_x = np.maximum(puntos, 0)
+        fichas_o = np.maximum(-puntos, 0)
+        pips_x = fichas_x @ _DISTANCIA_X + 23 * conteos[:, 24]
+        pips_o = fichas_o @ _DISTANCIA_O + 23 * conteos[:, 25]
+
+        puntaje = (pips_o - pips_x) / self.__escala__
+        puntaje += 0.08 * ((fichas_x >= 2).sum(axis=1) - (fichas_o >= 2).sum(axis=1))
+        puntaje -= 0.1 * ((fichas_x == 1).sum(axis=1) - (fichas_o == 1).sum(axis=1))
+        puntaje += 0.05 * (conteos[:, 26].astype(np.int32) - conteos[:, 27])
+        equidad = np.tanh(puntaje)
+        equidad[conteos[:, 26] == 15] = 1.0
+        equidad[conteos[:, 27] == 15] = -1.0
+        return equidad
+
+
+class EvaluadorRed:
+    """
+    Red neuronal (perceptrón multicapa) al estilo TD-Gammon hecha con NumPy.
+
+    Recibe las 198 entradas clásicas y devuelve tres probabilidades: que gane
+    X, que X gane con gammon y que O gane con gammon. Todo el lote pasa por
+    cada capa en un solo producto de matrices.
+    """
+
+    ENTRADAS = ENTRADAS
+    SALIDAS = 3
+    # Los pesos no garantizan que valore igual una posición y su reflejo.
+    SIMETRICO = False
+
+    def __init__(self, capas=None, ocultas=40, semilla=None):
+        """
+        Args:
+            capas: lista de tuplas (pesos, sesgos) por capa; si es None se
+                crea una red con una capa oculta de pesos aleatorios chicos.
+            ocultas: neuronas de la capa oculta de la red aleatoria.
+            semilla: semilla de los pesos aleatorios.
+        """
+        if capas is None:
+            generador = np.random.default_rng(semilla)
+            tamanos = (self.ENTRADAS, ocultas, self.SALIDAS)
+            capas = [
+                (generador.normal(0.0, 0.1, (entrada, salida)), np.zeros(salida))
+                for entrada, salida in zip(tamanos, tamanos[1:])
+            ]
+        self.__capas__ = [
+            (np.asarray(pesos, dtype=np.float32), np.asarray(sesgos, dtype=np.float32))
+            for pesos, sesgos in capas
+        ]
+        self.__entradas__ = np.empty((0, ENTRADAS), dtype=np.float32)
+
+    @classmethod
+    def desde_archivo(cls, ruta):
+        """
+        Carga los pesos de un archivo .npz guardado con guardar.
+
+        Args:
+            ruta: archivo .npz con pesos_0, sesgos_0, pesos_1, ...
+
+        Returns:
+            EvaluadorRed: red con esos pesos.
+        """
+        with np.load(ruta) as datos:
+            cantidad = len([clave for clave in datos.files if clave.startswith("pesos_")])
+            return cls([(datos[f"pesos_{i}"], datos[f"sesgos_{i}"]) for i in range(cantidad)])
+
+    def guardar(self, ruta):
+        """
+        Guarda los pesos en un archivo .npz comprimido.
+
+        Args:
+            ruta: archivo de destino.
+        """
+        arreglos = {}
+        for i, (pesos, sesgos) in enumerate(self.__capas__):
+            arreglos[f"pesos_{i}"] = pesos
+            arreglos[f"sesgos_{i}"] = sesgos
+        np.savez_compressed(ruta, **arreglos)
+
+    def get_capas(self):
+        """Devuelve la lista de tuplas (pesos, sesgos) de la red."""
+        return self.__capas__
+
+    def get_cotas(self):
+        """
+        Devuelve los valores mínimo y máximo que puede tomar evaluar.
+
+        Returns:
+            tuple: (cota_inferior, cota_superior); los gammons valen doble.
+        """
+        return -2.0, 2.0
+
+    def probabilidades(self, posiciones, turno=None):
+        """
+        Calcula las salidas de la red para un lote de posiciones.
+
+        Args:
+            posiciones: arreglo (N, 28) o secuencia de conteos con signo.
+            turno: 1 o -1 (escalar o arreglo (N,)) según quién mueve a
+                continuación; por defecto X.
+
+        Returns:
+            numpy.ndarray: arreglo (N, 3) float32 con la probabilidad de que
+            gane X, de que X gane con gammon y de que O gane con gammon.
+        """
+        conteos = np.asarray(posiciones, dtype=np.int8).reshape(-1, 28)
+        if len(self.__entradas__) < len(conteos):
+            self.__entradas__ = np.empty(
+                (max(len(conteos), 2 * len(self.__entradas__)), ENTRADAS),
+                dtype=np.float32,
+            )
+        activacion = codificar(
+            conteos, 1 if turno is None else turno,
+            out=self.__entradas__[:len(conteos)]
+        )
+        for pesos, sesgos in self.__capas__:
+            activacion = activacion @ pesos
+            activacion += sesgos
+            activacion = 1.0 / (1.0 + np.exp(-activacion))
+        return activacion
+
+    def evaluar(self, posiciones, turno=None):
+        """
+        Evalúa un lote de posiciones.
+
+        Args:
+            posiciones: arreglo (N, 28) o secuencia de conteos con signo.
+            turno: ver probabilidades.
+
+        Returns:
+            numpy.ndarray: equidad (N,) para X: 2 * P(gana X) - 1 más los
+            gammons de X menos los de O; 1 o -1 exactos en posiciones
+            terminadas.
+        """
+        conteos = np.asarray(posiciones, dtype=np.int8).reshape(-1, 28)
+        salidas = self.probabilidades(conteos, turno).astype(np.float64)
+        equidad = 2 * salidas[:, 0] - 1 + salidas[:, 1] - salidas[:, 2]
+        equidad[conteos[:, 26] == 15] = 1.0
+        equidad[conteos[:, 27] == 15] = -1.0
+        return equidad
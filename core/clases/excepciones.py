@@ -54,6 +54,9 @@ class PosicionBloqueadaError(ErrorTablero):
 class MovimientoContraDireccionError(ErrorTablero):
     """Se lanza cuando un jugador intenta moverse en dirección contraria."""
 
+class IdPosicionInvalidoError(ErrorTablero):
+    """Se lanza cuando un ID de posición no describe una posición válida."""
+
 # Errores a nivel de dados
 class ErrorDados(ErrorBackgammon):
     """Excepción base para errores relacionados con los dados."""
@@ -74,6 +77,16 @@ class ErrorEntrada(ErrorBackgammon):
 class FormatoMovimientoInvalidoError(ErrorEntrada):
     """Se lanza cuando el formato del movimiento no es correcto."""
 
+class RegistroInvalidoError(ErrorEntrada):
+    """Se lanza cuando un archivo de partidas está dañado o tiene otro formato."""
+
+# Errores de archivos de datos
+class ErrorArchivo(ErrorBackgammon):
+    """Excepción base para errores de los archivos de datos precalculados."""
+
+class FormatoArchivoInvalidoError(ErrorArchivo):
+    """Se lanza cuando un archivo de datos está dañado o tiene otro formato."""
+
 # Errores de jugador
 class ErrorJugador(ErrorBackgammon):
     """Excepción base para errores relacionados con jugadores."""
@@ -0,0 +1,283 @@
+"""
+Módulo que define la importación y exportación de archivos de match en el
+formato de texto habitual (el que escriben GNU Backgammon y Jellyfish).
+
+Cada partida empieza con una línea "Game n", sigue con los nombres y
+puntajes de los jugadores y después con una línea numerada por cada par de
+turnos: a la izquierda el primer jugador, que acá juega con X, y a la
+derecha el segundo, con O. Cada turno es la tirada seguida de los
+movimientos, por ejemplo "31: 8/5 6/5" o "62: 24/18* 13/11".
+
+Los puntos se cuentan desde el jugador que mueve: el punto n de X es la
+casilla 24 - n y el de O la casilla n - 1; "bar" es "bar" y "off" es
+"fuera". Con la geometría de Board el punto 1 de cada jugador es la casilla
+de la que no se sale, así que las distancias de las entradas desde el bar y
+de las salidas quedan un pip más cortas que el dado que las anota: una
+entrada con un 4 se escribe "bar/20" y una salida desde el punto 6 usa el 5.
+Esas jugadas no se pueden pasar a la geometría estándar sin cambiar la
+posición, así que al leer cada turno se reproduce en un tablero y se
+rechaza si no es una de las jugadas legales de Board.
+"""
+import re
+from array import array
+from core.clases.board import Board
+from core.clases.excepciones import FormatoMovimientoInvalidoError, MovimientoInvalidoError
+from core.clases.player import Player
+from core.clases.rollout import tipo_de_victoria
+
+_JUEGO = re.compile(r"^\s*Game\s+\d+\s*$", re.IGNORECASE)
+_LINEA_TURNOS = re.compile(r"^\s*(\d+)\)(.*)$")
+_NOMBRES = re.compile(r"^\s*(.+?)\s*:\s*-?\d+\s+(.+?)\s*:\s*-?\d+\s*$")
+_TIRADA = re.compile(r"(?<!\S)([1-6])([1-6]):")
+_MOVIMIENTO = re.compile(r"^(bar|\d+)((?:/(?:\d+|off)\*?)+)(?:\((\d)\))?$")
+_JUGADORES = {"X": Player("player1", "X"), "O": Player("player2", "O")}
+_SIGNO = {"X": 1, "O": -1}
+_ANCHO_COLUMNA = 28
+
+
+def leer_match(lineas):
+    """
+    Recorre las partidas de un archivo de match línea por línea.
+
+    Solo se guarda en memoria la partida que se está leyendo, así que sirve
+    para archivos de cualquier tamaño. Las acciones del cubo y las líneas
+    "Wins" se ignoran. Cada turno se reproduce en un tablero para comprobar
+    que sea legal.
+
+    Args:
+        lineas: iterable de líneas de texto, por ejemplo el archivo abierto.
+
+    Yields:
+        dict: cada partida con el formato de BackgammonGame.get_registro
+        ("semilla" es None). Un jugador que no anotó turno entre dos del
+        rival queda con un turno pasado sin tirar, (0, 0, []).
+
+    Raises:
+        FormatoMovimientoInvalidoError: si un movimiento no se puede leer o
+            una jugada no es legal en la posición a la que llegó la partida
+            (por ejemplo una entrada o una salida anotada con la geometría
+            estándar).
+    """
+    partida, board = None, Board()
+    for numero, linea in enumerate(lineas, start=1):
+        if _JUEGO.match(linea):
+            if partida is not None:
+                yield partida
+            partida, board = _partida_nueva(), Board()
+            continue
+        turnos = _LINEA_TURNOS.match(linea)
+        if turnos:
+            if partida is None:
+                partida = _partida_nueva()
+            try:
+                for ficha, turno in _turnos_de_linea(turnos.group(2)):
+                    _agregar_turno(partida, ficha, _reproducir_turno(board, ficha, turno))
+            except FormatoMovimientoInvalidoError as error:
+                raise FormatoMovimientoInvalidoError(f"Línea {numero}: {error}") from error
+            continue
+        nombres = _NOMBRES.match(linea)
+        if nombres and partida is not None and not partida["turnos"]:
+            partida["jugadores"] = (nombres.group(1), nombres.group(2))
+    if partida is not None:
+        yield partida
+
+
+def escribir_match(registros, largo=0):
+    """
+    Genera las líneas de un archivo de match con varias partidas.
+
+    Las partidas se reproducen en un tablero para marcar con "*" los
+    movimientos que comen y para anotar cuántos puntos gana cada una. Las
+    entradas y salidas quedan anotadas con la geometría de Board, así que
+    el archivo se vuelve a leer con leer_match pero un programa que use la
+    geometría estándar puede rechazarlo.
+
+    Args:
+        registros: iterable de partidas con el formato de
+            BackgammonGame.get_registro.
+        largo: puntos del match; 0 para partidas sueltas.
+
+    Yields:
+        str: cada línea del archivo, terminada en salto de línea.
+
+    Raises:
+        MovimientoInvalidoError: si una jugada no se puede hacer en la
+            posición a la que llegó la partida.
+    """
+    yield f" {largo} point match\n"
+    puntajes = [0, 0]
+    for numero, registro in enumerate(registros, start=1):
+        yield from _lineas_partida(registro, numero, puntajes)
+
+
+def parsear_jugada(texto, ficha):
+    """
+    Convierte los movimientos de un turno en notación de match.
+
+    Args:
+        texto: movimientos separados por espacios, por ejemplo
+            "24/18 13/11*", "bar/20", "6/off" o "13/9(2)".
+        ficha: 'X' u 'O', el jugador que mueve.
+
+    Returns:
+        list: tuplas (desde, hasta) con las casillas de Board.
+
+    Raises:
+        FormatoMovimientoInvalidoError: si algún movimiento no se puede leer.
+    """
+    jugada = []
+    for token in texto.split():
+        coincidencia = _MOVIMIENTO.match(token.lower())
+        if not coincidencia:
+            raise FormatoMovimientoInvalidoError(f"Movimiento inválido: {token!r}.")
+        puntos = [coincidencia.group(1)] + coincidencia.group(2).replace("*", "").split("/")[1:]
+        casillas = [_casilla(punto, ficha, i == 0) for i, punto in enumerate(puntos)]
+        jugada += list(zip(casillas, casillas[1:])) * int(coincidencia.group(3) or 1)
+    return jugada
+
+
+def formatear_jugada(board, ficha, jugada):
+    """
+    Hace la jugada en el tablero y devuelve su notación de match.
+
+    Args:
+        board: tablero con la posición anterior a la jugada; se modifica.
+        ficha: 'X' u 'O', el jugador que mueve.
+        jugada: tuplas (desde, hasta) con las casillas de Board.
+
+    Returns:
+        str: los movimientos separados por espacios, con "*" en los que
+        comen.
+
+    Raises:
+        MovimientoInvalidoError: si un movimiento no se puede hacer.
+    """
+    textos = []
+    for desde, hasta in jugada:
+        comio = board.aplicar((desde, hasta), _JUGADORES[ficha])
+        textos.append(f"{_punto(desde, ficha)}/{_punto(hasta, ficha)}{'*' if comio else ''}")
+    return " ".join(textos)
+
+
+def _partida_nueva():
+    """Devuelve una partida vacía con los nombres por defecto."""
+    return {"jugadores": ("player1", "player2"), "semilla": None, "empieza": "X", "turnos": []}
+
+
+def _turnos_de_linea(texto):
+    """
+    Devuelve los turnos (ficha, (dado1, dado2, jugada)) de una línea
+    numerada, sin el número.
+    """
+    turnos = []
+    for indice, tirada in enumerate(_TIRADA.finditer(texto)):
+        # Solo el turno que empieza pegado al número es de la columna izquierda.
+        izquierda = indice == 0 and tirada.start() <= 3 and not texto[:tirada.start()].strip()
+        ficha = "X" if izquierda else "O"
+        movimientos = []
+        for token in texto[tirada.end():].split():
+            if _TIRADA.fullmatch(token) or \
+                    (token[0].isalpha() and not token.lower().startswith("bar")):
+                break
+            movimientos.append(token)
+        jugada = parsear_jugada(" ".join(movimientos), ficha)
+        turnos.append((ficha, (int(tirada.group(1)), int(tirada.group(2)), jugada)))
+    return turnos
+
+
+def _agregar_turno(partida, ficha, turno):
+    """Agrega un turno y completa con uno pasado si el rival no anotó el suyo."""
+    turnos = partida["turnos"]
+    if not turnos:
+        partida["empieza"] = ficha
+    elif (ficha == partida["empieza"]) != (len(turnos) % 2 == 0):
+        turnos.append((0, 0, []))
+    turnos.append(turno)
+
+
+def _reproducir_turno(board, ficha, turno):
+    """
+    Hace la jugada en el tablero si es una de las legales para la tirada y
+    devuelve el turno. Un movimiento que junta dos dados, como "24/13", se
+    reemplaza por la jugada de Board que llega a la misma posición.
+
+    Raises:
+        FormatoMovimientoInvalidoError: si la jugada no es legal.
+    """
+    dado1, dado2, jugada = turno
+    if not dado1:
+        return turno
+    legales = {
+        posicion: legal for legal, posicion in
+        board.jugadas_y_posiciones(_JUGADORES[ficha], dado1, dado2)
+    }
+    mensaje = f"La jugada {dado1}{dado2}: {jugada} de {ficha} no es legal en este tablero."
+    try:
+        for movimiento in jugada:
+            board.aplicar(movimiento, _JUGADORES[ficha])
+    except MovimientoInvalidoError as error:
+        raise FormatoMovimientoInvalidoError(mensaje) from error
+    if not legales and not jugada:
+        return turno
+    legal = legales.get(array("b", board.get_conteos()).tobytes())
+    if legal is None:
+        raise FormatoMovimientoInvalidoError(mensaje)
+    return (dado1, dado2, jugada if len(jugada) == len(legal) else legal)
+
+
+def _lineas_partida(registro, numero, puntajes):
+    """Genera las líneas de una partida y suma sus puntos al ganador."""
+    nombres = registro["jugadores"]
+    yield "\n"
+    yield f" Game {numero}\n"
+    yield f" {f'{nombres[0]} : {puntajes[0]}':<33} {nombres[1]} : {puntajes[1]}\n"
+
+    board = Board()
+    columnas = _columnas(registro, board)
+    for indice in range(0, len(columnas), 2):
+        derecha = columnas[indice + 1] if indice + 1 < len(columnas) else ""
+        linea = f"{indice // 2 + 1:3d}) {columnas[indice]:<{_ANCHO_COLUMNA}} {derecha}"
+        yield linea.rstrip() + "\n"
+
+    for indice, clave in enumerate(("player1", "player2")):
+        if board.get_fuera(clave) == 15:
+            puntos = tipo_de_victoria(board, 1 - 2 * indice)
+            puntajes[indice] += puntos
+            sangria = " " * (6 if indice == 0 else _ANCHO_COLUMNA + 11)
+            yield f"{sangria}Wins {puntos} point{'s' if puntos > 1 else ''}\n"
+
+
+def _columnas(registro, board):
+    """
+    Reproduce los turnos en el tablero y devuelve el texto de cada uno, con
+    una columna vacía al principio si empieza O.
+    """
+    columnas = [""] if registro["empieza"] == "O" else []
+    ficha = registro["empieza"]
+    for dado1, dado2, jugada in registro["turnos"]:
+        if dado1:
+            columnas.append(f"{dado1}{dado2}: {formatear_jugada(board, ficha, jugada)}".rstrip())
+        else:
+            columnas.append("")
+        ficha = "O" if ficha == "X" else "X"
+    return columnas
+
+
+def _casilla(punto, ficha, origen):
+    """Convierte un punto de la notación en la casilla de Board."""
+    if origen and punto in ("bar", "25"):
+        return "bar"
+    if not origen and punto in ("off", "0"):
+        return "fuera"
+    if not punto.isdigit() or not 1 <= int(punto) <= 24:
+        raise FormatoMovimientoInvalidoError(f"Punto inválido: {punto!r}.")
+    return 24 - int(punto) if _SIGNO[ficha] > 0 else int(punto) - 1
+
+
+def _punto(casilla, ficha):
+    """Convierte una casilla de Board en el punto de la notación."""
+    if casilla == "bar":
+        return "bar"
+    if casilla == "fuera":
+        return "off"
+    return 24 - casilla if _SIGNO[ficha] > 0 else casilla + 1
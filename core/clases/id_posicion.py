@@ -0,0 +1,136 @@
+"""
+Módulo que define el ID de posición compacto, compatible con el de GNU
+Backgammon.
+
+La posición se guarda en 80 bits (10 bytes): para cada jugador, primero el
+que no tiene el turno y después el que lo tiene, se recorren sus 24 puntos
+desde su punto 1 hasta su punto 24 y luego su bar, escribiendo un 1 por cada
+ficha y un 0 al terminar cada casilla. Los bits se llenan desde el menos
+significativo de cada byte y los 10 bytes se pasan a base64 sin relleno, lo
+que da 14 caracteres. Las fichas fuera no se guardan: son las que faltan
+para 15.
+
+El punto n de X (1 a 24) es la casilla 24 - n de Board y el de O es la
+casilla n - 1, en el orden en que se dibuja el tablero. Con la geometría de
+Board el punto 1 de cada jugador es el que no tiene salida, así que la
+distancia en pips de un punto es uno menos que su número.
+"""
+import base64
+import binascii
+from core.clases.excepciones import IdPosicionInvalidoError
+
+BYTES_ID = 10
+LARGO_ID = 14
+# Casillas de Board de cada color, del punto 1 al 24 y luego el bar.
+_CASILLAS = {
+    1: tuple(23 - i for i in range(24)) + (24,),
+    -1: tuple(range(24)) + (25,),
+}
+
+
+def empaquetar(conteos, signo=1):
+    """
+    Empaqueta una posición en los 10 bytes del ID.
+
+    Args:
+        conteos: secuencia de 28 conteos con el formato de Board.get_conteos.
+        signo: 1 si X tiene el turno, -1 si lo tiene O.
+
+    Returns:
+        bytes: los 10 bytes del ID.
+    """
+    clave, bit = 0, 0
+    for color in (-signo, signo):
+        casillas = _CASILLAS[color]
+        for casilla in casillas[:24]:
+            fichas = conteos[casilla] * color
+            if fichas > 0:
+                clave |= ((1 << fichas) - 1) << bit
+                bit += fichas
+            bit += 1
+        fichas = conteos[casillas[24]]
+        clave |= ((1 << fichas) - 1) << bit
+        bit += fichas + 1
+    return clave.to_bytes(BYTES_ID, "little")
+
+
+def desempaquetar(datos, signo=1):
+    """
+    Recupera la posición de los 10 bytes del ID.
+
+    Args:
+        datos: bytes devueltos por empaquetar.
+        signo: 1 si X tiene el turno, -1 si lo tiene O.
+
+    Returns:
+        tuple: 28 conteos con el formato de Board.get_conteos.
+
+    Raises:
+        IdPosicionInvalidoError: si los bytes no describen una posición
+            válida.
+    """
+    if len(datos) != BYTES_ID:
+        raise IdPosicionInvalidoError(f"Se esperaban {BYTES_ID} bytes, se recibieron {len(datos)}.")
+    bits = format(int.from_bytes(datos, "little"), f"0{8 * BYTES_ID}b")[::-1]
+    tramos = bits.split("0")
+    if len(tramos) <= 50 or "1" in "".join(tramos[50:]):
+        raise IdPosicionInvalidoError("El ID tiene bits de más.")
+
+    conteos = [0] * 28
+    for color, tramos_color in ((-signo, tramos[:25]), (signo, tramos[25:50])):
+        casillas = _CASILLAS[color]
+        total = 0
+        for casilla, tramo in zip(casillas, tramos_color):
+            fichas = len(tramo)
+            total += fichas
+            if not fichas:
+                continue
+            if casilla < 24:
+                if conteos[casilla]:
+                    raise IdPosicionInvalidoError(
+                        f"Los dos jugadores tienen fichas en la casilla {casilla}."
+                    )
+                conteos[casilla] = color * fichas
+            else:
+                conteos[casilla] = fichas
+        if total > 15:
+            raise IdPosicionInvalidoError(f"Un jugador tiene {total} fichas.")
+        conteos[26 if color > 0 else 27] = 15 - total
+    return tuple(conteos)
+
+
+def codificar_id(conteos, signo=1):
+    """
+    Devuelve el ID de posición de 14 caracteres en base64.
+
+    Args:
+        conteos: secuencia de 28 conteos con el formato de Board.get_conteos.
+        signo: 1 si X tiene el turno, -1 si lo tiene O.
+
+    Returns:
+        str: el ID, por ejemplo "4HPwATDgc/ABMA" para la posición inicial.
+    """
+    return base64.b64encode(empaquetar(conteos, signo))[:LARGO_ID].decode("ascii")
+
+
+def decodificar_id(texto, signo=1):
+    """
+    Recupera la posición de un ID en base64.
+
+    Args:
+        texto: ID de 14 caracteres.
+        signo: 1 si X tiene el turno, -1 si lo tiene O.
+
+    Returns:
+        tuple: 28 conteos con el formato de Board.get_conteos.
+
+    Raises:
+        IdPosicionInvalidoError: si el texto no es un ID válido.
+    """
+    if len(texto) != LARGO_ID:
+        raise IdPosicionInvalidoError(f"El ID debe tener {LARGO_ID} caracteres: {texto!r}.")
+    try:
+        datos = base64.b64decode(texto + "==", validate=True)
+    except (binascii.Error, ValueError) as error:
+        raise IdPosicionInvalidoError(f"El ID no es base64 válido: {texto!r}.") from error
+    return desempaquetar(datos, signo)
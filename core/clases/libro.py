@@ -0,0 +1,269 @@
+"""
+Módulo que define el libro de aperturas de los bots.
+
+El libro guarda la jugada elegida para la primera jugada de la partida y
+para la respuesta del rival, en las 21 tiradas, indexada por la clave
+canónica de la posición con los dados (Board.hash_canonico): cada posición
+se guarda una sola vez, vista desde X, y sirve para los dos colores. Se llena
+una vez, fuera de la partida, con rollouts de las mejores candidatas, y se
+guarda en un archivo binario chico que se lee recién en la primera consulta.
+La cabecera anota con cuántas partidas por candidata, cuántas candidatas y
+qué semilla se calculó.
+
+Cada registro ocupa 16 bytes: la clave (uint64) y hasta cuatro movimientos
+(desde, hasta) de un byte cada extremo, con 24 para el bar, 25 para fuera y
+-1 en los lugares sin usar. Los registros se guardan ordenados por clave y se
+buscan con búsqueda binaria.
+"""
+import os
+import struct
+import numpy as np
+from core.clases.board import Board, reflejar_jugada
+from core.clases.bot import BotExpectiminimax, TIRADAS
+from core.clases.evaluador import EvaluadorHeuristico
+from core.clases.excepciones import FormatoArchivoInvalidoError
+from core.clases.player import Player
+from core.clases.rollout import Rollout
+
+RUTA_POR_DEFECTO = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "datos", "libro_aperturas.bin",
+)
+_MAGICO = b"BGL3"
+# Mágico, registros, partidas por candidata, candidatas y semilla.
+_CABECERA = struct.Struct("<4sIIHQ")
+_REGISTRO = np.dtype([("clave", "<u8"), ("jugada", "i1", (4, 2))])
+_CODIGO = {"bar": 24, "fuera": 25}
+_EXTREMO = {24: "bar", 25: "fuera"}
+_JUGADORES = {1: Player("player1", "X"), -1: Player("player2", "O")}
+
+
+class LibroAperturas:
+    """Libro de aperturas que se carga del archivo en la primera consulta."""
+
+    def __init__(self, ruta=RUTA_POR_DEFECTO):
+        """
+        Args:
+            ruta: archivo generado con generar_libro. No se abre hasta que
+                se busca la primera jugada.
+        """
+        self.__ruta__ = ruta
+        self.__claves__ = None
+        self.__jugadas__ = None
+        self.__configuracion__ = None
+
+    def esta_cargado(self):
+        """Indica si el archivo ya se leyó."""
+        return self.__claves__ is not None
+
+    def get_cantidad(self):
+        """
+        Devuelve cuántas jugadas tiene el libro (lo carga si hace falta).
+
+        Returns:
+            int: cantidad de registros.
+        """
+        self._cargar()
+        return len(self.__claves__)
+
+    def get_configuracion(self):
+        """
+        Devuelve con qué parámetros se generó el libro (lo carga si hace
+        falta).
+
+        Returns:
+            dict: "partidas" por candidata en los rollouts (0 si solo se usó
+            la evaluación estática), "candidatas" por tirada y "semilla".
+        """
+        self._cargar()
+        return dict(self.__configuracion__)
+
+    def buscar(self, board, jugador, dado1, dado2):
+        """
+        Busca la jugada del libro para la posición y la tirada.
+
+        Args:
+            board: tablero con la posición actual.
+            jugador: objeto Player que tiene el turno.
+            dado1: valor del primer dado.
+            dado2: valor del segundo dado.
+
+        Returns:
+            list: tuplas (desde, hasta) aceptadas por mover_ficha, o None si
+            la posición no está en el libro.
+
+        Raises:
+            FormatoArchivoInvalidoError: si el archivo no tiene el formato
+                esperado.
+        """
+        self._cargar()
+        clave = board.hash_canonico(jugador, (dado1, dado2))
+        indice = int(np.searchsorted(self.__claves__, clave))
+        if indice == len(self.__claves__) or self.__claves__[indice] != clave:
+            return None
+        jugada = _decodificar(self.__jugadas__[indice])
+        return jugada if jugador.get_ficha() == 'X' else reflejar_jugada(jugada)
+
+    def _cargar(self):
+        """Lee el archivo completo la primera vez que se lo necesita."""
+        if self.__claves__ is not None:
+            return
+        with open(self.__ruta__, "rb") as archivo:
+            cabecera = archivo.read(_CABECERA.size)
+            if len(cabecera) != _CABECERA.size or cabecera[:4] != _MAGICO:
+                raise FormatoArchivoInvalidoError(f"{self.__ruta__} no es un libro de aperturas.")
+            _, total, partidas, candidatas, semilla = _CABECERA.unpack(cabecera)
+            registros = np.fromfile(archivo, dtype=_REGISTRO, count=total)
+        self.__configuracion__ = {
+            "partidas": partidas, "candidatas": candidatas, "semilla": semilla,
+        }
+        self.__jugadas__ = registros["jugada"]
+        self.__claves__ = registros["clave"]
+
+
+def generar_libro(ruta, rollout=None, candidatas=3, semilla=0):
+    """
+    Calcula el libro y lo guarda en un archivo binario.
+
+    Para la primera jugada de X en las 21 tiradas y para la respuesta de O a
+    cada una de ellas (otra vez en las 21 tiradas) se ordenan las jugadas con
+    EvaluadorHeuristico; las mejores, junto con la que elige
+    BotExpectiminimax a dos jugadas, pasan a un rollout con la misma semilla
+    para todas y se guarda la de mayor equidad. Como la posición inicial es
+    simétrica y las claves son canónicas, las mismas entradas sirven cuando
+    abre O.
+
+    Args:
+        ruta: archivo de salida.
+        rollout: Rollout usado para comparar candidatas; por defecto uno de
+            1296 partidas por candidata.
+        candidatas: jugadas por tirada que pasan al rollout, contando la
+            del bot; con 1 se usa solo la evaluación estática.
+        semilla: semilla de los dados de los rollouts.
+
+    Returns:
+        int: cantidad de jugadas guardadas.
+    """
+    rollout = rollout if rollout is not None else Rollout()
+    evaluador = EvaluadorHeuristico()
+    analizadores = (evaluador, rollout, BotExpectiminimax(evaluador))
+    board = Board()
+    entradas = {}
+    for dado1, dado2, _ in TIRADAS:
+        board.set_conteos(Board().get_conteos())
+        apertura, posicion = _mejor_jugada(
+            board, (1, dado1, dado2), analizadores, (candidatas, semilla)
+        )
+        _agregar(entradas, board, (1, dado1, dado2), apertura)
+        board.set_conteos(posicion)
+        for respuesta1, respuesta2, _ in TIRADAS:
+            respuesta, _ = _mejor_jugada(
+                board, (-1, respuesta1, respuesta2), analizadores, (candidatas, semilla)
+            )
+            _agregar(entradas, board, (-1, respuesta1, respuesta2), respuesta)
+
+    _guardar(ruta, entradas, (
+        rollout.get_cantidad() if candidatas > 1 else 0, candidatas, semilla
+    ))
+    return len(entradas)
+
+
+def _guardar(ruta, entradas, configuracion):
+    """
+    Escribe los registros ordenados por clave con su cabecera; configuracion
+    es la tupla (partidas, candidatas, semilla).
+    """
+    registros = np.zeros(len(entradas), dtype=_REGISTRO)
+    for i, clave in enumerate(sorted(entradas)):
+        registros[i] = (clave, entradas[clave])
+    with open(ruta, "wb") as archivo:
+        archivo.write(_CABECERA.pack(_MAGICO, len(registros), *configuracion))
+        registros.tofile(archivo)
+
+
+def _mejor_jugada(board, nodo, analizadores, opciones):
+    """
+    Elige la jugada de una tirada: ordena con el evaluador, suma la jugada
+    del bot a las mejores y las desempata con rollouts.
+
+    Args:
+        board: tablero con la posición; no se modifica.
+        nodo: tupla (signo, dado1, dado2).
+        analizadores: tupla (evaluador, rollout, bot); bot puede ser None.
+        opciones: tupla (candidatas, semilla).
+
+    Returns:
+        tuple: (jugada, posición resultante en bytes); ([], None) si no hay
+        movimientos.
+    """
+    signo, dado1, dado2 = nodo
+    evaluador, rollout, bot = analizadores
+    candidatas, semilla = opciones
+    pares = board.jugadas_y_posiciones(_JUGADORES[signo], dado1, dado2)
+    if not pares:
+        return [], None
+    ordenados = _ordenar(pares, signo, evaluador)
+    pares = ordenados[:max(candidatas, 1)]
+    if candidatas > 1 and bot is not None:
+        jugada = bot.elegir_jugada(board, _JUGADORES[signo], dado1, dado2)
+        pares = _sumar_jugada(pares, ordenados, jugada)
+    if len(pares) == 1:
+        return pares[0]
+    return _desempatar(pares, signo, rollout, semilla)
+
+
+def _sumar_jugada(pares, ordenados, jugada):
+    """
+    Devuelve las candidatas con el par de jugada en lugar de la última si
+    no estaba entre ellas.
+    """
+    elegidos = [par for par in ordenados if par[0] == jugada]
+    if not elegidos or elegidos[0] in pares:
+        return pares
+    return pares[:-1] + elegidos[:1]
+
+
+def _ordenar(pares, signo, evaluador):
+    """Ordena los pares (jugada, posición) de mejor a peor para el jugador."""
+    posiciones = np.frombuffer(
+        b"".join(posicion for _, posicion in pares), dtype=np.int8
+    ).reshape(len(pares), -1)
+    orden = np.argsort(-signo * evaluador.evaluar(posiciones, -signo), kind="stable")
+    return [pares[i] for i in orden]
+
+
+def _desempatar(pares, signo, rollout, semilla):
+    """
+    Hace un rollout de cada candidata con la misma semilla y devuelve el par
+    de mayor equidad para el jugador signo.
+    """
+    tablero = Board()
+    equidades = []
+    for _, posicion in pares:
+        tablero.set_conteos(posicion)
+        # El rollout responde desde el punto de vista del rival, que tira.
+        equidades.append(-rollout.ejecutar(tablero, _JUGADORES[-signo], semilla)["equidad"][0])
+    return pares[int(np.argmax(equidades))]
+
+
+def _agregar(entradas, board, nodo, jugada):
+    """Guarda la jugada con la clave canónica, vista desde X."""
+    signo, dado1, dado2 = nodo
+    clave = board.hash_canonico(_JUGADORES[signo], (dado1, dado2))
+    entradas[clave] = _codificar(jugada if signo > 0 else reflejar_jugada(jugada))
+
+
+def _codificar(jugada):
+    """Convierte una jugada en el arreglo (4, 2) de un registro."""
+    codigo = np.full((4, 2), -1, dtype=np.int8)
+    for i, (desde, hasta) in enumerate(jugada):
+        codigo[i] = (_CODIGO.get(desde, desde), _CODIGO.get(hasta, hasta))
+    return codigo
+
+
+def _decodificar(codigo):
+    """Convierte el arreglo (4, 2) de un registro en una jugada."""
+    return [
+        (_EXTREMO.get(int(desde), int(desde)), _EXTREMO.get(int(hasta), int(hasta)))
+        for desde, hasta in codigo if desde >= 0
+    ]
@@ -18,11 +18,9 @@ class Player:
 
     def fichas_en_tablero(self, board):
         """Cuenta cuántas fichas del jugador hay en el tablero."""
-        posiciones = board.get_tablero()["posiciones"]
-        return sum(
-            1 for pila in posiciones for ficha in pila
-            if ficha.get_simbolo() == self.__ficha__
-        )
+        # Player con ficha 'X' es player1, con ficha 'O' es player2
+        player_key = 'player1' if self.__ficha__ == 'X' else 'player2'
+        return board.get_fichas_en_tablero(player_key)
 
     def fichas_en_bar(self, board):
         """Devuelve cuántas fichas del jugador están en el bar."""
@@ -35,6 +33,13 @@ class Player:
         # Player con ficha 'X' es player1, con ficha 'O' es player2
         player_key = 'player1' if self.__ficha__ == 'X' else 'player2'
         return board.get_fuera(player_key)
+
+    def pips(self, board):
+        """Devuelve la cuenta de pips que le falta al jugador para salir."""
+        # Player con ficha 'X' es player1, con ficha 'O' es player2
+        player_key = 'player1' if self.__ficha__ == 'X' else 'player2'
+        return board.get_pips(player_key)
+
     def estado_jugador(self, board):
         """Devuelve un resumen del estado actual del jugador."""
         en_tablero = self.fichas_en_tablero(board)
@@ -48,5 +53,6 @@ class Player:
             "en_tablero": en_tablero,
             "en_bar": en_bar,
             "sacadas": sacadas,
+            "pips": self.pips(board),
             "total": total
         }
@@ -0,0 +1,214 @@
+"""
+Módulo que define el formato binario de los registros de partidas.
+
+Un archivo de registros empieza con los 4 bytes b"BGR1" y sigue con las
+partidas una detrás de otra, así que se puede seguir agregando al final. Cada
+partida tiene una cabecera de 15 bytes (largo de los turnos, semilla,
+banderas y largo de los dos nombres), los nombres en UTF-8 y los turnos:
+
+- un byte con los dados y la cantidad de movimientos: (dado1 - 1) * 6 +
+  (dado2 - 1) + 36 * movimientos; 255 marca un turno pasado sin tirar.
+- un byte por movimiento: los 5 bits bajos son el origen (0 a 23, o 24 para
+  el bar) y los 3 altos el dado usado (1 a 6), o 0 si la ficha sale.
+
+Los turnos se alternan entre los colores empezando por el que indica la
+cabecera, que es lo que permite reconstruir el destino de cada movimiento.
+"""
+import struct
+from core.clases.excepciones import RegistroInvalidoError
+
+_MAGICO = b"BGR1"
+# Largo de los turnos en bytes, semilla, banderas y largo de cada nombre.
+_PARTIDA = struct.Struct("<IQBBB")
+_EMPIEZA_O = 1
+_CON_SEMILLA = 2
+_PASADO = 255
+_SIGNO = {"X": 1, "O": -1}
+
+
+class EscritorRegistros:
+    """Agrega partidas al final de un archivo, escribiéndolas por bloques."""
+
+    def __init__(self, ruta, tamano_buffer=1 << 20):
+        """
+        Args:
+            ruta: archivo de registros; se crea si no existe.
+            tamano_buffer: bytes que se acumulan antes de escribir al disco.
+        """
+        self.__archivo__ = open(ruta, "ab")  # pylint: disable=consider-using-with
+        self.__buffer__ = bytearray()
+        self.__tamano_buffer__ = tamano_buffer
+        if self.__archivo__.tell() == 0:
+            self.__buffer__ += _MAGICO
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def escribir(self, registro):
+        """
+        Agrega una partida al buffer y lo vuelca si se llenó.
+
+        Args:
+            registro: dict con el formato de BackgammonGame.get_registro.
+
+        Raises:
+            ValueError: si la partida no se puede representar en el formato.
+        """
+        self.__buffer__ += codificar_partida(registro)
+        if len(self.__buffer__) >= self.__tamano_buffer__:
+            self.volcar()
+
+    def volcar(self):
+        """Escribe en el archivo lo que quedó en el buffer."""
+        if self.__buffer__:
+            self.__archivo__.write(self.__buffer__)
+            self.__buffer__.clear()
+        self.__archivo__.flush()
+
+    def cerrar(self):
+        """Vuelca el buffer y cierra el archivo."""
+        if not self.__archivo__.closed:
+            self.volcar()
+            self.__archivo__.close()
+
+
+def leer_registros(ruta, tamano_bloque=1 << 20):
+    """
+    Recorre las partidas de un archivo sin cargarlo entero en memoria.
+
+    Args:
+        ruta: archivo escrito con EscritorRegistros.
+        tamano_bloque: tamaño del buffer de lectura en bytes.
+
+    Yields:
+        dict: cada partida con el formato de BackgammonGame.get_registro.
+
+    Raises:
+        RegistroInvalidoError: si el archivo tiene otro formato o está
+            cortado.
+    """
+    with open(ruta, "rb", buffering=tamano_bloque) as archivo:
+        if archivo.read(len(_MAGICO)) != _MAGICO:
+            raise RegistroInvalidoError(f"{ruta} no es un archivo de partidas.")
+        while True:
+            cabecera = archivo.read(_PARTIDA.size)
+            if not cabecera:
+                return
+            if len(cabecera) != _PARTIDA.size:
+                raise RegistroInvalidoError(f"{ruta} termina en medio de una partida.")
+            largo, semilla, banderas, largo1, largo2 = _PARTIDA.unpack(cabecera)
+            datos = archivo.read(largo1 + largo2 + largo)
+            if len(datos) != largo1 + largo2 + largo:
+                raise RegistroInvalidoError(f"{ruta} termina en medio de una partida.")
+            yield _decodificar_partida(datos, (semilla, banderas, largo1, largo2))
+
+
+def codificar_partida(registro):
+    """
+    Convierte una partida en los bytes que se agregan al archivo.
+
+    Args:
+        registro: dict con "jugadores" (dos nombres), "semilla" (entero o
+            None), "empieza" ('X' u 'O') y "turnos" (tuplas (dado1, dado2,
+            jugada); (0, 0, []) para un turno pasado sin tirar).
+
+    Returns:
+        bytes: cabecera, nombres y turnos.
+
+    Raises:
+        ValueError: si un nombre ocupa más de 255 bytes, la semilla no entra
+            en 64 bits sin signo o un turno no es válido.
+    """
+    nombres = [nombre.encode("utf-8") for nombre in registro["jugadores"]]
+    if any(len(nombre) > 255 for nombre in nombres):
+        raise ValueError("Los nombres no pueden ocupar más de 255 bytes.")
+    semilla = registro["semilla"]
+    if semilla is not None and not 0 <= semilla < 1 << 64:
+        raise ValueError("La semilla debe entrar en 64 bits sin signo.")
+    signo = _SIGNO[registro["empieza"]]
+
+    turnos = bytearray()
+    for dado1, dado2, jugada in registro["turnos"]:
+        turnos += _codificar_turno(dado1, dado2, jugada, signo)
+        signo = -signo
+    banderas = (_EMPIEZA_O if registro["empieza"] == "O" else 0) \
+        | (_CON_SEMILLA if semilla is not None else 0)
+    return _PARTIDA.pack(
+        len(turnos), semilla or 0, banderas, len(nombres[0]), len(nombres[1])
+    ) + nombres[0] + nombres[1] + turnos
+
+
+def _codificar_turno(dado1, dado2, jugada, signo):
+    """Devuelve los bytes de un turno del jugador signo."""
+    if not dado1 and not dado2 and not jugada:
+        return bytes((_PASADO,))
+    if not (1 <= dado1 <= 6 and 1 <= dado2 <= 6) or len(jugada) > 4:
+        raise ValueError(f"Turno inválido: {dado1}, {dado2}, {jugada}.")
+    datos = bytearray(((dado1 - 1) * 6 + dado2 - 1 + 36 * len(jugada),))
+    for desde, hasta in jugada:
+        if hasta == "fuera":
+            distancia = 0
+        elif desde == "bar":
+            distancia = hasta if signo > 0 else 23 - hasta
+        else:
+            distancia = (hasta - desde) * signo
+        if not (hasta == "fuera" or 1 <= distancia <= 6):
+            raise ValueError(f"Movimiento inválido: {desde}, {hasta}.")
+        datos.append((24 if desde == "bar" else desde) | distancia << 5)
+    return datos
+
+
+def _decodificar_partida(datos, cabecera):
+    """Arma el dict de una partida a partir de sus nombres y turnos."""
+    semilla, banderas, largo1, largo2 = cabecera
+    try:
+        nombres = (
+            datos[:largo1].decode("utf-8"),
+            datos[largo1:largo1 + largo2].decode("utf-8"),
+        )
+    except UnicodeDecodeError as error:
+        raise RegistroInvalidoError("Nombre de jugador dañado.") from error
+    empieza = "O" if banderas & _EMPIEZA_O else "X"
+    return {
+        "jugadores": nombres,
+        "semilla": semilla if banderas & _CON_SEMILLA else None,
+        "empieza": empieza,
+        "turnos": _decodificar_turnos(memoryview(datos)[largo1 + largo2:], _SIGNO[empieza]),
+    }
+
+
+def _decodificar_turnos(datos, signo):
+    """Convierte los bytes de los turnos en tuplas (dado1, dado2, jugada)."""
+    turnos = []
+    indice, fin = 0, len(datos)
+    while indice < fin:
+        codigo = datos[indice]
+        indice += 1
+        if codigo == _PASADO:
+            turnos.append((0, 0, []))
+        else:
+            dados, cantidad = codigo % 36, codigo // 36
+            if cantidad > 4 or indice + cantidad > fin:
+                raise RegistroInvalidoError(f"Turno dañado: byte {codigo}.")
+            turnos.append((dados // 6 + 1, dados % 6 + 1, [
+                _decodificar_movimiento(movimiento, signo)
+                for movimiento in datos[indice:indice + cantidad]
+            ]))
+            indice += cantidad
+        signo = -signo
+    return turnos
+
+
+def _decodificar_movimiento(codigo, signo):
+    """Convierte el byte de un movimiento en la tupla (desde, hasta)."""
+    desde, distancia = codigo & 31, codigo >> 5
+    if desde > 24 or distancia > 6 or (desde == 24 and not distancia):
+        raise RegistroInvalidoError(f"Movimiento dañado: byte {codigo}.")
+    if not distancia:
+        return (desde, "fuera")
+    if desde == 24:
+        return ("bar", distancia if signo > 0 else 23 - distancia)
+    return (desde, desde + signo * distancia)
@@ -0,0 +1,256 @@
+"""
+Módulo que define los rollouts Monte Carlo para analizar posiciones.
+
+Un rollout juega muchas partidas desde la misma posición hasta el final con
+una política rápida (la mejor jugada según la evaluación estática, a una
+jugada) y resume los resultados. Las partidas se reparten en lotes de tamaño
+fijo, cada uno con su propio flujo de dados derivado de la semilla, así que el
+resultado no depende de cuántos procesos se usen.
+"""
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from core.clases.board import Board
+from core.clases.dice import Dice
+from core.clases.player import Player
+from core.clases.evaluador import EvaluadorHeuristico
+
+_JUGADORES = {1: Player("player1", "X"), -1: Player("player2", "O")}
+_SIGNO_FICHA = {'X': 1, 'O': -1}
+_CLAVE_SIGNO = {1: 'player1', -1: 'player2'}
+_PARTIDAS_POR_LOTE = 36
+
+
+class Rollout:
+    """Evaluador de posiciones por rollouts repartidos en varios procesos."""
+
+    def __init__(self, cantidad=1296, procesos=None, max_turnos=500, evaluador=None):
+        """
+        Args:
+            cantidad: partidas a jugar por posición.
+            procesos: procesos del pool; por defecto uno por núcleo. Con 1
+                se juega en el proceso actual.
+            max_turnos: tope de turnos por partida. Con la geometría del
+                tablero una ficha puede quedar sin poder salir, así que las
+                partidas que llegan al tope se cuentan como sin terminar y
+                se puntúan con la evaluación estática de la posición final.
+            evaluador: evaluador de la política de juego; por defecto
+                EvaluadorHeuristico. Tiene que poder enviarse a otro proceso.
+        """
+        self.__cantidad__ = cantidad
+        self.__procesos__ = procesos or os.cpu_count() or 1
+        self.__max_turnos__ = max_turnos
+        self.__evaluador__ = evaluador if evaluador is not None else EvaluadorHeuristico()
+        self.__estadisticas__ = {"partidas": 0, "segundos": 0.0}
+        self.__base_bilateral__ = None
+
+    def set_base_bilateral(self, base):
+        """
+        Asigna una base de salida de dos lados. Las posiciones que cubre se
+        responden con una lectura de la base en lugar de jugar partidas.
+
+        Args:
+            base: instancia de BaseSalidaBilateral, o None para no usarla.
+        """
+        self.__base_bilateral__ = base
+
+    def ejecutar(self, board, jugador, semilla=None):
+        """
+        Juega las partidas desde la posición del tablero.
+
+        Args:
+            board: tablero con la posición a analizar (no se modifica).
+            jugador: objeto Player que tiene el turno y está por tirar.
+            semilla: semilla de los dados; None usa entropía del sistema.
+
+        Returns:
+            dict: "partidas", "terminadas" y "sin_terminar", y para
+            "victorias", "gammons", "backgammons", "gammons_perdidos",
+            "backgammons_perdidos" y "equidad" una tupla (valor, error
+            estándar) desde el punto de vista del jugador, calculada sobre
+            todas las partidas. Las sin terminar aportan la equidad estática
+            de su posición final y, como probabilidad de ganar, esa equidad
+            llevada de [-1, 1] a [0, 1]; no suman gammons. "exacto" indica
+            si el resultado salió de la base de salida (con error cero).
+        """
+        inicio = time.perf_counter()
+        base = self.__base_bilateral__
+        if base is not None and base.cubre(board.get_conteos()):
+            victorias = base.probabilidad_ganar(
+                board.get_conteos(), _SIGNO_FICHA[jugador.get_ficha()]
+            )
+            self.__estadisticas__ = {
+                "partidas": 0, "segundos": time.perf_counter() - inicio,
+            }
+            return _resumen_exacto(victorias)
+        tamanos = [_PARTIDAS_POR_LOTE] * (self.__cantidad__ // _PARTIDAS_POR_LOTE)
+        if self.__cantidad__ % _PARTIDAS_POR_LOTE:
+            tamanos.append(self.__cantidad__ % _PARTIDAS_POR_LOTE)
+        semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+        argumentos = (
+            [board.get_conteos()] * len(tamanos),
+            [_SIGNO_FICHA[jugador.get_ficha()]] * len(tamanos),
+            tamanos,
+            semillas,
+            [(self.__max_turnos__, self.__evaluador__)] * len(tamanos),
+        )
+        if self.__procesos__ == 1 or len(tamanos) == 1:
+            lotes = list(map(_jugar_lote, *argumentos))
+        else:
+            with ProcessPoolExecutor(max_workers=self.__procesos__) as pool:
+                lotes = list(pool.map(_jugar_lote, *argumentos))
+        self.__estadisticas__ = {
+            "partidas": self.__cantidad__,
+            "segundos": time.perf_counter() - inicio,
+        }
+        if not lotes:
+            return _resumir(np.zeros(0), np.zeros(0, dtype=bool))
+        return _resumir(
+            np.concatenate([resultados for resultados, _ in lotes]),
+            np.concatenate([terminadas for _, terminadas in lotes]),
+        )
+
+    def get_cantidad(self):
+        """Devuelve cuántas partidas se juegan por posición."""
+        return self.__cantidad__
+
+    def get_estadisticas(self):
+        """
+        Devuelve cuántas partidas jugó el último rollout y cuánto tardó.
+
+        Returns:
+            dict: "partidas" y "segundos".
+        """
+        return dict(self.__estadisticas__)
+
+
+def _jugar_lote(conteos, signo, cantidad, semilla, configuracion):
+    """
+    Juega un lote de partidas con su propio flujo de dados.
+
+    Returns:
+        tuple: (resultados, terminadas). resultados tiene el resultado de
+        cada partida para el jugador signo (ver _jugar_partida) y
+        terminadas indica cuáles llegaron al final.
+    """
+    max_turnos, evaluador = configuracion
+    dados = Dice(semilla, tam_buffer=1024)
+    board = Board()
+    resultados = np.zeros(cantidad)
+    terminadas = np.zeros(cantidad, dtype=bool)
+    for i in range(cantidad):
+        board.set_conteos(conteos)
+        resultados[i], terminadas[i] = _jugar_partida(
+            board, (signo, dados), evaluador, max_turnos
+        )
+    return resultados, terminadas
+
+
+def _jugar_partida(board, turno, evaluador, max_turnos):
+    """
+    Juega una partida hasta el final eligiendo siempre la jugada con mejor
+    evaluación estática.
+
+    Args:
+        board: tablero con la posición inicial; se modifica.
+        turno: tupla (signo del jugador que tira primero, Dice).
+        evaluador: evaluador usado para elegir las jugadas.
+        max_turnos: tope de turnos.
+
+    Returns:
+        tuple: (resultado, terminada). resultado es 1, 2 o 3 si ganó el
+        jugador que tiraba primero (simple, gammon o backgammon) y -1, -2 o
+        -3 si perdió; si se llegó al tope es la equidad estática de la
+        posición final para ese jugador y terminada es False.
+    """
+    inicial, dados = turno
+    signo = inicial
+    for _ in range(max_turnos):
+        dado1, dado2 = dados.lanzar_dados()
+        pares = board.jugadas_y_posiciones(_JUGADORES[signo], dado1, dado2)
+        if pares:
+            posiciones = np.frombuffer(
+                b"".join(posicion for _, posicion in pares), dtype=np.int8
+            ).reshape(len(pares), -1)
+            mejor = int(np.argmax(signo * evaluador.evaluar(posiciones, -signo)))
+            board.set_conteos(pares[mejor][1])
+            if board.get_fuera(_CLAVE_SIGNO[signo]) == 15:
+                return inicial * signo * tipo_de_victoria(board, signo), True
+        signo = -signo
+    conteos = np.array([board.get_conteos()], dtype=np.int8)
+    return inicial * float(evaluador.evaluar(conteos, signo)[0]), False
+
+
+def tipo_de_victoria(board, signo):
+    """
+    Clasifica la victoria del jugador signo.
+
+    Args:
+        board: tablero en el que el jugador signo ya sacó sus 15 fichas.
+        signo: 1 para X y -1 para O.
+
+    Returns:
+        int: 3 si el rival no sacó fichas y tiene alguna en el bar o en la
+        casa del ganador, 2 si no sacó ninguna y 1 en otro caso.
+    """
+    conteos = board.get_conteos()
+    rival = _CLAVE_SIGNO[-signo]
+    if board.get_fuera(rival) > 0:
+        return 1
+    casa = range(18, 24) if signo > 0 else range(0, 6)
+    if board.get_bar(rival) > 0 or any(conteos[p] * signo < 0 for p in casa):
+        return 3
+    return 2
+
+
+def _resumir(resultados, terminadas):
+    """
+    Convierte los resultados de las partidas en tasas con error estándar.
+
+    Las partidas sin terminar cuentan con su equidad estática y con esa
+    equidad llevada a [0, 1] como probabilidad de ganar.
+    """
+    cantidad = len(resultados)
+    ganadas = np.where(terminadas, resultados > 0, (np.clip(resultados, -1, 1) + 1) / 2)
+
+    def tasa(valores):
+        if cantidad == 0:
+            return 0.0, 0.0
+        return float(valores.mean()), float(valores.std()) / math.sqrt(cantidad)
+
+    equidad = (0.0, 0.0)
+    if cantidad:
+        equidad = (
+            float(resultados.mean()),
+            float(resultados.std(ddof=1)) / math.sqrt(cantidad) if cantidad > 1 else 0.0,
+        )
+    return {
+        "partidas": cantidad,
+        "terminadas": int(terminadas.sum()),
+        "sin_terminar": cantidad - int(terminadas.sum()),
+        "victorias": tasa(ganadas),
+        "gammons": tasa(terminadas & (resultados >= 2)),
+        "backgammons": tasa(terminadas & (resultados == 3)),
+        "gammons_perdidos": tasa(terminadas & (resultados <= -2)),
+        "backgammons_perdidos": tasa(terminadas & (resultados == -3)),
+        "equidad": equidad,
+        "exacto": False,
+    }
+
+
+def _resumen_exacto(victorias):
+    """Arma el resumen de una posición resuelta por la base de salida."""
+    return {
+        "partidas": 0,
+        "terminadas": 0,
+        "sin_terminar": 0,
+        "victorias": (victorias, 0.0),
+        "gammons": (0.0, 0.0),
+        "backgammons": (0.0, 0.0),
+        "gammons_perdidos": (0.0, 0.0),
+        "backgammons_perdidos": (0.0, 0.0),
+        "equidad": (2 * victorias - 1, 0.0),
+        "exacto": True,
+    }
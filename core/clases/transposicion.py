@@ -0,0 +1,204 @@
+"""
+Módulo que define la tabla de transposición compartida por la búsqueda y
+las sugerencias.
+
+Distintos órdenes de los dados y distintas secuencias de movimientos llegan
+a la misma posición. La tabla guarda, por clave de la posición con el
+turno y los dados, las jugadas generadas junto con su evaluación, de modo
+que una posición repetida no vuelve a generar jugadas ni a pasar por el
+evaluador. Con un evaluador simétrico entre los colores la clave es la
+canónica (Board.hash_canonico), así que también se reaprovecha el reflejo
+de la posición con el otro color en el turno. Las claves llevan además la
+identidad del evaluador, así que una tabla compartida entre evaluadores
+distintos no mezcla sus valores. Tiene un tope de memoria en bytes y
+desaloja las entradas usadas hace más tiempo (LRU).
+"""
+import sys
+from collections import OrderedDict
+import numpy as np
+from core.clases.board import reflejar_jugada
+from core.clases.player import Player
+
+_JUGADORES = {1: Player("player1", "X"), -1: Player("player2", "O")}
+# Bytes aproximados que ocupa cada entrada además de su valor: el nodo del
+# OrderedDict, la clave (identidad del evaluador, hash) y la tupla (valor,
+# tamaño).
+_SOBRECARGA = 220
+
+
+class TablaTransposicion:
+    """Caché LRU acotada en bytes con contadores de aciertos y desalojos."""
+
+    def __init__(self, memoria_maxima=64 * 1024 * 1024):
+        """
+        Args:
+            memoria_maxima: bytes que pueden ocupar las entradas, estimados
+                con sys.getsizeof.
+
+        Raises:
+            ValueError: si memoria_maxima no es positiva.
+        """
+        if memoria_maxima <= 0:
+            raise ValueError("memoria_maxima debe ser positiva.")
+        self.__memoria_maxima__ = memoria_maxima
+        self.__entradas__ = OrderedDict()
+        self.__bytes__ = 0
+        self.__contadores__ = {"aciertos": 0, "fallos": 0, "desalojos": 0}
+        self.__evaluadores__ = []
+
+    def obtener(self, clave):
+        """
+        Busca una entrada y la marca como la usada más recientemente.
+
+        Args:
+            clave: hash de la posición.
+
+        Returns:
+            El valor guardado, o None si no está.
+        """
+        entrada = self.__entradas__.get(clave)
+        if entrada is None:
+            self.__contadores__["fallos"] += 1
+            return None
+        self.__entradas__.move_to_end(clave)
+        self.__contadores__["aciertos"] += 1
+        return entrada[0]
+
+    def guardar(self, clave, valor):
+        """
+        Guarda una entrada y desaloja las más viejas si se pasa del tope.
+
+        Args:
+            clave: hash de la posición.
+            valor: valor a guardar; no debe modificarse después.
+        """
+        tamano = _SOBRECARGA + _tamano(valor)
+        anterior = self.__entradas__.pop(clave, None)
+        if anterior is not None:
+            self.__bytes__ -= anterior[1]
+        self.__entradas__[clave] = (valor, tamano)
+        self.__bytes__ += tamano
+        while self.__bytes__ > self.__memoria_maxima__:
+            _, (_, liberado) = self.__entradas__.popitem(last=False)
+            self.__bytes__ -= liberado
+            self.__contadores__["desalojos"] += 1
+
+    def get_identidad(self, evaluador):
+        """
+        Devuelve el número que distingue a un evaluador en las claves.
+
+        La tabla guarda una referencia a cada evaluador que la usó, para que
+        su número no pase a otro objeto mientras haya entradas suyas.
+
+        Args:
+            evaluador: objeto que calculó o va a calcular los valores.
+
+        Returns:
+            int: 0 para el primer evaluador, 1 para el segundo, etc.
+        """
+        for identidad, conocido in enumerate(self.__evaluadores__):
+            if conocido is evaluador:
+                return identidad
+        self.__evaluadores__.append(evaluador)
+        return len(self.__evaluadores__) - 1
+
+    def limpiar(self):
+        """Borra todas las entradas; los contadores se conservan."""
+        self.__entradas__.clear()
+        self.__evaluadores__.clear()
+        self.__bytes__ = 0
+
+    def get_estadisticas(self):
+        """
+        Devuelve el uso de la tabla.
+
+        Returns:
+            dict: "aciertos", "fallos", "desalojos", "entradas", "bytes" y
+            "memoria_maxima".
+        """
+        estadisticas = dict(self.__contadores__)
+        estadisticas["entradas"] = len(self.__entradas__)
+        estadisticas["bytes"] = self.__bytes__
+        estadisticas["memoria_maxima"] = self.__memoria_maxima__
+        return estadisticas
+
+
+def candidatas_ordenadas(board, nodo, evaluador, tabla=None):
+    """
+    Genera las jugadas de una tirada ordenadas de mejor a peor según la
+    evaluación estática, que se calcula en un solo lote.
+
+    Si se pasa una tabla, el resultado se busca y se guarda en ella con la
+    clave de la posición, el turno y los dados. Si el evaluador declara
+    SIMETRICO (valora igual una posición y su reflejo con el otro color en
+    el turno, como EvaluadorHeuristico) se usa la clave canónica: las
+    jugadas se guardan vistas desde X y se reflejan al leerlas para O. Una
+    misma tabla puede compartirse entre evaluadores: la clave incluye
+    su identidad (TablaTransposicion.get_identidad).
+
+    Args:
+        board: tablero con la posición; no se modifica.
+        nodo: tupla (signo, dado1, dado2) con el jugador que mueve.
+        evaluador: objeto con evaluar(posiciones, turno).
+        tabla: TablaTransposicion, o None para no usar caché.
+
+    Returns:
+        tuple: (candidatas, evaluadas). candidatas es una lista de tuplas
+        (valor, jugada) con el valor para el jugador que mueve; si no hay
+        movimientos tiene una sola tupla con la jugada vacía y el valor de
+        la posición actual. evaluadas es la cantidad de posiciones que pasaron
+        por el evaluador (0 si salió de la tabla).
+    """
+    signo, dado1, dado2 = nodo
+    jugador = _JUGADORES[signo]
+    clave = None
+    reflejar = signo < 0 and getattr(evaluador, "SIMETRICO", False)
+    if tabla is not None:
+        clave = (tabla.get_identidad(evaluador), _clave(board, nodo, evaluador))
+        candidatas = tabla.obtener(clave)
+        if candidatas is not None:
+            if reflejar:
+                candidatas = [
+                    (valor, reflejar_jugada(jugada)) for valor, jugada in candidatas
+                ]
+            return candidatas, 0
+
+    pares = board.jugadas_y_posiciones(jugador, dado1, dado2)
+    if pares:
+        posiciones = np.frombuffer(
+            b"".join(posicion for _, posicion in pares), dtype=np.int8
+        ).reshape(len(pares), -1)
+    else:
+        pares = [([], None)]
+        posiciones = np.array([board.get_conteos()], dtype=np.int8)
+    valores = signo * evaluador.evaluar(posiciones, -signo)
+    orden = np.argsort(-valores, kind="stable")
+    candidatas = [(float(valores[i]), pares[i][0]) for i in orden]
+    if tabla is not None:
+        tabla.guardar(clave, candidatas if not reflejar else [
+            (valor, reflejar_jugada(jugada)) for valor, jugada in candidatas
+        ])
+    return candidatas, len(pares)
+
+
+def _clave(board, nodo, evaluador):
+    """
+    Devuelve el hash de la posición: el canónico si el evaluador es
+    simétrico y si no el de la posición con el turno.
+    """
+    signo, dado1, dado2 = nodo
+    if getattr(evaluador, "SIMETRICO", False):
+        return board.hash_canonico(_JUGADORES[signo], (dado1, dado2))
+    return board.hash_posicion(_JUGADORES[signo], (dado1, dado2))
+
+
+def _tamano(valor):
+    """Estima los bytes de un valor recorriendo listas, tuplas y dicts."""
+    if isinstance(valor, np.ndarray):
+        return sys.getsizeof(valor) + (0 if valor.flags.owndata else valor.nbytes)
+    tamano = sys.getsizeof(valor)
+    if isinstance(valor, (list, tuple)):
+        tamano += sum(_tamano(elemento) for elemento in valor)
+    elif isinstance(valor, dict):
+        tamano += sum(_tamano(k) + _tamano(v) for k, v in valor.items())
+    return tamano
@@ -41,8 +41,8 @@ def regla_salida_final(jugador, movimientos,_dados,board):
         MovimientoInvalidoError: si intenta sacar fichas sin tener todas en el cuadrante final.
     """
     nombre = jugador.get_nombre()
-    for _, hasta in movimientos:
-        if hasta == "fuera" and not board.puede_sacar(jugador):
-            raise MovimientoInvalidoError(
-                f"{nombre} no puede sacar fichas aún. Todas deben estar en el cuadrante final."
-            )
+    saca_fichas = any(hasta == "fuera" for _, hasta in movimientos)
+    if saca_fichas and not board.puede_sacar(jugador):
+        raise MovimientoInvalidoError(
+            f"{nombre} no puede sacar fichas aún. Todas deben estar en el cuadrante final."
+        )
@@ -0,0 +1,108 @@
+"""
+Módulo que define vistas de solo lectura sobre el arreglo compacto del tablero.
+
+Las vistas no copian el estado: leen directamente del buffer del Board (o de
+una instantánea de 28 bytes) y exponen la misma forma que get_tablero, pero
+sin permitir modificaciones.
+"""
+from collections.abc import Mapping, Sequence
+
+
+class VistaTablero(Mapping):
+    """
+    Vista inmutable del tablero con las claves "posiciones", "bar" y "fuera",
+    igual que el diccionario de Board.get_tablero.
+    """
+    __slots__ = ("__conteos__", "__indices__", "__fichas__")
+
+    def __init__(self, conteos, indices, fichas):
+        """
+        Crea la vista.
+
+        Args:
+            conteos: memoryview de solo lectura con los 28 conteos con signo.
+            indices: dict con las casillas de "bar" y "fuera" por jugador.
+            fichas: dict signo -> Checker compartido para armar las pilas.
+        """
+        self.__conteos__ = conteos
+        self.__indices__ = indices
+        self.__fichas__ = fichas
+
+    def __getitem__(self, clave):
+        """Devuelve la vista de posiciones o de los contadores bar/fuera."""
+        if clave == "posiciones":
+            return VistaPosiciones(self.__conteos__, self.__fichas__)
+        if clave in self.__indices__:
+            return VistaContador(self.__conteos__, self.__indices__[clave])
+        raise KeyError(clave)
+
+    def __iter__(self):
+        """Itera las claves en el mismo orden que get_tablero."""
+        return iter(("posiciones", "bar", "fuera"))
+
+    def __len__(self):
+        """Cantidad de claves de la vista."""
+        return 3
+
+    def get_conteo(self, casilla):
+        """
+        Devuelve el conteo con signo de una casilla del arreglo compacto.
+
+        Returns:
+            int: positivo para fichas X, negativo para fichas O.
+        """
+        return self.__conteos__[casilla]
+
+
+class VistaPosiciones(Sequence):
+    """Secuencia de solo lectura con las 24 pilas del tablero."""
+    __slots__ = ("__conteos__", "__fichas__")
+
+    def __init__(self, conteos, fichas):
+        """Guarda el buffer de conteos y las fichas compartidas."""
+        self.__conteos__ = conteos
+        self.__fichas__ = fichas
+
+    def __getitem__(self, indice):
+        """
+        Devuelve la pila de un punto como tupla de fichas compartidas.
+
+        Returns:
+            tuple: fichas del punto, vacía si no hay ninguna.
+        """
+        if isinstance(indice, slice):
+            return tuple(self[i] for i in range(24)[indice])
+        cantidad = self.__conteos__[range(24)[indice]]
+        if cantidad < 0:
+            return (self.__fichas__[-1],) * -cantidad
+        return (self.__fichas__[1],) * cantidad
+
+    def __len__(self):
+        """Cantidad de puntos del tablero."""
+        return 24
+
+
+class VistaContador(Mapping):
+    """Mapeo de solo lectura jugador -> cantidad para el bar o las fichas fuera."""
+    __slots__ = ("__conteos__", "__casillas__")
+
+    def __init__(self, conteos, casillas):
+        """
+        Args:
+            conteos: buffer de conteos compartido con el tablero.
+            casillas: dict jugador -> índice de la casilla en el arreglo.
+        """
+        self.__conteos__ = conteos
+        self.__casillas__ = casillas
+
+    def __getitem__(self, jugador):
+        """Devuelve la cantidad de fichas del jugador."""
+        return self.__conteos__[self.__casillas__[jugador]]
+
+    def __iter__(self):
+        """Itera los nombres de los jugadores."""
+        return iter(self.__casillas__)
+
+    def __len__(self):
+        """Cantidad de jugadores."""
+        return len(self.__casillas__)
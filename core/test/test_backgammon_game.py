@@ -3,13 +3,18 @@ Pruebas unitarias para la clase BackgammonGame.
 Valida la lógica completa del controlador del juego de Backgammon.
 """
 import unittest
+import numpy as np
 from core.clases.backgammon_game import BackgammonGame
+from core.clases.bot import BotExpectiminimax
 from core.clases.excepciones import (
     JuegoNoInicializadoError,
+    MovimientoInvalidoError,
+    SinMovimientosDisponiblesError,
     TurnoJugadorInvalidoError,
     JuegoYaFinalizadoError,
     ValorDadoInvalidoError
 )
+from core.clases import validaciones
 
 
 class TestBackgammonGame(unittest.TestCase):
@@ -287,7 +292,7 @@ class TestBackgammonGame(unittest.TestCase):
         self.assertEqual(estado["turno"], 0)
         self.assertEqual(estado["movimientos_restantes"], 0)
         self.assertIsNone(estado["jugador_actual"])
-        self.assertIn("tablero", estado)
+        self.assertEqual(estado["tablero"], self.game.get_tablero())
         self.assertIn("jugador1", estado)
         self.assertIn("jugador2", estado)
 
@@ -503,6 +508,139 @@ class TestBackgammonGame(unittest.TestCase):
 
         self.assertEqual(len(resultado["resultados"]), 2)
 
+    def test_get_pips(self):
+        """Verifica la cuenta de pips de ambos jugadores al empezar."""
+        self.assertEqual(self.game.get_pips(self.game.get_jugador1()), 152)
+        self.assertEqual(self.game.get_pips(self.game.get_jugador2()), 152)
+        estado = self.game.get_estado_juego()
+        self.assertEqual(estado["jugador1"]["pips"], 152)
+
+    def test_semilla_partida_reproducible(self):
+        """Verifica que dos partidas con la misma semilla tiren igual."""
+        juego_a = BackgammonGame("player1", "player2", semilla=5)
+        juego_b = BackgammonGame("player1", "player2", semilla=5)
+        self.assertEqual(juego_a.quien_empieza(), juego_b.quien_empieza())
+        self.assertEqual(juego_a.lanzar_dados(), juego_b.lanzar_dados())
+
+    def test_turno_bot_sin_dados(self):
+        """Verifica que el bot no juegue antes de tirar los dados."""
+        juego = BackgammonGame("computadora", "player2")
+        juego.agregar_computadora(1, profundidad=1)
+        juego.__turno__ = 1
+        with self.assertRaises(SinMovimientosDisponiblesError):
+            juego.jugar_turno_bot(3, 1)
+
+    def test_turno_bot_rechazado(self):
+        """Verifica que una jugada rechazada por las reglas no pase el turno."""
+        def rechazar(*_):
+            raise validaciones.MovimientoInvalidoError("No se permite mover.")
+
+        juego = BackgammonGame("computadora", "player2", reglas=[rechazar])
+        juego.agregar_computadora(1, profundidad=1)
+        juego.__turno__ = 1
+        juego.__movimientos_restantes__ = 2
+        with self.assertRaises(MovimientoInvalidoError):
+            juego.jugar_turno_bot(3, 1)
+        self.assertEqual(juego.get_turno(), 1)
+
+    def test_computadoras_con_tablas_propias(self):
+        """Verifica que cada computadora y las sugerencias tengan su tabla."""
+        juego = BackgammonGame("computadora", "otra")
+        juego.activar_tabla()
+        primera = juego.agregar_computadora(1, profundidad=1)
+        segunda = juego.agregar_computadora(2, profundidad=1)
+        self.assertIsNot(primera.__tabla__, segunda.__tabla__)
+        self.assertIsNot(primera.__tabla__, juego.__tabla__)
+        self.assertIsNone(primera.__libro__)
+        juego.__turno__ = 1
+        juego.lanzar_dados()
+        dado1, dado2 = juego.get_registro()["turnos"][-1][:2]
+        self.assertTrue(juego.jugar_turno_bot(dado1, dado2))
+        self.assertEqual(juego.get_turno(), 2)
+
+    def test_turno_bot(self):
+        """Verifica que el bot juegue su turno y lo pase."""
+        juego = BackgammonGame("player1", "computadora", semilla=1)
+        juego.set_bot(2, BotExpectiminimax(profundidad=1))
+        juego.quien_empieza()
+        if not juego.es_turno_bot():
+            juego.cambiar_turno()
+        dado1, dado2, _ = juego.lanzar_dados()
+        antes = juego.get_board().get_conteos()
+        jugada = juego.jugar_turno_bot(dado1, dado2)
+        self.assertTrue(jugada)
+        self.assertNotEqual(juego.get_board().get_conteos(), antes)
+        self.assertEqual(juego.get_turno(), 1)
+        self.assertFalse(juego.es_turno_bot())
+        with self.assertRaises(TurnoJugadorInvalidoError):
+            juego.jugar_turno_bot(dado1, dado2)
+        juego.set_bot(2, None)
+        juego.cambiar_turno()
+        self.assertFalse(juego.es_turno_bot())
+
+    def test_sugerir_jugadas_ordenadas(self):
+        """Verifica que las sugerencias salgan ordenadas y con la diferencia."""
+        self.game.__turno__ = 1
+        sugerencias = self.game.sugerir_jugadas(3, 1, n=4)
+        self.assertEqual(len(sugerencias), 4)
+        equidades = [s["equidad"] for s in sugerencias]
+        self.assertEqual(equidades, sorted(equidades, reverse=True))
+        self.assertEqual(sugerencias[0]["diferencia"], 0.0)
+        for sugerencia in sugerencias:
+            self.assertAlmostEqual(
+                sugerencia["diferencia"], sugerencia["equidad"] - equidades[0]
+            )
+        todas = self.game.sugerir_jugadas(3, 1, n=1000)
+        self.assertEqual(
+            len(todas),
+            len(self.game.get_board().jugadas_y_posiciones(self.game.get_jugador1(), 3, 1)),
+        )
+
+    def test_sugerir_jugadas_usa_el_evaluador(self):
+        """Verifica que las sugerencias usen el evaluador configurado."""
+
+        class EvaluadorFijo:  # pylint: disable=too-few-public-methods
+            """Evaluador que prefiere dejar fichas en el punto 4."""
+
+            def evaluar(self, posiciones, turno=None):  # pylint: disable=unused-argument
+                """Devuelve la cantidad de fichas de X en el punto 4."""
+                return np.asarray(posiciones, dtype=np.int8)[:, 4].astype(float)
+
+        self.game.__turno__ = 1
+        self.game.set_evaluador(EvaluadorFijo())
+        mejor = self.game.sugerir_jugadas(2, 2, n=1)[0]
+        self.assertEqual(mejor["equidad"], 2.0)
+        self.assertEqual(sorted(mejor["jugada"]), [(0, 2), (0, 2), (2, 4), (2, 4)])
+
+    def test_sugerir_jugadas_dobles_sin_repetidas(self):
+        """Verifica que con dobles se evalúe una vez cada posición distinta."""
+        self.game.__turno__ = 2
+        sugerencias = self.game.sugerir_jugadas(1, 1)
+        self.assertEqual(len(sugerencias), 5)
+        self.assertTrue(all(s["diferencia"] <= 0 for s in sugerencias))
+        posiciones = self.game.get_board().jugadas_y_posiciones(
+            self.game.get_jugador2(), 1, 1
+        )
+        self.assertEqual(
+            len(self.game.sugerir_jugadas(1, 1, n=1000)),
+            len({posicion for _, posicion in posiciones}),
+        )
+
+    def test_sugerir_jugadas_errores(self):
+        """Verifica los errores y el caso sin movimientos."""
+        with self.assertRaises(JuegoNoInicializadoError):
+            self.game.sugerir_jugadas(3, 1)
+        self.game.__turno__ = 1
+        with self.assertRaises(ValorDadoInvalidoError):
+            self.game.sugerir_jugadas(7, 1)
+        self.assertEqual(self.game.sugerir_jugadas(3, 1, n=0), [])
+        conteos = [0] * 28
+        conteos[24], conteos[26] = 1, 14
+        conteos[5] = conteos[6] = -2
+        conteos[27] = 11
+        self.game.get_board().set_conteos(conteos)
+        self.assertEqual(self.game.sugerir_jugadas(6, 5), [])
+
 
 if __name__ == "__main__":
     unittest.main()
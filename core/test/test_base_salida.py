@@ -0,0 +1,188 @@
+"""
+Pruebas unitarias para la base de salida de fichas de un lado.
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.clases.base_salida import (
+    BaseSalidaBilateral,
+    BaseSalidaUnilateral,
+    cantidad_posiciones,
+    generar_base_bilateral,
+    generar_base_unilateral,
+    rango,
+)
+from core.clases.base_salida import _transiciones
+from core.clases.board import Board, POSICION_INICIAL
+from core.clases.bot import TIRADAS
+from core.clases.excepciones import FormatoArchivoInvalidoError, PuntoInvalidoError
+from core.clases.player import Player
+from core.clases.rollout import Rollout
+
+
+class TestBaseSalidaUnilateral(unittest.TestCase):
+    """Suite de pruebas para la base de salida de un lado."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Genera una base chica de hasta 3 fichas."""
+        cls.directorio = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.ruta = os.path.join(cls.directorio.name, "salida.bin")
+        cls.distribuciones = generar_base_unilateral(cls.ruta, max_fichas=3)
+        cls.base = BaseSalidaUnilateral(cls.ruta)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Borra el archivo generado."""
+        del cls.base
+        cls.directorio.cleanup()
+
+    @staticmethod
+    def _conteos(casa, signo=1):
+        """Arma un arreglo compacto con la casa indicada para un jugador."""
+        conteos = [0] * 28
+        for distancia, cantidad in enumerate(casa, start=1):
+            conteos[23 - distancia if signo > 0 else distancia] = signo * cantidad
+        conteos[26 if signo > 0 else 27] = 15 - sum(casa)
+        return conteos
+
+    def test_rango_es_biyectivo(self):
+        """Verifica que el rango numere sin huecos las posiciones."""
+        casas = [
+            (a, b, c, d, e)
+            for a in range(4) for b in range(4) for c in range(4)
+            for d in range(4) for e in range(4) if a + b + c + d + e <= 3
+        ]
+        self.assertEqual(
+            sorted(rango(casa) for casa in casas),
+            list(range(cantidad_posiciones(3))),
+        )
+        self.assertEqual(rango((0, 0, 0, 0, 0)), 0)
+
+    def test_una_ficha_es_geometrica(self):
+        """Verifica que una ficha a distancia 1 salga solo con un as."""
+        distribucion = self.base.distribucion(self._conteos((1, 0, 0, 0, 0)), 1)
+        self.assertAlmostEqual(distribucion[1], 11 / 36, places=4)
+        self.assertAlmostEqual(distribucion[2], 25 / 36 * 11 / 36, places=4)
+        self.assertAlmostEqual(
+            self.base.tiradas_esperadas(self._conteos((1, 0, 0, 0, 0)), 1),
+            36 / 11, places=3,
+        )
+
+    def test_archivo_coincide_y_suma_uno(self):
+        """Verifica el archivo mapeado contra las distribuciones calculadas."""
+        casa = (1, 0, 1, 0, 1)
+        guardada = self.base.distribucion(self._conteos(casa), 1)
+        np.testing.assert_allclose(
+            guardada, self.distribuciones[rango(casa)], atol=1e-4
+        )
+        self.assertAlmostEqual(float(guardada.sum()), 1.0, places=3)
+        self.assertEqual(self.base.get_max_fichas(), 3)
+
+    def test_o_es_simetrico(self):
+        """Verifica que O use la misma base con los puntos reflejados."""
+        casa = (0, 2, 0, 1, 0)
+        np.testing.assert_array_equal(
+            self.base.distribucion(self._conteos(casa, -1), -1),
+            self.base.distribucion(self._conteos(casa), 1),
+        )
+
+    def test_posiciones_no_cubiertas(self):
+        """Verifica que se rechacen fichas fuera de la casa o demasiadas."""
+        conteos = self._conteos((1, 0, 0, 0, 0))
+        conteos[10] = 1
+        conteos[26] -= 1
+        self.assertFalse(self.base.cubre(conteos, 1))
+        self.assertFalse(self.base.cubre(self._conteos((4, 0, 0, 0, 0)), 1))
+        with self.assertRaises(PuntoInvalidoError):
+            self.base.distribucion(conteos, 1)
+
+    def test_archivo_invalido(self):
+        """Verifica que un archivo ajeno no se pueda abrir como base."""
+        ruta = os.path.join(self.directorio.name, "otro.bin")
+        with open(ruta, "wb") as archivo:
+            archivo.write(b"no es una base")
+        with self.assertRaises(FormatoArchivoInvalidoError):
+            BaseSalidaUnilateral(ruta)
+        with self.assertRaises(FormatoArchivoInvalidoError):
+            BaseSalidaBilateral(ruta)
+
+
+class TestBaseSalidaBilateral(unittest.TestCase):
+    """Suite de pruebas para la base de salida de dos lados."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Genera una base chica de hasta 3 fichas por lado."""
+        cls.directorio = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.ruta = os.path.join(cls.directorio.name, "bilateral.bin")
+        cls.valores = generar_base_bilateral(cls.ruta, max_fichas=3)
+        cls.base = BaseSalidaBilateral(cls.ruta)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Borra el archivo generado."""
+        del cls.base
+        cls.directorio.cleanup()
+
+    @staticmethod
+    def _conteos(casa_x, casa_o):
+        """Arma un arreglo compacto con las casas de ambos jugadores."""
+        conteos = [0] * 28
+        for distancia in range(1, 6):
+            conteos[23 - distancia] = casa_x[distancia - 1]
+            conteos[distancia] = -casa_o[distancia - 1]
+        conteos[26], conteos[27] = 15 - sum(casa_x), 15 - sum(casa_o)
+        return conteos
+
+    def test_una_ficha_por_lado(self):
+        """Verifica el valor exacto de una carrera de una ficha contra una."""
+        conteos = self._conteos((1, 0, 0, 0, 0), (1, 0, 0, 0, 0))
+        exacto = (11 / 36) / (1 - (25 / 36) ** 2)
+        self.assertAlmostEqual(self.base.probabilidad_ganar(conteos, 1), exacto, places=4)
+        self.assertAlmostEqual(self.base.probabilidad_ganar(conteos, -1), exacto, places=4)
+
+    def test_coincide_con_iteracion_de_valores(self):
+        """Verifica la programación dinámica contra iterar la recurrencia."""
+        transiciones = _transiciones(2)
+        total = len(transiciones)
+        valores = np.zeros((total, total))
+        for _ in range(150):
+            nuevos = np.zeros((total, total))
+            for propio in range(1, total):
+                for rival in range(1, total):
+                    for (_, _, peso), sucesores in zip(TIRADAS, transiciones[propio]):
+                        opciones = [
+                            1 - valores[rival, s] if s is not None else 0.0
+                            for s in sucesores
+                        ] or [1 - valores[rival, propio]]
+                        nuevos[propio, rival] += peso / 36 * max(opciones)
+            valores = nuevos
+        np.testing.assert_allclose(self.valores[:total, :total], valores, atol=1e-9)
+
+    def test_cobertura(self):
+        """Verifica qué posiciones responde la base."""
+        self.assertTrue(self.base.cubre(self._conteos((0, 2, 0, 0, 1), (1, 0, 0, 0, 0))))
+        self.assertFalse(self.base.cubre(self._conteos((0, 4, 0, 0, 0), (1, 0, 0, 0, 0))))
+        self.assertFalse(self.base.cubre(self._conteos((0, 0, 0, 0, 0), (1, 0, 0, 0, 0))))
+        with self.assertRaises(PuntoInvalidoError):
+            self.base.probabilidad_ganar(POSICION_INICIAL, 1)
+
+    def test_rollout_usa_la_base(self):
+        """Verifica que el rollout responda con la base sin jugar partidas."""
+        board = Board()
+        board.set_conteos(self._conteos((0, 1, 0, 0, 0), (2, 0, 0, 0, 0)))
+        rollout = Rollout(cantidad=36, procesos=1)
+        rollout.set_base_bilateral(self.base)
+        resumen = rollout.ejecutar(board, Player("player2", "O"), semilla=1)
+        self.assertTrue(resumen["exacto"])
+        self.assertEqual(resumen["partidas"], 0)
+        self.assertAlmostEqual(
+            resumen["victorias"][0],
+            self.base.probabilidad_ganar(board.get_conteos(), -1),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,12 +2,16 @@
 Pruebas unitarias para la clase Board del juego Backgammon.
 """
 import unittest
+from array import array
 from core.clases.checker import Checker
 from core.clases.player import Player
-from core.clases.board import Board
+from core.clases.board import (
+    Board, POSICION_INICIAL, reflejar_conteos, reflejar_jugada,
+)
 from core.clases.excepciones import (
     PuntoInvalidoError,
-    MovimientoMalFormadoError
+    MovimientoMalFormadoError,
+    MovimientoInvalidoError
 )
 
 
@@ -399,6 +403,324 @@ class TestBoard(unittest.TestCase):
         self.assertFalse(self.board.esta_en_cuadrante_final("foo", self.jugador2))
         self.assertFalse(self.board.esta_en_cuadrante_final(15, self.jugador2))
 
+    def test_get_conteos_inicial(self):
+        """Verifica que el arreglo compacto refleje la posición inicial."""
+        self.assertEqual(self.board.get_conteos(), POSICION_INICIAL)
+
+    def test_set_conteos_ida_y_vuelta(self):
+        """Verifica que set_conteos y get_conteos sean inversos."""
+        conteos = [0] * 28
+        conteos[3] = 2
+        conteos[20] = -1
+        conteos[25] = 1
+        conteos[26] = 13
+        self.board.set_conteos(conteos)
+
+        self.assertEqual(self.board.get_conteos(), tuple(conteos))
+        self.assertEqual(
+            [c.get_simbolo() for c in self.board.get_posiciones(20)], ["O"]
+        )
+        self.assertEqual(self.board.get_bar("player2"), 1)
+        self.assertEqual(self.board.get_fuera("player1"), 13)
+
+    def test_set_conteos_longitud_invalida(self):
+        """Verifica error al cargar un arreglo de tamaño incorrecto."""
+        with self.assertRaises(PuntoInvalidoError):
+            self.board.set_conteos([0] * 24)
+
+    def test_set_posiciones_fichas_mezcladas(self):
+        """Verifica que una posición no acepte fichas de ambos jugadores."""
+        with self.assertRaises(PuntoInvalidoError):
+            self.board.set_posiciones(4, [Checker("X"), Checker("O")])
+
+    def test_mover_actualiza_conteos(self):
+        """Verifica que un movimiento con captura actualice el arreglo."""
+        self.board.set_posiciones(3, [Checker("O")])
+        self.board.mover_ficha(self.jugador1, [(0, 3)], [3])
+        conteos = self.board.get_conteos()
+
+        self.assertEqual(conteos[0], 1)
+        self.assertEqual(conteos[3], 1)
+        self.assertEqual(conteos[25], 1)
+
+    def _vaciar(self):
+        """Deja el tablero sin fichas en puntos, bar ni fuera."""
+        self.board.set_conteos([0] * 28)
+
+    def test_jugadas_legales_apertura(self):
+        """Verifica las jugadas distintas de la apertura y que sean aplicables."""
+        jugadas = self.board.jugadas_legales(self.jugador1, 3, 1)
+        self.assertEqual(len(jugadas), 16)
+        for jugada in jugadas:
+            tablero = Board()
+            resultado = tablero.mover_ficha(self.jugador1, jugada, [3, 1])
+            self.assertTrue(all(resultado["resultados"]))
+
+    def test_jugadas_legales_sin_duplicados(self):
+        """Verifica que no haya dos jugadas que lleguen a la misma posición."""
+        jugadas = self.board.jugadas_y_posiciones(self.jugador2, 2, 2)
+        posiciones = [posicion for _, posicion in jugadas]
+        self.assertEqual(len(posiciones), len(set(posiciones)))
+        self.assertTrue(all(len(jugada) == 4 for jugada, _ in jugadas))
+
+    def test_jugadas_legales_no_modifica_tablero(self):
+        """Verifica que generar jugadas deje el tablero intacto."""
+        antes = self.board.get_conteos()
+        self.board.jugadas_legales(self.jugador1, 6, 6)
+        self.assertEqual(self.board.get_conteos(), antes)
+
+    def test_jugadas_legales_entrada_desde_bar(self):
+        """Verifica que con fichas en el bar se entre primero."""
+        self.board.set_bar("player1", 1)
+        jugadas = self.board.jugadas_legales(self.jugador1, 4, 2)
+        self.assertTrue(jugadas)
+        self.assertTrue(all(jugada[0][0] == "bar" for jugada in jugadas))
+
+    def test_jugadas_legales_sacar_fichas(self):
+        """Verifica que se generen salidas con la distancia exacta."""
+        self._vaciar()
+        self.board.set_posiciones(20, [Checker("X")])
+        self.board.set_posiciones(21, [Checker("X")])
+        self.board.set_fuera("player1", 13)
+        jugadas = self.board.jugadas_legales(self.jugador1, 3, 2)
+        self.assertIn([(20, "fuera"), (21, "fuera")], jugadas)
+
+    def test_jugadas_legales_bloqueado(self):
+        """Verifica que no haya jugadas si la entrada está bloqueada."""
+        self._vaciar()
+        self.board.set_bar("player1", 1)
+        self.board.set_posiciones(5, [Checker("O"), Checker("O")])
+        self.assertEqual(self.board.jugadas_legales(self.jugador1, 5, 5), [])
+
+    def test_jugadas_legales_usa_dado_mayor(self):
+        """Verifica que si solo entra un dado se use el mayor."""
+        self._vaciar()
+        self.board.set_posiciones(10, [Checker("X")])
+        self.board.set_posiciones(17, [Checker("O"), Checker("O")])
+        jugadas = self.board.jugadas_legales(self.jugador1, 2, 5)
+        self.assertEqual(jugadas, [[(10, 15)]])
+
+    def test_hash_posicion_transposicion(self):
+        """Verifica que dos órdenes de jugada distintos den el mismo hash."""
+        otro = Board()
+        self.board.mover_ficha(self.jugador1, [(0, 3), (11, 12)], [3, 1])
+        otro.mover_ficha(self.jugador1, [(11, 12), (0, 3)], [3, 1])
+
+        self.assertEqual(self.board.hash_posicion(), otro.hash_posicion())
+        self.assertNotEqual(self.board.hash_posicion(), Board().hash_posicion())
+
+    def test_hash_posicion_incremental_coincide(self):
+        """Verifica que el hash incremental coincida con uno recalculado."""
+        self.board.set_posiciones(3, [Checker("O")])
+        self.board.set_bar("player1", 1)
+        self.board.mover_ficha(self.jugador1, [("bar", 3)], [3])
+        recalculado = Board()
+        recalculado.set_conteos(self.board.get_conteos())
+
+        self.assertEqual(self.board.get_bar("player2"), 1)
+        self.assertEqual(self.board.hash_posicion(), recalculado.hash_posicion())
+
+    def test_hash_posicion_sacar_ficha(self):
+        """Verifica que sacar una ficha actualice el hash correctamente."""
+        self._vaciar()
+        self.board.set_posiciones(22, [Checker("X")])
+        self.board.mover_ficha(self.jugador1, [(22, "fuera")], [1])
+        esperado = Board()
+        esperado.set_conteos([0] * 26 + [1, 0])
+
+        self.assertEqual(self.board.hash_posicion(), esperado.hash_posicion())
+
+    def test_hash_posicion_turno_y_dados(self):
+        """Verifica que el turno y los dados sean partes opcionales de la clave."""
+        base = self.board.hash_posicion()
+        con_x = self.board.hash_posicion(self.jugador1)
+        con_o = self.board.hash_posicion(self.jugador2)
+        con_dados = self.board.hash_posicion(self.jugador1, [3, 1])
+
+        self.assertEqual(len({base, con_x, con_o, con_dados}), 4)
+        self.assertEqual(con_dados, self.board.hash_posicion(self.jugador1, [1, 3]))
+        self.assertLess(base, 2 ** 64)
+
+    def test_aplicar_y_deshacer_con_captura(self):
+        """Verifica que deshacer restaure posición, bar y hash tras comer."""
+        self.board.set_posiciones(3, [Checker("O")])
+        antes = self.board.get_conteos()
+        hash_antes = self.board.hash_posicion()
+
+        comida = self.board.aplicar((0, 3), self.jugador1)
+        self.assertTrue(comida)
+        self.assertEqual(self.board.get_bar("player2"), 1)
+
+        self.board.deshacer()
+        self.assertEqual(self.board.get_conteos(), antes)
+        self.assertEqual(self.board.hash_posicion(), hash_antes)
+
+    def test_aplicar_y_deshacer_jugada_completa(self):
+        """Verifica deshacer en orden inverso una jugada con bar y salida."""
+        self._vaciar()
+        self.board.set_bar("player2", 1)
+        self.board.set_posiciones(2, [Checker("O")])
+        antes = self.board.get_conteos()
+        for movimiento in [("bar", 20), (2, "fuera")]:
+            self.board.aplicar(movimiento, self.jugador2)
+        self.assertEqual(self.board.get_fuera("player2"), 1)
+
+        self.board.deshacer()
+        self.board.deshacer()
+        self.assertEqual(self.board.get_conteos(), antes)
+
+    def test_aplicar_muchos_movimientos(self):
+        """Verifica que la pila de deshacer crezca más allá de su capacidad."""
+        antes = self.board.get_conteos()
+        for _ in range(50):
+            self.board.aplicar((16, 17), self.jugador1)
+            self.board.aplicar((17, 16), self.jugador1)
+        for _ in range(100):
+            self.board.deshacer()
+        self.assertEqual(self.board.get_conteos(), antes)
+
+    def test_aplicar_invalido(self):
+        """Verifica los errores de aplicar con movimientos no válidos."""
+        with self.assertRaises(MovimientoInvalidoError):
+            self.board.aplicar((5, 8), self.jugador1)
+        with self.assertRaises(MovimientoInvalidoError):
+            self.board.aplicar((0, 5), self.jugador1)
+        with self.assertRaises(PuntoInvalidoError):
+            self.board.aplicar((0, 30), self.jugador1)
+        with self.assertRaises(MovimientoMalFormadoError):
+            self.board.aplicar([0, 3], self.jugador1)
+
+    def test_deshacer_sin_movimientos(self):
+        """Verifica error al deshacer sin movimientos aplicados."""
+        with self.assertRaises(MovimientoInvalidoError):
+            self.board.deshacer()
+
+    def test_fuera_de_casa_inicial(self):
+        """Verifica el contador de fichas fuera de la casa al empezar."""
+        self.assertEqual(self.board.get_fuera_de_casa("player1"), 10)
+        self.assertEqual(self.board.get_fuera_de_casa("player2"), 10)
+
+    def test_fuera_de_casa_se_actualiza_al_mover(self):
+        """Verifica que entrar a casa y ser comido actualicen los contadores."""
+        self.board.set_posiciones(20, [Checker("O")])
+        self.board.mover_ficha(self.jugador1, [(16, 20)], [4])
+
+        self.assertEqual(self.board.get_fuera_de_casa("player1"), 9)
+        self.assertEqual(self.board.get_fuera_de_casa("player2"), 11)
+
+    def test_puede_sacar_false_con_ficha_en_bar(self):
+        """Verifica que una ficha en el bar impida sacar fichas."""
+        self._vaciar()
+        self.board.set_posiciones(22, [Checker("X")])
+        self.board.set_bar("player1", 1)
+
+        self.assertFalse(self.board.puede_sacar(self.jugador1))
+
+    def test_contadores_fichas_y_pips(self):
+        """Verifica fichas en tablero y pips tras comer y sacar."""
+        self.board.set_posiciones(3, [Checker("O")])
+        self.board.mover_ficha(self.jugador1, [(0, 3)], [3])
+
+        self.assertEqual(self.board.get_fichas_en_tablero("player1"), 15)
+        self.assertEqual(self.board.get_fichas_en_tablero("player2"), 15)
+        self.assertEqual(self.board.get_pips("player1"), 152 - 3)
+        self.assertEqual(self.board.get_pips("player2"), 152 + 23)
+
+        self._vaciar()
+        self.board.set_posiciones(21, [Checker("X"), Checker("X")])
+        self.board.mover_ficha(self.jugador1, [(21, "fuera")], [2])
+        self.assertEqual(self.board.get_fichas_en_tablero("player1"), 1)
+        self.assertEqual(self.board.get_pips("player1"), 2)
+
+    def test_get_vista_comparte_estado(self):
+        """Verifica que la vista refleje los movimientos sin copiar."""
+        vista = self.board.get_vista()
+        self.assertIs(vista, self.board.get_vista())
+
+        self.board.mover_ficha(self.jugador1, [(0, 3)], [3])
+        self.assertEqual(vista.get_conteo(3), 1)
+        self.assertEqual(
+            [c.get_simbolo() for c in vista["posiciones"][3]], ["X"]
+        )
+        self.assertEqual(len(vista["posiciones"][5]), 5)
+
+        self.board.set_conteos([0] * 26 + [15, 0])
+        self.assertEqual(vista["fuera"]["player1"], 15)
+
+    def test_get_vista_solo_lectura(self):
+        """Verifica que la vista no permita modificar el tablero."""
+        vista = self.board.get_vista()
+        self.assertIsInstance(vista["posiciones"][0], tuple)
+        with self.assertRaises(TypeError):
+            vista["bar"]["player1"] = 3  # pylint: disable=unsupported-assignment-operation
+        with self.assertRaises(KeyError):
+            _ = vista["otra"]
+
+    def test_get_vista_instantanea(self):
+        """Verifica que la instantánea no cambie con movimientos posteriores."""
+        instantanea = self.board.get_vista(instantanea=True)
+        self.board.mover_ficha(self.jugador1, [(0, 3)], [3])
+
+        self.assertEqual(instantanea.get_conteo(0), 2)
+        self.assertEqual(instantanea.get_conteo(3), 0)
+        self.assertEqual(dict(instantanea["bar"]), {"player1": 0, "player2": 0})
+    def test_hash_canonico_reflejo(self):
+        """Verifica que una posición y su reflejo compartan la clave canónica."""
+        self.board.mover_ficha(self.jugador1, [(0, 3), (11, 12)], [3, 1])
+        self.board.set_bar("player2", 1)
+        reflejo = Board()
+        reflejo.set_conteos(reflejar_conteos(self.board.get_conteos()))
+
+        self.assertEqual(
+            self.board.hash_canonico(self.jugador1, [6, 2]),
+            reflejo.hash_canonico(self.jugador2, [2, 6]),
+        )
+        self.assertEqual(
+            self.board.hash_canonico(self.jugador2), reflejo.hash_canonico(self.jugador1)
+        )
+        self.assertNotEqual(
+            self.board.hash_canonico(self.jugador1), self.board.hash_canonico(self.jugador2)
+        )
+        self.assertEqual(
+            reflejo.get_conteos_canonicos(self.jugador2), self.board.get_conteos()
+        )
+        self.assertEqual(reflejar_conteos(reflejo.get_conteos()), self.board.get_conteos())
+
+    def test_hash_canonico_posicion_inicial(self):
+        """Verifica que la posición inicial, simétrica, tenga una sola clave."""
+        self.assertEqual(
+            self.board.hash_canonico(self.jugador1, [3, 1]),
+            self.board.hash_canonico(self.jugador2, [3, 1]),
+        )
+        self.assertEqual(
+            self.board.hash_canonico(self.jugador1), self.board.hash_posicion()
+        )
+
+    def test_reflejar_jugada(self):
+        """Verifica que reflejar una jugada legal dé la jugada del reflejo."""
+        jugada = [("bar", 2), (2, 8), (20, "fuera")]
+        self.assertEqual(reflejar_jugada(jugada), [("bar", 21), (21, 15), (3, "fuera")])
+        for jugada, posicion in self.board.jugadas_y_posiciones(self.jugador1, 5, 2):
+            reflejo = Board()
+            reflejo.mover_ficha(self.jugador2, reflejar_jugada(jugada), [5, 2])
+            self.assertEqual(
+                reflejo.get_conteos_canonicos(self.jugador2),
+                tuple(array("b", posicion)),
+            )
+    def test_mover_ficha_vacia_la_pila_de_deshacer(self):
+        """Verifica que deshacer no revierta aplicar después de mover_ficha."""
+        self.board.aplicar((0, 3), self.jugador1)
+        self.board.mover_ficha(self.jugador1, [(11, 14)], [3])
+        conteos = self.board.get_conteos()
+        with self.assertRaises(MovimientoInvalidoError):
+            self.board.deshacer()
+        self.assertEqual(self.board.get_conteos(), conteos)
+        self.board.set_conteos(Board().get_conteos())
+        self.board.aplicar((0, 3), self.jugador1)
+        self.board.set_conteos(conteos)
+        with self.assertRaises(MovimientoInvalidoError):
+            self.board.deshacer()
+
 
 if __name__ == "__main__":
     unittest.main()
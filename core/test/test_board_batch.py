@@ -0,0 +1,187 @@
+"""
+Pruebas unitarias para el tablero vectorizado BoardBatch.
+"""
+import random
+import unittest
+import numpy as np
+from core.clases.board import Board, POSICION_INICIAL
+from core.clases.board_batch import BoardBatch, movimientos_legales
+from core.clases.checker import Checker
+from core.clases.player import Player
+from core.clases.excepciones import MovimientoInvalidoError, PuntoInvalidoError
+
+_CASILLA_BAR = {"X": 24, "O": 25}
+_CASILLA_FUERA = {"X": 26, "O": 27}
+
+
+class TestBoardBatch(unittest.TestCase):
+    """Suite de pruebas para BoardBatch."""
+
+    def setUp(self):
+        """Crea jugadores de referencia."""
+        self.jugador1 = Player("player1", "X")
+        self.jugador2 = Player("player2", "O")
+
+    def test_posicion_inicial(self):
+        """Verifica que el lote arranque con la posición inicial."""
+        lote = BoardBatch(3)
+        self.assertEqual(lote.get_conteos().shape, (3, 28))
+        self.assertEqual(lote.get_conteos().dtype, np.int8)
+        self.assertEqual(tuple(lote.get_conteos()[2]), POSICION_INICIAL)
+
+    def test_ida_y_vuelta_con_board(self):
+        """Verifica que los tableros individuales se conserven."""
+        board = Board()
+        board.set_bar("player2", 2)
+        board.set_posiciones(3, [Checker("X")])
+        lote = BoardBatch.desde_boards([Board(), board])
+
+        self.assertEqual(len(lote), 2)
+        self.assertEqual(lote.a_board(1).get_conteos(), board.get_conteos())
+        self.assertEqual(lote.a_boards()[1].hash_posicion(), board.hash_posicion())
+
+    def test_set_conteos_forma_invalida(self):
+        """Verifica error al cargar un arreglo sin 28 columnas."""
+        with self.assertRaises(PuntoInvalidoError):
+            BoardBatch(1).set_conteos(np.zeros((2, 24)))
+
+    def test_aplicar_coincide_con_board(self):
+        """Verifica contra Board.aplicar jugadas reales de varias partidas."""
+        # pylint: disable=too-many-locals
+        generador = random.Random(7)
+        boards = [Board() for _ in range(20)]
+        lote = BoardBatch.desde_boards(boards)
+        jugadores = [self.jugador1, self.jugador2]
+        for turno in range(30):
+            jugador = jugadores[turno % 2]
+            ficha = jugador.get_ficha()
+            jugadas = [
+                board.jugadas_legales(
+                    jugador, generador.randint(1, 6), generador.randint(1, 6)
+                ) for board in boards
+            ]
+            jugadas = [generador.choice(j) if j else [] for j in jugadas]
+            for paso in range(4):
+                activos = np.array([len(j) > paso for j in jugadas])
+                origen = np.zeros(len(boards), dtype=int)
+                destino = np.zeros(len(boards), dtype=int)
+                esperado = np.zeros(len(boards), dtype=bool)
+                for i, jugada in enumerate(jugadas):
+                    if not activos[i]:
+                        continue
+                    desde, hasta = jugada[paso]
+                    origen[i] = _CASILLA_BAR[ficha] if desde == "bar" else desde
+                    destino[i] = _CASILLA_FUERA[ficha] if hasta == "fuera" else hasta
+                    esperado[i] = boards[i].aplicar(jugada[paso], jugador)
+                comidas = lote.aplicar(
+                    origen, destino, 1 if ficha == "X" else -1, activos
+                )
+                np.testing.assert_array_equal(comidas, esperado)
+            for i, board in enumerate(boards):
+                self.assertEqual(tuple(lote.get_conteos()[i]), board.get_conteos())
+
+    def test_aplicar_entrada_comida_y_salida(self):
+        """Verifica bar, captura y salida en una sola llamada."""
+        lote = BoardBatch(3)
+        conteos = np.zeros((3, 28), dtype=np.int8)
+        conteos[0, 24] = 1
+        conteos[1, 10] = 1
+        conteos[1, 13] = -1
+        conteos[2, 20] = 1
+        lote.set_conteos(conteos)
+
+        comidas = lote.aplicar([24, 10, 20], [3, 13, 26], 1)
+
+        np.testing.assert_array_equal(comidas, [False, True, False])
+        self.assertEqual(lote.get_conteos()[0, 3], 1)
+        self.assertEqual(lote.get_conteos()[1, 13], 1)
+        self.assertEqual(lote.get_conteos()[1, 25], 1)
+        self.assertEqual(lote.get_conteos()[2, 26], 1)
+
+    def test_aplicar_invalido(self):
+        """Verifica error al mover a un punto bloqueado o sin fichas."""
+        lote = BoardBatch(2)
+        with self.assertRaises(MovimientoInvalidoError):
+            lote.aplicar([0, 0], [5, 1], 1)
+        with self.assertRaises(MovimientoInvalidoError):
+            lote.aplicar([3, 0], [4, 1], 1)
+
+    def test_ganadores(self):
+        """Verifica la detección vectorizada de partidas terminadas."""
+        lote = BoardBatch(3)
+        conteos = lote.get_conteos()
+        conteos[0, 26] = 15
+        conteos[2, 27] = 15
+        np.testing.assert_array_equal(lote.ganadores(), [1, 0, -1])
+
+    def _es_legal(self, board, jugador, origen, dado):
+        """Prueba con mover_ficha sobre una copia si el movimiento simple entra."""
+        dado = int(dado)
+        signo = 1 if jugador.get_ficha() == "X" else -1
+        desde = "bar" if origen == 24 else origen
+        inicio = (0 if signo > 0 else 23) if origen == 24 else origen
+        destinos = ["fuera"]
+        if 0 <= inicio + signo * dado < 24:
+            destinos.append(inicio + signo * dado)
+        for hasta in destinos:
+            copia = Board()
+            copia.set_conteos(board.get_conteos())
+            resultado = copia.mover_ficha(jugador, [(desde, hasta)], [dado])
+            if resultado["resultados"][0]:
+                return True
+        return False
+
+    def test_movimientos_legales_coincide_con_mover_ficha(self):
+        """Verifica las máscaras contra mover_ficha en posiciones variadas."""
+        # pylint: disable=too-many-locals
+        generador = random.Random(11)
+        boards = []
+        for _ in range(25):
+            board = Board()
+            jugadores = [self.jugador1, self.jugador2]
+            for turno in range(generador.randint(0, 40)):
+                jugadas = board.jugadas_legales(
+                    jugadores[turno % 2],
+                    generador.randint(1, 6), generador.randint(1, 6)
+                )
+                for movimiento in generador.choice(jugadas) if jugadas else []:
+                    board.aplicar(movimiento, jugadores[turno % 2])
+            boards.append(board)
+        salida = Board()
+        salida.set_conteos([0] * 18 + [2, 0, 1, 3, 0, 0] + [0, 0, 9, 0])
+        boards.append(salida)
+        signos = np.array([generador.choice([1, -1]) for _ in boards])
+        signos[-1] = 1
+        dados = np.array([
+            [generador.randint(1, 6), generador.randint(1, 6)] for _ in boards
+        ])
+        dados[-1] = [3, 5]
+
+        mascara = movimientos_legales(
+            BoardBatch.desde_boards(boards).get_conteos(), dados, signos
+        )
+
+        self.assertEqual(mascara.shape, (len(boards), 25, 2))
+        for i, board in enumerate(boards):
+            jugador = self.jugador1 if signos[i] > 0 else self.jugador2
+            for columna in range(2):
+                for origen in range(25):
+                    self.assertEqual(
+                        mascara[i, origen, columna],
+                        self._es_legal(board, jugador, origen, dados[i, columna]),
+                        (i, origen, columna)
+                    )
+
+    def test_movimientos_legales_bar_primero(self):
+        """Verifica que con fichas en el bar solo se pueda entrar."""
+        lote = BoardBatch(1)
+        lote.get_conteos()[0, 25] = 1
+        mascara = lote.movimientos_legales([[3, 0]], -1)
+
+        self.assertTrue(mascara[0, 24, 0])
+        self.assertFalse(mascara[0, :24].any())
+        self.assertFalse(mascara[0, :, 1].any())
+
+
+if __name__ == "__main__":
+    unittest.main()
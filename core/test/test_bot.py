@@ -0,0 +1,97 @@
+"""
+Pruebas unitarias para el bot de expectiminimax.
+"""
+import unittest
+import numpy as np
+from core.clases.board import Board
+from core.clases.bot import BotExpectiminimax, TIRADAS
+from core.clases.checker import Checker
+from core.clases.evaluador import EvaluadorHeuristico
+from core.clases.player import Player
+
+
+class TestBotExpectiminimax(unittest.TestCase):
+    """Suite de pruebas para BotExpectiminimax."""
+
+    def setUp(self):
+        """Crea jugadores y un tablero inicial."""
+        self.jugador1 = Player("player1", "X")
+        self.jugador2 = Player("player2", "O")
+        self.board = Board()
+
+    def _valor_dos_jugadas(self, jugada, jugador, rival, tirada):
+        """Calcula a fuerza bruta el valor a 2 jugadas de una jugada."""
+        evaluador = EvaluadorHeuristico()
+        signo = 1 if jugador.get_ficha() == "X" else -1
+        board = Board()
+        board.set_conteos(self.board.get_conteos())
+        board.mover_ficha(jugador, jugada, [tirada[0], tirada[1]])
+        total = 0.0
+        for dado1, dado2, peso in TIRADAS:
+            posiciones = [
+                np.frombuffer(posicion, dtype=np.int8)
+                for _, posicion in board.jugadas_y_posiciones(rival, dado1, dado2)
+            ] or [board.get_conteos()]
+            total += peso * max(-signo * evaluador.evaluar(posiciones))
+        return -total / 36
+
+    def test_pesos_de_tiradas(self):
+        """Verifica las 21 tiradas y que los pesos sumen 36."""
+        self.assertEqual(len(TIRADAS), 21)
+        self.assertEqual(sum(peso for _, _, peso in TIRADAS), 36)
+
+    def test_jugada_legal_sin_modificar_tablero(self):
+        """Verifica que el bot devuelva una jugada legal y no mueva fichas."""
+        antes = self.board.get_conteos()
+        bot = BotExpectiminimax(profundidad=1)
+        jugada = bot.elegir_jugada(self.board, self.jugador2, 6, 4)
+        self.assertIn(jugada, self.board.jugadas_legales(self.jugador2, 6, 4))
+        self.assertEqual(self.board.get_conteos(), antes)
+
+    def test_sin_movimientos(self):
+        """Verifica que sin movimientos posibles devuelva una jugada vacía."""
+        self.board.set_conteos([0] * 28)
+        self.board.set_bar("player1", 1)
+        for punto in range(1, 7):
+            self.board.set_posiciones(punto, [Checker("O")] * 2)
+        bot = BotExpectiminimax()
+        self.assertEqual(bot.elegir_jugada(self.board, self.jugador1, 3, 5), [])
+
+    def test_prefiere_ganar(self):
+        """Verifica que el bot saque la última ficha cuando puede."""
+        self.board.set_conteos([0] * 28)
+        self.board.set_posiciones(20, [Checker("X")])
+        self.board.set_fuera("player1", 14)
+        self.board.set_posiciones(2, [Checker("O")] * 15)
+        bot = BotExpectiminimax()
+        self.assertEqual(
+            bot.elegir_jugada(self.board, self.jugador1, 3, 1), [(20, "fuera")]
+        )
+
+    def test_dos_jugadas_coincide_con_fuerza_bruta(self):
+        """Verifica que la poda no cambie el valor de la jugada elegida."""
+        bot = BotExpectiminimax(profundidad=2)
+        jugada = bot.elegir_jugada(self.board, self.jugador1, 4, 2)
+        valores = [
+            self._valor_dos_jugadas(candidata, self.jugador1, self.jugador2, (4, 2))
+            for candidata in self.board.jugadas_legales(self.jugador1, 4, 2)
+        ]
+        elegido = self._valor_dos_jugadas(jugada, self.jugador1, self.jugador2, (4, 2))
+        self.assertAlmostEqual(elegido, max(valores))
+
+    def test_poda_reduce_nodos(self):
+        """Verifica que Star1 evite evaluar todas las respuestas."""
+        bot = BotExpectiminimax(profundidad=2)
+        bot.elegir_jugada(self.board, self.jugador1, 6, 1)
+        candidatas = self.board.jugadas_y_posiciones(self.jugador1, 6, 1)
+        completo = len(candidatas)
+        for _, posicion in candidatas:
+            board = Board()
+            board.set_conteos(list(np.frombuffer(posicion, dtype=np.int8)))
+            for dado1, dado2, _ in TIRADAS:
+                completo += len(board.jugadas_legales(self.jugador2, dado1, dado2))
+        self.assertLess(bot.get_nodos(), completo)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,6 +29,12 @@ class TestChecker(unittest.TestCase):
         self.assertEqual(repr(ficha_x), "X")
         self.assertEqual(repr(ficha_o), "O")
 
+    def test_igualdad_por_simbolo(self):
+        """Verifica que dos fichas del mismo jugador sean iguales."""
+        self.assertEqual(Checker("X"), Checker("X"))
+        self.assertNotEqual(Checker("X"), Checker("O"))
+        self.assertEqual(hash(Checker("O")), hash(Checker("O")))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+"""
+Pruebas unitarias para la codificación de posiciones.
+"""
+import unittest
+import numpy as np
+from core.clases.board import Board, POSICION_INICIAL
+from core.clases.board_batch import BoardBatch
+from core.clases.codificador import ENTRADAS, codificar
+
+
+def _codificar_lento(conteos, turno):
+    """Codificación de referencia recorriendo punto por punto."""
+    entradas = []
+    for signo in (1, -1):
+        for punto in range(24):
+            fichas = max(signo * conteos[punto], 0)
+            entradas += [fichas >= 1, fichas >= 2, fichas >= 3, max(fichas - 3, 0) / 2]
+    entradas += [conteos[24] / 2, conteos[25] / 2, conteos[26] / 15, conteos[27] / 15]
+    return entradas + [turno > 0, turno < 0]
+
+
+class TestCodificador(unittest.TestCase):
+    """Suite de pruebas para codificar."""
+
+    def setUp(self):
+        """Arma algunas posiciones variadas."""
+        generador = np.random.default_rng(2)
+        self.posiciones = [list(POSICION_INICIAL)]
+        for _ in range(5):
+            conteos = [int(v) for v in generador.integers(-7, 8, 28)]
+            conteos[24:] = [int(v) for v in generador.integers(0, 4, 4)]
+            self.posiciones.append(conteos)
+
+    def test_coincide_con_referencia(self):
+        """Verifica la codificación vectorizada contra la de referencia."""
+        turnos = np.array([1, -1, 1, -1, 1, -1])
+        resultado = codificar(self.posiciones, turnos)
+        self.assertEqual(resultado.shape, (6, ENTRADAS))
+        self.assertEqual(resultado.dtype, np.float32)
+        for fila, conteos, turno in zip(resultado, self.posiciones, turnos):
+            np.testing.assert_allclose(fila, _codificar_lento(conteos, turno), rtol=1e-6)
+
+    def test_escribe_en_el_buffer(self):
+        """Verifica que se use el buffer recibido sin crear otro."""
+        buffer = np.full((6, ENTRADAS), 9.0, dtype=np.float32)
+        resultado = codificar(np.array(self.posiciones), -1, out=buffer)
+        self.assertIs(resultado, buffer)
+        np.testing.assert_array_equal(buffer, codificar(self.posiciones, -1))
+        with self.assertRaises(ValueError):
+            codificar(self.posiciones, 1, out=np.zeros((5, ENTRADAS), dtype=np.float32))
+
+    def test_acepta_boards_y_lotes(self):
+        """Verifica que se puedan codificar tableros y lotes directamente."""
+        board = Board()
+        esperado = codificar([POSICION_INICIAL])
+        np.testing.assert_array_equal(codificar(board), esperado)
+        np.testing.assert_array_equal(codificar([board, board])[1], esperado[0])
+        np.testing.assert_array_equal(codificar(BoardBatch(3))[2], esperado[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
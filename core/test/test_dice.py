@@ -1,6 +1,7 @@
 """
 Módulo de pruebas unitarias para la clase Dice.
 """
+import random
 import unittest
 from core.clases.dice import Dice
 
@@ -28,5 +29,66 @@ class TestDice(unittest.TestCase):
         dados.__dado2__ = 6
         resultado = dados.get_valores()
         self.assertEqual(resultado, (4, 6))
+
+    def test_semilla_reproducible(self):
+        """Verifica que la misma semilla produzca las mismas tiradas."""
+        primera = Dice(42).lanzar_dados()
+        dados_a = Dice(42)
+        dados_b = Dice(42)
+        tiradas_a = [dados_a.lanzar_dados() for _ in range(50)]
+        tiradas_b = [dados_b.lanzar_dados() for _ in range(50)]
+        self.assertEqual(tiradas_a, tiradas_b)
+        self.assertEqual(primera, tiradas_a[0])
+        self.assertIsNotNone(dados_a.get_semilla())
+
+    def test_generador_explicito(self):
+        """Verifica que se pueda pasar una instancia de random.Random."""
+        dados = Dice(random.Random(3))
+        referencia = random.Random(3)
+        esperado = (referencia.randint(1, 6), referencia.randint(1, 6))
+        self.assertEqual(dados.lanzar_dados(), esperado)
+        self.assertIsNone(dados.get_semilla())
+
+    def test_generar_flujos_independientes(self):
+        """Verifica que los flujos derivados sean distintos y reproducibles."""
+        flujos = Dice.generar_flujos(7, 3)
+        otra_vez = Dice.generar_flujos(7, 3)
+        secuencias = [
+            [dado.lanzar_dados() for _ in range(30)] for dado in flujos
+        ]
+        self.assertEqual(len(flujos), 3)
+        self.assertNotEqual(secuencias[0], secuencias[1])
+        self.assertEqual(
+            secuencias[2], [otra_vez[2].lanzar_dados() for _ in range(30)]
+        )
+
+    def test_buffer_reproducible(self):
+        """Verifica que el modo con buffer sea determinista al rellenarse."""
+        dados_a = Dice(11, tam_buffer=4)
+        dados_b = Dice(11, tam_buffer=4)
+        tiradas = [dados_a.lanzar_dados() for _ in range(10)]
+        self.assertEqual(tiradas, [dados_b.lanzar_dados() for _ in range(10)])
+        self.assertEqual(dados_a.get_valores(), tiradas[-1])
+        for dado1, dado2 in tiradas:
+            self.assertIn(dado1, range(1, 7))
+            self.assertIn(dado2, range(1, 7))
+        self.assertIsInstance(tiradas[0][0], int)
+
+    def test_buffer_no_depende_del_tamano(self):
+        """Verifica que la secuencia no cambie con el tamaño del bloque."""
+        chico = Dice(3, tam_buffer=1)
+        grande = Dice(3, tam_buffer=50)
+        self.assertEqual(
+            [chico.lanzar_dados() for _ in range(20)],
+            [grande.lanzar_dados() for _ in range(20)],
+        )
+
+    def test_buffer_con_generador_externo(self):
+        """Verifica que un random.Random también sirva como semilla del buffer."""
+        dados_a = Dice(random.Random(8), tam_buffer=16)
+        dados_b = Dice(random.Random(8), tam_buffer=16)
+        self.assertEqual(dados_a.lanzar_dados(), dados_b.lanzar_dados())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,108 @@
+"""
+Pruebas unitarias para el entrenamiento TD(lambda) por autojuego.
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.clases.board import Board
+from core.clases.entrenador import EntrenadorTD
+from core.clases.entrenador import _TABLAS, _resultado
+from core.clases.evaluador import EvaluadorRed
+
+_CHICA = {"simultaneas": 4, "max_turnos": 60}
+
+
+class TestEntrenadorTD(unittest.TestCase):
+    """Suite de pruebas para EntrenadorTD."""
+    # pylint: disable=protected-access
+
+    def test_gradientes_coinciden_con_diferencias_finitas(self):
+        """Verifica el gradiente de cada salida contra diferencias finitas."""
+        red = EvaluadorRed(ocultas=5, semilla=2)
+        entrenador = EntrenadorTD(red, {"simultaneas": 1}, semilla=0)
+        conteos = np.array([Board().get_conteos()], dtype=np.int8)
+        turnos = np.array([-1])
+        _, gradientes = entrenador._gradientes(conteos, turnos)
+        for nivel, (pesos, _) in enumerate(red.get_capas()):
+            for i, j in ((0, 0), (1, 2), (pesos.shape[0] - 1, pesos.shape[1] - 1)):
+                original = pesos[i, j]
+                pesos[i, j] = original + 1e-2
+                arriba = red.probabilidades(conteos, turnos)[0].astype(np.float64)
+                pesos[i, j] = original - 1e-2
+                abajo = red.probabilidades(conteos, turnos)[0].astype(np.float64)
+                pesos[i, j] = original
+                np.testing.assert_allclose(
+                    gradientes[nivel][0][0, :, i, j], (arriba - abajo) / 2e-2,
+                    atol=1e-4,
+                )
+
+    def test_entrenar_completa_partidas_y_cambia_pesos(self):
+        """Verifica que entrenar juegue las partidas pedidas y aprenda."""
+        red = EvaluadorRed(ocultas=8, semilla=1)
+        antes = [pesos.copy() for pesos, _ in red.get_capas()]
+        entrenador = EntrenadorTD(red, _CHICA, semilla=3)
+        estadisticas = entrenador.entrenar(6)
+        self.assertGreaterEqual(
+            estadisticas["partidas"] + estadisticas["descartadas"], 6
+        )
+        self.assertGreater(estadisticas["pasos"], 0)
+        self.assertGreater(estadisticas["partidas_por_segundo"], 0)
+        self.assertTrue(any(
+            not np.array_equal(previos, pesos)
+            for previos, (pesos, _) in zip(antes, red.get_capas())
+        ))
+
+    def test_misma_semilla_mismo_entrenamiento(self):
+        """Verifica que el entrenamiento sea reproducible con la semilla."""
+        redes = [EvaluadorRed(ocultas=8, semilla=1) for _ in range(2)]
+        for red in redes:
+            EntrenadorTD(red, _CHICA, semilla=7).entrenar(4)
+        for (pesos_a, _), (pesos_b, _) in zip(*(red.get_capas() for red in redes)):
+            np.testing.assert_array_equal(pesos_a, pesos_b)
+
+    def test_punto_de_control_y_reanudar(self):
+        """Verifica que reanudar recupere pesos, configuración y contadores."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "punto.npz")
+            red = EvaluadorRed(ocultas=8, semilla=1)
+            entrenador = EntrenadorTD(red, _CHICA, semilla=3)
+            estadisticas = entrenador.entrenar(4, ruta_punto=ruta, cada=2)
+            self.assertTrue(os.path.exists(ruta))
+
+            nueva = EvaluadorRed(ocultas=8, semilla=9)
+            reanudado = EntrenadorTD.reanudar(ruta, nueva, semilla=4)
+            for (pesos_a, sesgos_a), (pesos_b, sesgos_b) in zip(
+                    red.get_capas(), nueva.get_capas()):
+                np.testing.assert_array_equal(pesos_a, pesos_b)
+                np.testing.assert_array_equal(sesgos_a, sesgos_b)
+            recuperadas = reanudado.get_estadisticas()
+            self.assertEqual(recuperadas["partidas"], estadisticas["partidas"])
+            self.assertEqual(recuperadas["pasos"], estadisticas["pasos"])
+
+            seguidas = reanudado.entrenar(2)
+            self.assertGreaterEqual(
+                seguidas["partidas"] + seguidas["descartadas"],
+                estadisticas["partidas"] + estadisticas["descartadas"] + 2,
+            )
+
+    def test_resultado(self):
+        """Verifica los resultados de partidas terminadas, trabadas y en curso."""
+        conteos = list(Board().get_conteos())
+        self.assertIsNone(_resultado(conteos))
+
+        gana_x = [0] * 28
+        gana_x[26], gana_x[5] = 15, -15
+        self.assertEqual(_resultado(gana_x), (1.0, 1.0, 0.0))
+
+        trabada_x = [0] * 28
+        trabada_x[23], trabada_x[26] = 1, 14
+        trabada_x[10], trabada_x[27] = -5, 10
+        self.assertEqual(_resultado(trabada_x), (0.0, 0.0, 0.0))
+
+        trabada_x[0], trabada_x[10] = -1, -4
+        self.assertEqual(_resultado(trabada_x), _TABLAS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Pruebas unitarias para los evaluadores de posiciones.
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.clases.board import Board, POSICION_INICIAL
+from core.clases.bot import BotExpectiminimax
+from core.clases.evaluador import EvaluadorHeuristico, EvaluadorRed
+from core.clases.player import Player
+
+
+def _espejar(conteos):
+    """Intercambia los colores de una posición (punto p -> 23 - p)."""
+    puntos = [-valor for valor in reversed(conteos[:24])]
+    return puntos + [conteos[25], conteos[24], conteos[27], conteos[26]]
+
+
+class TestEvaluadorHeuristico(unittest.TestCase):
+    """Suite de pruebas para EvaluadorHeuristico."""
+
+    def setUp(self):
+        """Crea el evaluador."""
+        self.evaluador = EvaluadorHeuristico()
+
+    def test_posicion_inicial_pareja(self):
+        """Verifica que la posición inicial valga cero para ambos."""
+        valor = self.evaluador.evaluar([POSICION_INICIAL])
+        self.assertEqual(valor.shape, (1,))
+        self.assertAlmostEqual(float(valor[0]), 0.0)
+
+    def test_simetria_de_colores(self):
+        """Verifica que espejar la posición invierta el signo."""
+        conteos = list(POSICION_INICIAL)
+        conteos[0], conteos[4], conteos[24] = 0, 1, 1
+        valores = self.evaluador.evaluar([conteos, _espejar(conteos)])
+        self.assertAlmostEqual(float(valores[0]), -float(valores[1]))
+        self.assertLess(float(valores[0]), 0.0)
+
+    def test_posiciones_terminales(self):
+        """Verifica que una partida ganada valga exactamente la cota."""
+        gana_x = [0] * 28
+        gana_x[26], gana_x[5] = 15, -15
+        valores = self.evaluador.evaluar(
+            np.array([gana_x, _espejar(gana_x)], dtype=np.int8)
+        )
+        self.assertEqual(valores.tolist(), [1.0, -1.0])
+        inferior, superior = self.evaluador.get_cotas()
+        self.assertEqual((inferior, superior), (-1.0, 1.0))
+
+
+class TestEvaluadorRed(unittest.TestCase):
+    """Suite de pruebas para EvaluadorRed."""
+
+    def setUp(self):
+        """Crea una red aleatoria reproducible."""
+        self.red = EvaluadorRed(ocultas=8, semilla=4)
+
+    def test_lote_igual_a_individual(self):
+        """Verifica que evaluar en lote dé lo mismo que de a una."""
+        otra = list(POSICION_INICIAL)
+        otra[0], otra[3] = 1, 1
+        lote = self.red.evaluar([POSICION_INICIAL, otra], np.array([1, -1]))
+        self.assertAlmostEqual(float(lote[1]), float(self.red.evaluar([otra], -1)[0]), places=5)
+        salidas = self.red.probabilidades([POSICION_INICIAL])
+        self.assertEqual(salidas.shape, (1, 3))
+        self.assertTrue(((salidas > 0) & (salidas < 1)).all())
+
+    def test_guardar_y_cargar(self):
+        """Verifica que los pesos se conserven en el archivo .npz."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "red.npz")
+            self.red.guardar(ruta)
+            cargada = EvaluadorRed.desde_archivo(ruta)
+        np.testing.assert_array_equal(
+            cargada.evaluar([POSICION_INICIAL]), self.red.evaluar([POSICION_INICIAL])
+        )
+        self.assertEqual(len(cargada.get_capas()), 2)
+
+    def test_un_solo_llamado_por_tirada(self):
+        """Verifica que el bot evalúe todas las jugadas de una vez."""
+        llamados = []
+        evaluar = self.red.evaluar
+
+        def contar(posiciones, turno=None):
+            llamados.append(len(posiciones))
+            return evaluar(posiciones, turno)
+
+        self.red.evaluar = contar
+        board = Board()
+        jugador = Player("player1", "X")
+        jugada = BotExpectiminimax(self.red, profundidad=1).elegir_jugada(
+            board, jugador, 3, 1
+        )
+        self.assertIn(jugada, board.jugadas_legales(jugador, 3, 1))
+        self.assertEqual(llamados, [len(board.jugadas_legales(jugador, 3, 1))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,7 +22,9 @@ from core.clases.excepciones import (
     PosicionBloqueadaError,
     ErrorDados,
     DadosNoLanzadosError,
-    ValorDadoInvalidoError
+    ValorDadoInvalidoError,
+    ErrorArchivo,
+    FormatoArchivoInvalidoError
 )
 
 
@@ -203,6 +205,13 @@ class TestJerarquiaExcepciones(unittest.TestCase):
         with self.assertRaises(ErrorBackgammon):
             raise ErrorDados("Test")
 
+    def test_error_de_archivo_hereda_de_error_backgammon(self):
+        """Verifica que los errores de formato de archivo no sean de tablero."""
+        with self.assertRaises(ErrorArchivo):
+            raise FormatoArchivoInvalidoError("Test")
+        self.assertFalse(issubclass(FormatoArchivoInvalidoError, ErrorTablero))
+        self.assertTrue(issubclass(ErrorArchivo, ErrorBackgammon))
+
 
 if __name__ == "__main__":
     unittest.main()
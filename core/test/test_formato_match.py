@@ -0,0 +1,151 @@
+"""
+Pruebas unitarias para la importación y exportación de archivos de match.
+"""
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from core.clases.backgammon_game import BackgammonGame
+from core.clases.board import Board
+from core.clases.bot import BotExpectiminimax
+from core.clases.excepciones import FormatoMovimientoInvalidoError
+from core.clases.formato_match import (
+    escribir_match, formatear_jugada, leer_match, parsear_jugada
+)
+from core.clases.registro import EscritorRegistros, leer_registros
+
+_MATCH = """ 3 point match
+
+ Game 1
+ Ana : 0                           Bruno : 0
+  1) 31: 8/5 6/5                    62: 24/18 18/16
+  2) 44: 13/9*(2) 24/20(2)          Doubles => 2
+  3)  Takes                         55:
+  4) 21: 13/11 6/5                  43: bar/21 13/9
+  5)  Doubles => 4                  Drops
+      Wins 2 points
+
+ Game 2
+ Ana : 2                           Bruno : 0
+  1)                                52: 13/8 13/11
+  2) 65: 24/13                      43: 8/4 6/3 Drops
+"""
+
+
+def _jugar(semilla):
+    """Juega una partida entre dos bots y devuelve el juego."""
+    juego = BackgammonGame("Ana", "Bruno", semilla=semilla)
+    bot = BotExpectiminimax(profundidad=1)
+    for numero in (1, 2):
+        juego.set_bot(numero, bot)
+    with contextlib.redirect_stdout(io.StringIO()):
+        juego.iniciar_partida()
+        while not juego.hay_ganador():
+            if juego.get_movimientos_restantes() <= 0:
+                juego.lanzar_dados()
+            dado1, dado2 = juego.get_registro()["turnos"][-1][:2]
+            juego.jugar_turno_bot(dado1, dado2)
+    return juego
+
+
+class TestFormatoMatch(unittest.TestCase):
+    """Suite de pruebas para leer_match y escribir_match."""
+
+    def test_parsear_jugada(self):
+        """Verifica la conversión de puntos a casillas para los dos colores."""
+        self.assertEqual(parsear_jugada("24/18 13/11*", "X"), [(0, 6), (11, 13)])
+        self.assertEqual(parsear_jugada("24/18 13/11*", "O"), [(23, 17), (12, 10)])
+        self.assertEqual(parsear_jugada("bar/20 6/off", "X"), [("bar", 4), (18, "fuera")])
+        self.assertEqual(parsear_jugada("Bar/20 6/Off", "O"), [("bar", 19), (5, "fuera")])
+        self.assertEqual(parsear_jugada("24/18*/13", "X"), [(0, 6), (6, 11)])
+        self.assertEqual(parsear_jugada("13/9(2)", "X"), [(11, 15), (11, 15)])
+        self.assertEqual(parsear_jugada("25/20 2/0", "X"), [("bar", 4), (22, "fuera")])
+        self.assertEqual(parsear_jugada("", "X"), [])
+        for texto in ("24-18", "30/24", "off/20", "24/bar", "13/9(x)"):
+            with self.assertRaises(FormatoMovimientoInvalidoError):
+                parsear_jugada(texto, "X")
+
+    def test_leer_match(self):
+        """Verifica las partidas leídas, ignorando cubo y resultados."""
+        primera, segunda = leer_match(io.StringIO(_MATCH))
+        self.assertEqual(primera, {
+            "jugadores": ("Ana", "Bruno"),
+            "semilla": None,
+            "empieza": "X",
+            "turnos": [
+                (3, 1, [(16, 19), (18, 19)]),
+                (6, 2, [(23, 17), (17, 15)]),
+                (4, 4, [(11, 15), (11, 15), (0, 4), (0, 4)]),
+                (5, 5, []),
+                (2, 1, [(11, 13), (18, 19)]),
+                (4, 3, [("bar", 20), (12, 8)]),
+            ],
+        })
+        self.assertEqual(segunda["empieza"], "O")
+        # "24/13" junta los dos dados; se guarda movimiento por movimiento.
+        self.assertEqual(segunda["turnos"], [
+            (5, 2, [(12, 7), (12, 10)]),
+            (6, 5, [(0, 6), (6, 11)]),
+            (4, 3, [(7, 3), (5, 2)]),
+        ])
+
+    def test_lee_en_flujo(self):
+        """Verifica que cada partida salga sin leer las siguientes."""
+        lineas = iter(io.StringIO(_MATCH))
+        lector = leer_match(lineas)
+        self.assertEqual(next(lector)["jugadores"], ("Ana", "Bruno"))
+        self.assertEqual(next(lineas).strip(), "Ana : 2                           Bruno : 0")
+
+    def test_error_con_numero_de_linea(self):
+        """Verifica que un movimiento ilegible indique la línea."""
+        with self.assertRaisesRegex(FormatoMovimientoInvalidoError, "Línea 3"):
+            list(leer_match(["Game 1", " A : 0   B : 0", "  1) 31: 8/5 6-5"]))
+
+    def test_jugadas_ilegales_en_el_tablero(self):
+        """Verifica que se rechacen las entradas y salidas de la geometría estándar."""
+        inicio = ["Game 1", " A : 0   B : 0", "  1) 31: 8/5 6/5              62: 24/18 18/16"]
+        for linea in ("  2) 44: 13/9*(2) 24/20(2)     52: bar/20 13/11",
+                      "  2) 44: 13/9*(2) 24/20(2)     54: bar/24 24/20",
+                      "  2) 44: 13/9*(2) 24/20(2)     55: 13/8",
+                      "  2) 44: 13/9*(2) 24/20(2)     43: 13/9 13/10"):
+            with self.assertRaisesRegex(FormatoMovimientoInvalidoError, "Línea 4: .*no es legal"):
+                list(leer_match(inicio + [linea]))
+
+    def test_match_registro_match(self):
+        """Verifica el viaje de ida y vuelta con entradas desde el bar y salidas."""
+        texto = "".join(escribir_match([{**_jugar(semilla=5).get_registro(), "semilla": None}]))
+        self.assertIn(" bar/", texto)
+        self.assertIn("/off", texto)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "partidas.bgr")
+            with EscritorRegistros(ruta) as escritor:
+                for registro in leer_match(io.StringIO(texto)):
+                    escritor.escribir(registro)
+            self.assertEqual("".join(escribir_match(leer_registros(ruta))), texto)
+
+    def test_exportar_e_importar(self):
+        """Verifica que una partida exportada se vuelva a leer igual."""
+        juego = _jugar(semilla=5)
+        registro = {**juego.get_registro(), "semilla": None}
+        texto = "".join(escribir_match([registro, registro], largo=5))
+        self.assertTrue(texto.startswith(" 5 point match\n"))
+        self.assertIn("*", texto)
+        self.assertIn(" Ana : 0", texto)
+        self.assertRegex(texto, r"Game 2\n Ana : [1-3] ")
+        self.assertRegex(texto, r"Wins \d points?\n")
+        leidos = list(leer_match(io.StringIO(texto)))
+        self.assertEqual(leidos, [registro, registro])
+
+    def test_formatear_jugada(self):
+        """Verifica la notación de una jugada que come."""
+        board = Board()
+        conteos = list(board.get_conteos())
+        conteos[4], conteos[5] = -1, -4
+        board.set_conteos(conteos)
+        self.assertEqual(formatear_jugada(board, "X", [(0, 4), (4, 8)]), "24/20* 20/16")
+        self.assertEqual(board.get_conteos()[25], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
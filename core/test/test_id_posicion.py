@@ -0,0 +1,91 @@
+"""
+Pruebas unitarias para el ID de posición.
+"""
+import random
+import unittest
+from core.clases.board import Board, reflejar_conteos
+from core.clases.excepciones import IdPosicionInvalidoError
+from core.clases.id_posicion import (
+    BYTES_ID,
+    codificar_id,
+    decodificar_id,
+    desempaquetar,
+    empaquetar,
+)
+from core.clases.player import Player
+
+
+class TestIdPosicion(unittest.TestCase):
+    """Suite de pruebas para el ID de posición."""
+
+    def setUp(self):
+        """Crea los jugadores."""
+        self.jugador1 = Player("player1", "X")
+        self.jugador2 = Player("player2", "O")
+
+    def test_posicion_inicial(self):
+        """Verifica el ID conocido de la posición inicial."""
+        board = Board()
+        self.assertEqual(board.get_id(self.jugador1), "4HPwATDgc/ABMA")
+        self.assertEqual(board.get_id(self.jugador2), "4HPwATDgc/ABMA")
+        self.assertEqual(len(empaquetar(board.get_conteos())), BYTES_ID)
+
+    def test_ida_y_vuelta_en_partidas(self):
+        """Verifica que codificar y decodificar recupere cada posición."""
+        generador = random.Random(3)
+        board = Board()
+        for turno in range(200):
+            jugador = self.jugador1 if turno % 2 == 0 else self.jugador2
+            signo = 1 if jugador is self.jugador1 else -1
+            texto = board.get_id(jugador)
+            self.assertEqual(len(texto), 14)
+            self.assertEqual(decodificar_id(texto, signo), board.get_conteos())
+            self.assertEqual(Board.desde_id(texto, jugador).get_conteos(), board.get_conteos())
+            self.assertEqual(desempaquetar(empaquetar(board.get_conteos(), signo), signo),
+                             board.get_conteos())
+            pares = board.jugadas_y_posiciones(
+                jugador, generador.randint(1, 6), generador.randint(1, 6)
+            )
+            if pares:
+                board.set_conteos(generador.choice(pares)[1])
+            if 15 in (board.get_fuera("player1"), board.get_fuera("player2")):
+                board = Board()
+
+    def test_id_relativo_al_turno(self):
+        """Verifica que el ID con O en el turno sea el del reflejo con X."""
+        board = Board()
+        board.mover_ficha(self.jugador1, [(0, 3), (11, 12)], [3, 1])
+        conteos = list(board.get_conteos())
+        conteos[12], conteos[25] = -4, 1
+        board.set_conteos(conteos)
+        reflejo = Board()
+        reflejo.set_conteos(reflejar_conteos(board.get_conteos()))
+        self.assertEqual(board.get_id(self.jugador2), reflejo.get_id(self.jugador1))
+        self.assertNotEqual(board.get_id(self.jugador1), board.get_id(self.jugador2))
+        self.assertEqual(
+            Board.desde_id(board.get_id(self.jugador1)).get_conteos(), board.get_conteos()
+        )
+
+    def test_bar_y_fichas_fuera(self):
+        """Verifica el bar y que las fichas fuera se deduzcan del total."""
+        conteos = [0] * 28
+        conteos[22], conteos[24], conteos[26] = 3, 2, 10
+        conteos[1], conteos[25], conteos[27] = -1, 1, 13
+        self.assertEqual(decodificar_id(codificar_id(conteos)), tuple(conteos))
+
+    def test_ids_invalidos(self):
+        """Verifica que se rechacen los ID mal formados."""
+        for texto in ("4HPwATDgc/ABM", "4HPwATDgc/AB!A", "//////////////", "4HPwATDgc/ABMÁ"):
+            with self.assertRaises(IdPosicionInvalidoError):
+                decodificar_id(texto)
+        with self.assertRaises(IdPosicionInvalidoError):
+            desempaquetar(bytes(9))
+        # 15 fichas de O en su punto 1 y 15 de X en su punto 24, que son la
+        # misma casilla de Board.
+        clave = ((1 << 15) - 1) | (((1 << 15) - 1) << 63)
+        with self.assertRaises(IdPosicionInvalidoError):
+            desempaquetar(clave.to_bytes(BYTES_ID, "little"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Pruebas unitarias para el libro de aperturas.
+"""
+import os
+import tempfile
+import unittest
+from array import array
+import numpy as np
+from core.clases.board import Board
+from core.clases.bot import BotExpectiminimax, TIRADAS
+from core.clases.evaluador import EvaluadorHeuristico
+from core.clases.excepciones import FormatoArchivoInvalidoError
+from core.clases.libro import LibroAperturas, generar_libro
+from core.clases.libro import _mejor_jugada
+from core.clases.player import Player
+from core.clases.rollout import Rollout
+
+
+class _BotFijo:  # pylint: disable=too-few-public-methods
+    """Bot que siempre elige la misma jugada."""
+
+    def __init__(self, jugada):
+        self.jugada = jugada
+
+    def elegir_jugada(self, *_):
+        """Devuelve la jugada fija."""
+        return self.jugada
+
+
+class _RolloutAnotador:  # pylint: disable=too-few-public-methods
+    """Rollout que anota las posiciones y prefiere una."""
+
+    def __init__(self, preferida):
+        self.preferida = preferida
+        self.posiciones = []
+
+    def ejecutar(self, board, *_):
+        """Anota la posición; el rival pierde solo en la preferida."""
+        posicion = array("b", board.get_conteos()).tobytes()
+        self.posiciones.append(posicion)
+        return {"equidad": [-1.0 if posicion == self.preferida else 0.0]}
+
+
+class TestLibroAperturas(unittest.TestCase):
+    """Suite de pruebas para LibroAperturas."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Genera un libro con la evaluación estática, sin rollouts."""
+        cls.directorio = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.ruta = os.path.join(cls.directorio.name, "libro.bin")
+        cls.cantidad = generar_libro(cls.ruta, candidatas=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Borra el archivo generado."""
+        cls.directorio.cleanup()
+
+    def setUp(self):
+        """Crea los jugadores y un libro sin cargar."""
+        self.jugadores = (Player("player1", "X"), Player("player2", "O"))
+        self.libro = LibroAperturas(self.ruta)
+
+    def test_carga_diferida(self):
+        """Verifica que el archivo se lea recién en la primera consulta."""
+        self.assertFalse(self.libro.esta_cargado())
+        self.libro.buscar(Board(), self.jugadores[0], 3, 1)
+        self.assertTrue(self.libro.esta_cargado())
+        self.assertEqual(self.libro.get_cantidad(), self.cantidad)
+
+    def test_cubre_apertura_y_respuesta(self):
+        """Verifica que haya jugada legal para las dos primeras jugadas."""
+        for jugador, rival in (self.jugadores, self.jugadores[::-1]):
+            for dado1, dado2, _ in TIRADAS:
+                board = Board()
+                apertura = self.libro.buscar(board, jugador, dado1, dado2)
+                self.assertIsNotNone(apertura)
+                board.mover_ficha(jugador, apertura, [dado1, dado2] * (1 + (dado1 == dado2)))
+                for respuesta1, respuesta2, _ in TIRADAS:
+                    respuesta = self.libro.buscar(board, rival, respuesta1, respuesta2)
+                    self.assertIsNotNone(respuesta)
+                    legales = {
+                        posicion for _, posicion in
+                        board.jugadas_y_posiciones(rival, respuesta1, respuesta2)
+                    }
+                    copia = Board()
+                    copia.set_conteos(board.get_conteos())
+                    dados = [respuesta1, respuesta2] * (1 + (respuesta1 == respuesta2))
+                    copia.mover_ficha(rival, respuesta, dados)
+                    self.assertIn(array("b", copia.get_conteos()).tobytes(), legales)
+
+    def test_colores_reflejados(self):
+        """Verifica que las aperturas de O sean el reflejo de las de X."""
+        for dado1, dado2, _ in TIRADAS:
+            de_x = self.libro.buscar(Board(), self.jugadores[0], dado1, dado2)
+            de_o = self.libro.buscar(Board(), self.jugadores[1], dado1, dado2)
+            self.assertEqual(de_o, [(23 - desde, 23 - hasta) for desde, hasta in de_x])
+
+    def test_posicion_fuera_del_libro(self):
+        """Verifica que una posición desconocida devuelva None."""
+        board = Board()
+        board.mover_ficha(self.jugadores[0], [(0, 1)], [1])
+        board.mover_ficha(self.jugadores[0], [(0, 1)], [1])
+        self.assertIsNone(self.libro.buscar(board, self.jugadores[1], 6, 5))
+
+    def test_archivo_invalido(self):
+        """Verifica que un archivo con otro formato se rechace al cargarlo."""
+        ruta = os.path.join(self.directorio.name, "otro.bin")
+        with open(ruta, "wb") as archivo:
+            archivo.write(b"XXXX" + bytes(12))
+        libro = LibroAperturas(ruta)
+        with self.assertRaises(FormatoArchivoInvalidoError):
+            libro.buscar(Board(), self.jugadores[0], 3, 1)
+
+    def test_bot_usa_el_libro(self):
+        """Verifica que el bot responda con el libro sin buscar."""
+        bot = BotExpectiminimax(libro=self.libro)
+        jugada = bot.elegir_jugada(Board(), self.jugadores[0], 6, 4)
+        self.assertEqual(jugada, self.libro.buscar(Board(), self.jugadores[0], 6, 4))
+        self.assertEqual(bot.get_nodos(), 0)
+
+    def test_rollout_elige_entre_candidatas(self):
+        """Verifica que con rollouts se elija una de las mejores candidatas."""
+        board = Board()
+        evaluador = EvaluadorHeuristico()
+        pares = board.jugadas_y_posiciones(self.jugadores[0], 4, 2)
+        valores = evaluador.evaluar(
+            [np.frombuffer(posicion, dtype=np.int8) for _, posicion in pares]
+        )
+        mejores = sorted(range(len(pares)), key=lambda i: -valores[i])[:2]
+        jugada, posicion = _mejor_jugada(
+            board, (1, 4, 2),
+            (evaluador, Rollout(cantidad=4, procesos=1, max_turnos=20), None), (2, 0)
+        )
+        self.assertIn((jugada, posicion), [pares[i] for i in mejores])
+
+    def test_libro_por_defecto(self):
+        """Verifica que el libro incluido cubra la apertura."""
+        libro = LibroAperturas()
+        for dado1, dado2, _ in TIRADAS:
+            self.assertIsNotNone(libro.buscar(Board(), self.jugadores[0], dado1, dado2))
+    def test_configuracion_en_la_cabecera(self):
+        """Verifica que el libro anote con qué parámetros se generó."""
+        self.assertEqual(
+            self.libro.get_configuracion(), {"partidas": 0, "candidatas": 1, "semilla": 0}
+        )
+
+    def test_rollout_incluye_la_jugada_del_bot(self):
+        """Verifica que la jugada del bot pase al rollout aunque quede lejos."""
+        board = Board()
+        evaluador = EvaluadorHeuristico()
+        pares = board.jugadas_y_posiciones(self.jugadores[0], 6, 4)
+        valores = evaluador.evaluar(
+            [np.frombuffer(posicion, dtype=np.int8) for _, posicion in pares]
+        )
+        peor = pares[int(np.argmin(valores))]
+        rollout = _RolloutAnotador(peor[1])
+        jugada, posicion = _mejor_jugada(
+            board, (1, 6, 4), (evaluador, rollout, _BotFijo(peor[0])), (2, 0)
+        )
+        self.assertEqual(len(rollout.posiciones), 2)
+        self.assertIn(peor[1], rollout.posiciones)
+        self.assertEqual((jugada, posicion), peor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -49,5 +49,12 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(estado["total"], 20)
         self.assertEqual(estado["nombre"], "player1")
         self.assertEqual(estado["ficha"], "X")
+
+    def test_pips(self):
+        """Verifica la cuenta de pips del jugador."""
+        self.assertEqual(self.player1.pips(self.board), 152 + 2 * 23)
+        self.assertEqual(self.player1.estado_jugador(self.board)["pips"], 198)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,146 @@
+"""
+Pruebas unitarias para el formato binario de registros de partidas.
+"""
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from core.clases.backgammon_game import BackgammonGame
+from core.clases.board import Board
+from core.clases.bot import BotExpectiminimax
+from core.clases.excepciones import RegistroInvalidoError
+from core.clases.player import Player
+from core.clases.registro import EscritorRegistros, codificar_partida, leer_registros
+
+
+def _jugar(semilla, max_turnos=400):
+    """Juega una partida entre dos bots y devuelve el juego."""
+    juego = BackgammonGame("Ana", "Bruno", semilla=semilla)
+    juego.set_bot(1, BotExpectiminimax(profundidad=1))
+    juego.set_bot(2, BotExpectiminimax(profundidad=1))
+    with contextlib.redirect_stdout(io.StringIO()):
+        juego.iniciar_partida()
+        for _ in range(max_turnos):
+            if juego.get_movimientos_restantes() <= 0:
+                juego.lanzar_dados()
+            dado1, dado2 = juego.get_registro()["turnos"][-1][:2]
+            juego.jugar_turno_bot(dado1, dado2)
+            if juego.hay_ganador():
+                break
+    return juego
+
+
+def _reproducir(registro):
+    """Aplica los turnos de un registro sobre un tablero nuevo."""
+    board = Board()
+    jugadores = {"X": Player("player1", "X"), "O": Player("player2", "O")}
+    ficha = registro["empieza"]
+    for dado1, dado2, jugada in registro["turnos"]:
+        if jugada:
+            dados = [dado1, dado2] * (1 + (dado1 == dado2))
+            board.mover_ficha(jugadores[ficha], jugada, dados)
+        ficha = "O" if ficha == "X" else "X"
+    return board
+
+
+class TestRegistro(unittest.TestCase):
+    """Suite de pruebas para EscritorRegistros y leer_registros."""
+
+    def setUp(self):
+        """Crea un directorio temporal para los archivos."""
+        self.directorio = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.ruta = os.path.join(self.directorio.name, "partidas.bgr")
+
+    def tearDown(self):
+        """Borra el directorio temporal."""
+        self.directorio.cleanup()
+
+    def test_ida_y_vuelta_de_una_partida(self):
+        """Verifica que la partida leída reproduzca la posición final."""
+        juego = _jugar(semilla=5)
+        registro = juego.get_registro()
+        with EscritorRegistros(self.ruta) as escritor:
+            escritor.escribir(registro)
+        leidos = list(leer_registros(self.ruta))
+        self.assertEqual(leidos, [registro])
+        self.assertEqual(leidos[0]["semilla"], 5)
+        self.assertEqual(
+            _reproducir(leidos[0]).get_conteos(), juego.get_board().get_conteos()
+        )
+        movimientos = sum(len(jugada) for _, _, jugada in registro["turnos"])
+        self.assertEqual(
+            os.path.getsize(self.ruta),
+            4 + 15 + len("AnaBruno") + len(registro["turnos"]) + movimientos,
+        )
+
+    def test_agrega_y_lee_en_flujo(self):
+        """Verifica que varias sesiones agreguen al final y se lean en orden."""
+        registros = [_jugar(semilla, max_turnos=30).get_registro() for semilla in range(3)]
+        for inicio in (0, 2):
+            with EscritorRegistros(self.ruta, tamano_buffer=64) as escritor:
+                for registro in registros[inicio:inicio + 2]:
+                    escritor.escribir(registro)
+        with open(self.ruta, "rb") as archivo:
+            self.assertEqual(archivo.read().count(b"BGR1"), 1)
+        lector = leer_registros(self.ruta, tamano_bloque=128)
+        self.assertEqual(next(lector), registros[0])
+        self.assertEqual(list(lector), registros[1:])
+
+    def test_turno_pasado_y_nombres(self):
+        """Verifica los turnos pasados sin tirar, O empezando y sin semilla."""
+        registro = {
+            "jugadores": ("Íñigo", "Zoë"),
+            "semilla": None,
+            "empieza": "O",
+            "turnos": [
+                (6, 5, [(23, 17), (17, 12)]),
+                (0, 0, []),
+                (3, 3, [("bar", 20), (20, 17)]),
+                (4, 4, [("bar", 4), (4, 8), (8, 12), (12, 16)]),
+                (6, 1, []),
+            ],
+        }
+        with EscritorRegistros(self.ruta) as escritor:
+            escritor.escribir(registro)
+        self.assertEqual(list(leer_registros(self.ruta)), [registro])
+
+        juego = BackgammonGame("A", "B")
+        with contextlib.redirect_stdout(io.StringIO()):
+            juego.quien_empieza()
+            juego.cambiar_turno()
+        self.assertEqual(juego.get_registro()["turnos"], [(0, 0, [])])
+
+    def test_sacar_fichas(self):
+        """Verifica los movimientos que sacan fichas de los dos colores."""
+        registro = {
+            "jugadores": ("A", "B"),
+            "semilla": 2 ** 64 - 1,
+            "empieza": "X",
+            "turnos": [(6, 1, [(17, "fuera"), (22, "fuera")]), (2, 3, [(2, "fuera")])],
+        }
+        with EscritorRegistros(self.ruta) as escritor:
+            escritor.escribir(registro)
+        self.assertEqual(list(leer_registros(self.ruta)), [registro])
+
+    def test_errores(self):
+        """Verifica los datos que no se pueden escribir ni leer."""
+        base = {"jugadores": ("A", "B"), "semilla": 1, "empieza": "X", "turnos": []}
+        for cambio in ({"semilla": -1}, {"jugadores": ("A" * 256, "B")},
+                       {"turnos": [(7, 1, [])]}, {"turnos": [(3, 1, [(0, 7)])]}):
+            with self.assertRaises(ValueError):
+                codificar_partida({**base, **cambio})
+
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"XXXX")
+        with self.assertRaises(RegistroInvalidoError):
+            list(leer_registros(self.ruta))
+
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"BGR1" + codificar_partida(base)[:-1])
+        with self.assertRaises(RegistroInvalidoError):
+            list(leer_registros(self.ruta))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Pruebas unitarias para los rollouts Monte Carlo.
+"""
+import unittest
+from core.clases.board import Board
+from core.clases.checker import Checker
+from core.clases.player import Player
+from core.clases.rollout import Rollout
+
+
+class TestRollout(unittest.TestCase):
+    """Suite de pruebas para Rollout."""
+
+    def setUp(self):
+        """Crea jugadores de referencia."""
+        self.jugador1 = Player("player1", "X")
+        self.jugador2 = Player("player2", "O")
+
+    def test_tasas_en_rango_y_reproducibles(self):
+        """Verifica que la misma semilla dé el mismo resumen."""
+        rollout = Rollout(cantidad=40, procesos=1)
+        resumen = rollout.ejecutar(Board(), self.jugador1, semilla=3)
+        self.assertEqual(resumen, rollout.ejecutar(Board(), self.jugador1, semilla=3))
+        self.assertEqual(resumen["partidas"], 40)
+        self.assertEqual(resumen["terminadas"] + resumen["sin_terminar"], 40)
+        for clave in ("victorias", "gammons", "backgammons"):
+            valor, error = resumen[clave]
+            self.assertGreaterEqual(valor, 0.0)
+            self.assertLessEqual(valor, 1.0)
+            self.assertGreaterEqual(error, 0.0)
+        self.assertLessEqual(resumen["gammons"][0], resumen["victorias"][0])
+        self.assertEqual(rollout.get_estadisticas()["partidas"], 40)
+
+    def test_no_depende_de_los_procesos(self):
+        """Verifica que repartir en procesos no cambie el resultado."""
+        secuencial = Rollout(cantidad=72, procesos=1, max_turnos=200)
+        paralelo = Rollout(cantidad=72, procesos=2, max_turnos=200)
+        self.assertEqual(
+            secuencial.ejecutar(Board(), self.jugador2, semilla=9),
+            paralelo.ejecutar(Board(), self.jugador2, semilla=9),
+        )
+
+    def test_backgammon_seguro(self):
+        """Verifica una posición que siempre termina en backgammon."""
+        board = Board()
+        board.set_conteos([0] * 28)
+        board.set_posiciones(22, [Checker("X")])
+        board.set_fuera("player1", 14)
+        board.set_posiciones(20, [Checker("O")] * 15)
+        resumen = Rollout(cantidad=10, procesos=1).ejecutar(
+            board, self.jugador1, semilla=1
+        )
+        self.assertEqual(resumen["victorias"], (1.0, 0.0))
+        self.assertEqual(resumen["backgammons"], (1.0, 0.0))
+        self.assertEqual(resumen["equidad"], (3.0, 0.0))
+    def test_partidas_sin_terminar_se_puntuan(self):
+        """Verifica que las partidas cortadas cuenten con la evaluación estática."""
+        resumen = Rollout(cantidad=12, procesos=1, max_turnos=1).ejecutar(
+            Board(), self.jugador1, semilla=4
+        )
+        self.assertEqual(resumen["sin_terminar"], 12)
+        self.assertEqual(resumen["terminadas"], 0)
+        self.assertNotEqual(resumen["equidad"][0], 0.0)
+        self.assertGreater(resumen["equidad"][1], 0.0)
+        self.assertAlmostEqual(resumen["victorias"][0], (resumen["equidad"][0] + 1) / 2)
+        self.assertEqual(resumen["gammons"], (0.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
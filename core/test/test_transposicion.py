@@ -0,0 +1,174 @@
+"""
+Pruebas unitarias para la tabla de transposición.
+"""
+import unittest
+from array import array
+from core.clases.backgammon_game import BackgammonGame
+from core.clases.board import Board, reflejar_conteos, reflejar_jugada
+from core.clases.bot import BotExpectiminimax
+from core.clases.evaluador import EvaluadorHeuristico, EvaluadorRed
+from core.clases.player import Player
+from core.clases.transposicion import TablaTransposicion, candidatas_ordenadas
+
+
+class TestTablaTransposicion(unittest.TestCase):
+    """Suite de pruebas para TablaTransposicion."""
+
+    def test_aciertos_y_fallos(self):
+        """Verifica que se cuenten los aciertos y los fallos."""
+        tabla = TablaTransposicion()
+        self.assertIsNone(tabla.obtener(1))
+        tabla.guardar(1, [1.0])
+        self.assertEqual(tabla.obtener(1), [1.0])
+        estadisticas = tabla.get_estadisticas()
+        self.assertEqual(estadisticas["aciertos"], 1)
+        self.assertEqual(estadisticas["fallos"], 1)
+        self.assertEqual(estadisticas["entradas"], 1)
+        self.assertGreater(estadisticas["bytes"], 0)
+
+    def test_desaloja_la_menos_usada(self):
+        """Verifica el desalojo LRU al pasar el tope de memoria."""
+        tabla = TablaTransposicion(memoria_maxima=1)
+        tabla.guardar(0, 0.0)
+        self.assertEqual(tabla.get_estadisticas()["desalojos"], 1)
+
+        tabla = TablaTransposicion()
+        tabla.guardar(0, 0.0)
+        por_entrada = tabla.get_estadisticas()["bytes"]
+        tabla = TablaTransposicion(memoria_maxima=3 * por_entrada)
+        for clave in range(3):
+            tabla.guardar(clave, float(clave))
+        tabla.obtener(0)
+        tabla.guardar(3, 3.0)
+        self.assertIsNone(tabla.obtener(1))
+        self.assertEqual(tabla.obtener(0), 0.0)
+        self.assertEqual(tabla.obtener(3), 3.0)
+        estadisticas = tabla.get_estadisticas()
+        self.assertEqual(estadisticas["desalojos"], 1)
+        self.assertLessEqual(estadisticas["bytes"], estadisticas["memoria_maxima"])
+
+    def test_reemplazar_y_limpiar(self):
+        """Verifica que reemplazar no duplique bytes y que limpiar vacíe."""
+        tabla = TablaTransposicion()
+        tabla.guardar(5, 1.0)
+        bytes_antes = tabla.get_estadisticas()["bytes"]
+        tabla.guardar(5, 2.0)
+        self.assertEqual(tabla.get_estadisticas()["bytes"], bytes_antes)
+        self.assertEqual(tabla.obtener(5), 2.0)
+        tabla.limpiar()
+        self.assertEqual(tabla.get_estadisticas()["entradas"], 0)
+        self.assertEqual(tabla.get_estadisticas()["bytes"], 0)
+
+    def test_memoria_invalida(self):
+        """Verifica que el tope de memoria tenga que ser positivo."""
+        with self.assertRaises(ValueError):
+            TablaTransposicion(memoria_maxima=0)
+
+    def test_candidatas_con_tabla(self):
+        """Verifica que el orden de los dados comparta la entrada."""
+        tabla = TablaTransposicion()
+        evaluador = EvaluadorHeuristico()
+        board = Board()
+        sin_tabla, evaluadas = candidatas_ordenadas(board, (1, 5, 2), evaluador)
+        self.assertGreater(evaluadas, 0)
+        primera, _ = candidatas_ordenadas(board, (1, 5, 2), evaluador, tabla)
+        segunda, evaluadas = candidatas_ordenadas(board, (1, 2, 5), evaluador, tabla)
+        self.assertEqual(primera, sin_tabla)
+        self.assertEqual(segunda, primera)
+        self.assertEqual(evaluadas, 0)
+        self.assertEqual(tabla.get_estadisticas()["aciertos"], 1)
+
+    def test_tabla_compartida_entre_evaluadores(self):
+        """Verifica que cada evaluador lea solo los valores que calculó."""
+        tabla = TablaTransposicion()
+        lento, rapido = EvaluadorHeuristico(), EvaluadorHeuristico(escala=5.0)
+        board = Board()
+        de_lento, _ = candidatas_ordenadas(board, (1, 5, 2), lento, tabla)
+        de_rapido, evaluadas = candidatas_ordenadas(board, (1, 5, 2), rapido, tabla)
+        self.assertGreater(evaluadas, 0)
+        self.assertEqual(de_rapido, candidatas_ordenadas(board, (1, 5, 2), rapido)[0])
+        self.assertNotEqual(de_rapido, de_lento)
+        self.assertEqual(tabla.get_identidad(lento), 0)
+        self.assertEqual(tabla.get_identidad(rapido), 1)
+        self.assertEqual(tabla.get_estadisticas()["entradas"], 2)
+        tabla.limpiar()
+        self.assertEqual(tabla.get_identidad(rapido), 0)
+
+    def test_bot_con_tabla(self):
+        """Verifica que el bot elija lo mismo y evalúe menos con la tabla."""
+        jugador = Player("player1", "X")
+        sin_tabla = BotExpectiminimax(profundidad=2)
+        esperada = sin_tabla.elegir_jugada(Board(), jugador, 4, 3)
+        con_tabla = BotExpectiminimax(profundidad=2)
+        con_tabla.set_tabla(TablaTransposicion())
+        self.assertEqual(con_tabla.elegir_jugada(Board(), jugador, 4, 3), esperada)
+        self.assertEqual(con_tabla.elegir_jugada(Board(), jugador, 4, 3), esperada)
+        self.assertEqual(con_tabla.get_nodos(), 0)
+
+    def test_sugerencias_con_tabla(self):
+        """Verifica que las sugerencias repetidas salgan de la tabla."""
+        juego = BackgammonGame("player1", "player2")
+        juego.__turno__ = 1
+        esperadas = juego.sugerir_jugadas(6, 1)
+        tabla = TablaTransposicion()
+        juego.set_tabla(tabla)
+        self.assertEqual(juego.sugerir_jugadas(6, 1), esperadas)
+        self.assertEqual(juego.sugerir_jugadas(1, 6), esperadas)
+        self.assertEqual(tabla.get_estadisticas()["aciertos"], 1)
+        juego.set_evaluador(EvaluadorHeuristico(escala=10.0))
+        self.assertEqual(tabla.get_estadisticas()["entradas"], 0)
+
+    def test_candidatas_reflejadas(self):
+        """Verifica que el reflejo con O en el turno use la misma entrada."""
+        tabla = TablaTransposicion()
+        evaluador = EvaluadorHeuristico()
+        board = Board()
+        board.mover_ficha(Player("player1", "X"), [(0, 4), (11, 13)], [4, 2])
+        reflejo = Board()
+        reflejo.set_conteos(reflejar_conteos(board.get_conteos()))
+        de_x, _ = candidatas_ordenadas(board, (1, 6, 3), evaluador, tabla)
+        de_o, evaluadas = candidatas_ordenadas(reflejo, (-1, 6, 3), evaluador, tabla)
+        esperadas, _ = candidatas_ordenadas(reflejo, (-1, 6, 3), evaluador)
+        self.assertEqual(evaluadas, 0)
+        self.assertEqual(tabla.get_estadisticas()["entradas"], 1)
+        self.assertEqual(de_o, [(valor, reflejar_jugada(j)) for valor, j in de_x])
+        for (valor, _), (esperado, _) in zip(de_o, esperadas):
+            self.assertAlmostEqual(valor, esperado)
+        # Con empates el orden puede variar; las jugadas llevan a las mismas
+        # posiciones.
+        finales = set()
+        for _, jugada in de_o:
+            copia = Board()
+            copia.set_conteos(reflejo.get_conteos())
+            for movimiento in jugada:
+                copia.aplicar(movimiento, Player("player2", "O"))
+            finales.add(copia.get_conteos())
+        self.assertEqual(len(finales), len(esperadas))
+        self.assertEqual(finales, {
+            tuple(array("b", posicion)) for _, posicion in
+            reflejo.jugadas_y_posiciones(Player("player2", "O"), 6, 3)
+        })
+
+    def test_sugerencias_de_o_con_red(self):
+        """Verifica que con una red las sugerencias de O no usen las de X."""
+        board = Board()
+        board.mover_ficha(Player("player1", "X"), [(0, 4), (11, 13)], [4, 2])
+        juego = BackgammonGame("player1", "player2")
+        juego.__turno__ = 2
+        juego.set_evaluador(EvaluadorRed(semilla=3))
+        juego.__board__.set_conteos(reflejar_conteos(board.get_conteos()))
+        esperadas = juego.sugerir_jugadas(6, 3)
+
+        tabla = TablaTransposicion()
+        juego.set_tabla(tabla)
+        juego.__turno__ = 1
+        juego.__board__.set_conteos(board.get_conteos())
+        juego.sugerir_jugadas(6, 3)
+        juego.__turno__ = 2
+        juego.__board__.set_conteos(reflejar_conteos(board.get_conteos()))
+        self.assertEqual(juego.sugerir_jugadas(6, 3), esperadas)
+        self.assertEqual(tabla.get_estadisticas()["entradas"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
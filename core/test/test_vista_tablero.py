@@ -0,0 +1,53 @@
+"""
+Pruebas unitarias para las vistas de solo lectura del tablero.
+"""
+import unittest
+from array import array
+from core.clases.checker import Checker
+from core.clases.vista_tablero import VistaTablero
+
+
+class TestVistaTablero(unittest.TestCase):
+    """Suite de pruebas para VistaTablero y sus vistas auxiliares."""
+
+    def setUp(self):
+        """Crea una vista sobre un arreglo de conteos propio."""
+        self.conteos = array('b', bytes(28))
+        self.conteos[2] = -3
+        self.conteos[20] = 2
+        self.conteos[24] = 1
+        indices = {
+            "bar": {"player1": 24, "player2": 25},
+            "fuera": {"player1": 26, "player2": 27},
+        }
+        fichas = {1: Checker("X"), -1: Checker("O")}
+        self.vista = VistaTablero(
+            memoryview(self.conteos).toreadonly(), indices, fichas
+        )
+
+    def test_claves(self):
+        """Verifica que la vista tenga las mismas claves que get_tablero."""
+        self.assertEqual(list(self.vista), ["posiciones", "bar", "fuera"])
+        self.assertEqual(len(self.vista), 3)
+
+    def test_posiciones(self):
+        """Verifica las pilas, los índices negativos y los cortes."""
+        posiciones = self.vista["posiciones"]
+        self.assertEqual(len(posiciones), 24)
+        self.assertEqual([c.get_simbolo() for c in posiciones[2]], ["O"] * 3)
+        self.assertEqual(posiciones[-4], posiciones[20])
+        self.assertEqual(len(posiciones[19:21]), 2)
+        with self.assertRaises(IndexError):
+            _ = posiciones[24]
+
+    def test_contadores_en_vivo(self):
+        """Verifica que bar y fuera lean el arreglo compartido."""
+        en_bar = self.vista["bar"]
+        self.assertEqual(en_bar["player1"], 1)
+        self.conteos[24] = 0
+        self.assertEqual(en_bar["player1"], 0)
+        self.assertEqual(len(self.vista["fuera"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,7 +34,8 @@ class BackgammonCLI:
         print("3. Lanzar dados")
         print("4. Mover fichas")
         print("5. Pasar turno")
-        print("6. Volver al menú principal")
+        print("6. Sugerir jugadas")
+        print("7. Volver al menú principal")
         print("-"*60)
 
     def iniciar_nueva_partida(self):  # pragma: no cover
@@ -47,11 +48,21 @@ class BackgammonCLI:
         if not nombre1:
             nombre1 = "player1"
 
-        nombre2 = input("Nombre del Jugador 2 (fichas O): ").strip()
-        if not nombre2:
-            nombre2 = "player2"
+        contra_bot = input(
+            "¿Jugar contra la computadora? (s/n): "
+        ).strip().lower() == "s"
+
+        if contra_bot:
+            nombre2 = "computadora"
+        else:
+            nombre2 = input("Nombre del Jugador 2 (fichas O): ").strip()
+            if not nombre2:
+                nombre2 = "player2"
 
         self.juego = BackgammonGame(nombre1, nombre2)
+        self.juego.activar_tabla()
+        if contra_bot:
+            self.juego.agregar_computadora(2)
 
         print("\nDeterminando quién comienza...")
         _, dado1, dado2 = self.juego.quien_empieza()
@@ -310,6 +321,53 @@ class BackgammonCLI:
             d1, d2 = self.dados_actuales
             print(f"\nDados: {d1} y {d2}")
 
+    def sugerir_jugadas(self):  # pragma: no cover
+        """Muestra las mejores jugadas para los dados lanzados."""
+        if not self.juego:
+            print("No hay partida en curso.")
+            return
+
+        if not self.dados_lanzados:
+            print("Debe lanzar los dados primero.")
+            return
+
+        d1, d2 = self.dados_actuales
+        sugerencias = self.juego.sugerir_jugadas(d1, d2)
+        if not sugerencias:
+            print("No hay movimientos posibles con estos dados.")
+            return
+
+        print("\nJugadas sugeridas:")
+        for i, sugerencia in enumerate(sugerencias, start=1):
+            texto = ", ".join(
+                f"{desde}-{hasta}" for desde, hasta in sugerencia["jugada"]
+            )
+            print(f"{i}. {texto:<30} equidad {sugerencia['equidad']:+.3f} "
+                  f"({sugerencia['diferencia']:+.3f})")
+
+    def turno_computadora(self):  # pragma: no cover
+        """Hace jugar a la computadora su turno completo."""
+        if not self.dados_lanzados:
+            dado1, dado2, _ = self.juego.lanzar_dados()
+            self.dados_actuales = (dado1, dado2)
+        jugador = self.juego.get_jugador_actual()
+        d1, d2 = self.dados_actuales
+        print(f"\n{jugador.get_nombre()} lanzó los dados: {d1} y {d2}")
+
+        jugada = self.juego.jugar_turno_bot(d1, d2)
+        if jugada:
+            texto = ", ".join(f"{desde}-{hasta}" for desde, hasta in jugada)
+            print(f"{jugador.get_nombre()} jugó: {texto}")
+        else:
+            print(f"{jugador.get_nombre()} no tiene movimientos y pasa.")
+        self.dados_actuales = None
+        self.dados_lanzados = False
+
+        if self.juego.hay_ganador():
+            self.juego.mostrar_tablero()
+            print("\nPARTIDA TERMINADA")
+            self.juego = None
+
     def pasar_turno(self):  # pragma: no cover
         """Pasa el turno al siguiente jugador."""
         if not self.juego:
@@ -342,6 +400,9 @@ class BackgammonCLI:
                 else:
                     print("Opción inválida.")
 
+            elif self.juego.es_turno_bot():
+                self.turno_computadora()
+
             else:
                 self.mostrar_menu_juego()
                 opcion = input("Seleccione una opción: ").strip()
@@ -357,6 +418,8 @@ class BackgammonCLI:
                 elif opcion == "5":
                     self.pasar_turno()
                 elif opcion == "6":
+                    self.sugerir_jugadas()
+                elif opcion == "7":
                     print("\nVolviendo al menú principal...")
                     self.juego = None
                     self.dados_actuales = None